@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analyse-Cache für Ez Chajim
+===========================
+
+Inkrementelle Re-Analyse über ein Inhalts-Manifest: für jeden Chunk wird
+der sha256 seines Textes (UTF-8 ohne BOM, für Pack und Verzeichnis gleich)
+zusammen mit dem Regelwerk-Stempel des Prozessors gespeichert. Nur neue
+oder geänderte Chunks werden neu analysiert, der Rest kommt aus dem Cache.
+
+Ablage (unter .cache/analysis/):
+    manifest.json   Stempel + chunk_id → sha256
+    results.jsonl   eine Zeile pro Chunk: id, sha256, Chunk-Dict
+
+Stand: 5. Cheschwan 5787
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from corpus_pack import CACHE_DIR
+
+DEFAULT_CACHE_DIR = CACHE_DIR / 'analysis'
+
+
+def content_hash(data: bytes) -> str:
+    """sha256 eines Chunk-Inhalts"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class AnalysisCache:
+    """Chunk-Ergebnisse, gültig für genau einen Regelwerk-Stempel"""
+
+    def __init__(self, stamp: str, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR):
+        self.stamp = stamp
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / 'manifest.json'
+        self.results_path = self.cache_dir / 'results.jsonl'
+
+        self._entries: Dict[int, Dict] = {}
+        self._digests: Dict[int, str] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        """Lädt Manifest und Ergebnisse, verwirft alles bei fremdem Stempel"""
+        if not self.manifest_path.exists() or not self.results_path.exists():
+            return
+
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('stamp') != self.stamp:
+            self._dirty = True
+            return
+
+        self._digests = {int(k): v for k, v in manifest.get('chunks', {}).items()}
+        with open(self.results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                chunk_id = entry['id']
+                if self._digests.get(chunk_id) == entry['sha256']:
+                    self._entries[chunk_id] = entry['chunk']
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, chunk_id: int, digest: str) -> Optional[Dict]:
+        """Gibt das gecachte Ergebnis zurück, falls der Hash passt"""
+        if self._digests.get(chunk_id) == digest and chunk_id in self._entries:
+            self.hits += 1
+            return self._entries[chunk_id]
+        self.misses += 1
+        return None
+
+    def put(self, chunk_id: int, digest: str, chunk: Dict) -> None:
+        """Speichert ein neu berechnetes Ergebnis"""
+        self._digests[chunk_id] = digest
+        self._entries[chunk_id] = chunk
+        self._dirty = True
+
+    def retain(self, chunk_ids) -> None:
+        """Entfernt Einträge für Chunks, die es nicht mehr gibt"""
+        keep = set(chunk_ids)
+        for chunk_id in list(self._digests):
+            if chunk_id not in keep:
+                self._digests.pop(chunk_id, None)
+                self._entries.pop(chunk_id, None)
+                self._dirty = True
+
+    def save(self) -> bool:
+        """Schreibt Manifest und Ergebnisse atomar (nur bei Änderungen)"""
+        if not self._dirty:
+            return False
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        results_tmp = self.results_path.with_name(self.results_path.name + '.tmp')
+        with open(results_tmp, 'w', encoding='utf-8') as f:
+            for chunk_id in sorted(self._entries):
+                f.write(json.dumps({
+                    'id': chunk_id,
+                    'sha256': self._digests[chunk_id],
+                    'chunk': self._entries[chunk_id]
+                }, ensure_ascii=False))
+                f.write('\n')
+
+        manifest_tmp = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(manifest_tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'stamp': self.stamp,
+                'chunks': {str(k): self._digests[k] for k in sorted(self._entries)}
+            }, f, indent=1)
+
+        # Ergebnisse zuerst, Manifest zuletzt: ein Abbruch lässt nie
+        # ein Manifest auf fehlende Ergebnisse zeigen
+        os.replace(results_tmp, self.results_path)
+        os.replace(manifest_tmp, self.manifest_path)
+        self._dirty = False
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        return {'cached': len(self._entries), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token-Budget Batch-Packer für Ez Chajim
+=======================================
+
+Packt Chunks für die Claude-Übersetzung nach geschätzten Tokens statt
+nach fester Anzahl (bisher 10 Chunks pro Batch, egal wie groß).
+
+    • TokenEstimator   lineare Schätzung aus hebräischen Buchstaben,
+                       sonstigen Zeichen und Wörtern, kalibrierbar
+                       gegen gemessene Token-Zahlen (calibrate)
+    • split_text       zerlegt zu große Chunks an Satzgrenzen
+                       (. : ! ? und Zeilenumbruch), notfalls an Wortgrenzen
+    • pack             füllt Batches in Original-Reihenfolge bis zum Budget
+                       (Anweisung + Chunk-Rahmen eingerechnet)
+
+Teile eines zerlegten Chunks bekommen stabile Unter-IDs (CHUNK_0042.01,
+CHUNK_0042.02, …): sie hängen nur vom Text und vom Budget ab, die Teile
+ergeben aneinandergehängt wieder exakt den Chunk-Text.
+
+Stand: 5. Cheschwan 5787
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_TOKEN_BUDGET = 8000
+
+# Rahmen eines Chunks in der Batch-Datei (ohne Text), für den Overhead
+CHUNK_FRAME = (
+    "## CHUNK 0000\n### Hebräischer Original-Text:\n```hebrew\n\n```\n\n"
+    "### Deutsche Übersetzung (WWAQ-konform):\n[HIER ÜBERSETZT CLAUDE]\n\n---\n\n"
+)
+
+HEBREW_RUN = re.compile(r'[א-ת]+')
+# Satzende: . : ! ? mit folgendem Whitespace, oder Zeilenumbruch
+SENTENCE_BREAK = re.compile(r'(?<=[.:!?])\s+|\n\s*')
+WORD = re.compile(r'\S+\s*')
+
+
+@dataclass(frozen=True)
+class TokenEstimator:
+    """
+    Token-Schätzung: hebrew × Buchstaben + other × sonstige Zeichen + word × Wörter
+
+    Die Vorgaben sind bewusst eher hoch (Hebräisch zerfällt in viele
+    Tokens); mit calibrate aus gemessenen Werten neu bestimmen.
+    """
+    hebrew: float = 0.7
+    other: float = 0.3
+    word: float = 0.2
+
+    @staticmethod
+    def features(text: str) -> Tuple[int, int, int]:
+        """(hebräische Buchstaben, sonstige Nicht-Leerzeichen, Wörter)"""
+        rest = HEBREW_RUN.sub('', text)
+        words = text.split()
+        hebrew = len(text) - len(rest)
+        other = sum(map(len, words)) - hebrew
+        return hebrew, other, len(words)
+
+    def estimate(self, text: str) -> int:
+        """Geschätzte Token-Zahl (aufgerundet)"""
+        hebrew, other, words = self.features(text)
+        return math.ceil(self.hebrew * hebrew + self.other * other + self.word * words)
+
+    @classmethod
+    def calibrate(cls, samples: Iterable[Tuple[str, int]]) -> 'TokenEstimator':
+        """
+        Bestimmt die Faktoren per kleinster Quadrate aus (Text, gemessene Tokens)
+
+        Beispiel: usage.input_tokens einzelner Chunks aus der API.
+        """
+        import numpy as np
+
+        samples = list(samples)
+        if len(samples) < 3:
+            raise ValueError("Kalibrierung braucht mindestens 3 Messwerte")
+        features = np.array([cls.features(text) for text, _ in samples], dtype=float)
+        tokens = np.array([count for _, count in samples], dtype=float)
+        coefficients, *_ = np.linalg.lstsq(features, tokens, rcond=None)
+        hebrew, other, word = (max(0.0, float(c)) for c in coefficients)
+        return cls(hebrew, other, word)
+
+
+@dataclass
+class PackedPiece:
+    """Ein Chunk oder Chunk-Teil in einem Batch"""
+    id: str
+    chunk_id: str
+    text: str
+    tokens: int
+    part: int = 1
+    parts: int = 1
+
+
+@dataclass
+class PackResult:
+    """Gepackte Batches plus Kennzahlen"""
+    batches: List[List[PackedPiece]]
+    budget: int
+    instruction_tokens: int
+    chunk_overhead: int
+    split_chunks: List[str] = field(default_factory=list)
+
+    def batch_tokens(self, batch: List[PackedPiece]) -> int:
+        """Geschätzte Tokens eines Batches inkl. Anweisung und Rahmen"""
+        return self.instruction_tokens + sum(piece.tokens + self.chunk_overhead for piece in batch)
+
+    def report(self) -> Dict:
+        """Batch-Anzahl, Füllgrad (gesamt, min, max) und zerlegte Chunks"""
+        if not self.batches:
+            return {'batches': 0, 'pieces': 0, 'split_chunks': 0, 'tokens': 0,
+                    'budget': self.budget, 'fill_efficiency': 0.0,
+                    'min_fill': 0.0, 'max_fill': 0.0}
+        fills = [self.batch_tokens(batch) / self.budget for batch in self.batches]
+        tokens = sum(self.batch_tokens(batch) for batch in self.batches)
+        return {
+            'batches': len(self.batches),
+            'pieces': sum(len(batch) for batch in self.batches),
+            'split_chunks': len(self.split_chunks),
+            'tokens': tokens,
+            'budget': self.budget,
+            'fill_efficiency': round(tokens / (self.budget * len(self.batches)), 4),
+            'min_fill': round(min(fills), 4),
+            'max_fill': round(max(fills), 4)
+        }
+
+
+# Hilfsfunktionen
+
+def _segments(text: str, pattern: re.Pattern) -> List[str]:
+    """Zerlegt text hinter jedem Treffer (Trenner bleiben am Segment)"""
+    segments = []
+    pos = 0
+    for match in pattern.finditer(text):
+        if match.end() > pos:
+            segments.append(text[pos:match.end()])
+            pos = match.end()
+    if pos < len(text):
+        segments.append(text[pos:])
+    return segments
+
+
+def _greedy(segments: List[str], max_tokens: int, estimator: TokenEstimator) -> List[str]:
+    """Fasst Segmente der Reihe nach zusammen, solange max_tokens reicht"""
+    parts: List[str] = []
+    current = ''
+    for segment in segments:
+        candidate = current + segment
+        if current and estimator.estimate(candidate) > max_tokens:
+            parts.append(current)
+            current = segment
+        else:
+            current = candidate
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_text(text: str, max_tokens: int,
+               estimator: Optional[TokenEstimator] = None) -> List[str]:
+    """
+    Zerlegt einen Text in Teile mit höchstens max_tokens
+
+    Bevorzugt Satzgrenzen, dann Wortgrenzen, zuletzt harte Zeichengrenzen.
+    ''.join(Ergebnis) == text.
+    """
+    if max_tokens < 1:
+        raise ValueError("max_tokens muss mindestens 1 sein")
+    estimator = estimator or TokenEstimator()
+    if estimator.estimate(text) <= max_tokens:
+        return [text]
+
+    parts = []
+    for sentence in _greedy(_segments(text, SENTENCE_BREAK), max_tokens, estimator):
+        if estimator.estimate(sentence) <= max_tokens:
+            parts.append(sentence)
+            continue
+        for words in _greedy(_segments(sentence, WORD), max_tokens, estimator):
+            # Einzelnes Wort über dem Budget: nach Zeichen teilen
+            while estimator.estimate(words) > max_tokens and len(words) > 1:
+                cut = max(1, int(len(words) * max_tokens / estimator.estimate(words)))
+                parts.append(words[:cut])
+                words = words[cut:]
+            parts.append(words)
+    return _greedy(parts, max_tokens, estimator)
+
+
+def pack(items: Iterable[Tuple[str, str]], budget: int = DEFAULT_TOKEN_BUDGET,
+         instruction: str = '', estimator: Optional[TokenEstimator] = None) -> PackResult:
+    """
+    Packt (chunk_id, text) in Original-Reihenfolge in Batches bis zum Budget
+
+    Args:
+        items: (chunk_id, text) Paare
+        budget: Token-Budget pro Batch (inkl. Anweisung und Chunk-Rahmen)
+        instruction: Anweisungstext, der jedem Batch vorangestellt wird
+        estimator: Token-Schätzer (None = Standard-Faktoren)
+
+    Returns:
+        PackResult mit Batches und report()
+    """
+    estimator = estimator or TokenEstimator()
+    instruction_tokens = estimator.estimate(instruction) if instruction else 0
+    chunk_overhead = estimator.estimate(CHUNK_FRAME)
+    capacity = budget - instruction_tokens
+    max_piece = capacity - chunk_overhead
+    if max_piece < 1:
+        raise ValueError(f"Token-Budget {budget} reicht nicht für Anweisung und Chunk-Rahmen")
+
+    result = PackResult([], budget, instruction_tokens, chunk_overhead)
+    batch: List[PackedPiece] = []
+    used = 0
+    for chunk_id, text in items:
+        texts = split_text(text, max_piece, estimator)
+        if len(texts) > 1:
+            result.split_chunks.append(chunk_id)
+
+        for part, piece_text in enumerate(texts, 1):
+            piece_id = f"{chunk_id}.{part:02d}" if len(texts) > 1 else chunk_id
+            piece = PackedPiece(piece_id, chunk_id, piece_text, estimator.estimate(piece_text),
+                                part, len(texts))
+            cost = piece.tokens + chunk_overhead
+            if batch and used + cost > capacity:
+                result.batches.append(batch)
+                batch, used = [], 0
+            batch.append(piece)
+            used += cost
+
+    if batch:
+        result.batches.append(batch)
+    return result
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+
+    from corpus_pack import open_corpus
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Batch-Packer (Token-Budget)")
+    parser.add_argument('--source', default=None, help="Corpus Pack oder Chunk-Verzeichnis")
+    parser.add_argument('--budget', type=int, default=DEFAULT_TOKEN_BUDGET, help="Tokens pro Batch")
+    parser.add_argument('--fixed', type=int, default=10, help="Vergleich: feste Chunk-Anzahl")
+    args = parser.parse_args()
+
+    corpus = open_corpus(args.source)
+    items = [(f"CHUNK_{chunk_id:04d}", text) for chunk_id, text in corpus]
+    result = pack(items, args.budget)
+    report = result.report()
+
+    print(f"Budget: {args.budget} Tokens pro Batch")
+    print(f"  Batches: {report['batches']} ({report['pieces']} Teile, "
+          f"{report['split_chunks']} Chunks zerlegt)")
+    print(f"  Füllgrad: {report['fill_efficiency']:.1%} "
+          f"(min {report['min_fill']:.1%}, max {report['max_fill']:.1%})")
+
+    estimator = TokenEstimator()
+    fixed = [sum(estimator.estimate(text) for _, text in items[i:i + args.fixed])
+             for i in range(0, len(items), args.fixed)]
+    print(f"Feste {args.fixed} Chunks: {len(fixed)} Batches, "
+          f"{min(fixed)}–{max(fixed)} Tokens Text pro Batch")
+
+    print("\nQ!")
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fortsetzbarer Batch-Writer für Ez Chajim
+========================================
+
+Schreibt Übersetzungs-Batches einzeln auf die Platte, sobald sie erzeugt
+werden, statt alle erst als Strings im Speicher aufzubauen.
+
+    • atomar: jede Datei wird als .tmp geschrieben, per fsync gesichert
+      und dann per os.replace umbenannt
+    • Journal (.journal.jsonl): eine Zeile pro fertigem Batch, erst nach
+      dem Umbenennen angehängt; ein Neustart überspringt diese Batches
+    • Anweisung: einmal als instruction.md, die Batches verweisen darauf
+
+Die erste Journal-Zeile hält einen Stempel aus Format, Anweisung und
+Batch-Parametern (Chunks pro Batch oder Token-Budget). Passt er nicht zum
+aktuellen Lauf, wird nicht fortgesetzt (ValueError), außer mit
+restart=True. Zusätzlich muss ein übersprungener Batch dieselben Chunks
+enthalten wie laut Journal, sonst ebenfalls ValueError.
+
+Formate:
+    txt   wie processing/translation/claude-batches (## CHUNK n …)
+    yaml  wie YAMLEzChajimFormatter.generate_batch_yaml
+
+Stand: 5. Cheschwan 5787
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from translation_store import PLACEHOLDER
+
+INSTRUCTION_FILE = 'instruction.md'
+JOURNAL_FILE = '.journal.jsonl'
+FORMATS = ('txt', 'yaml')
+
+
+# Hilfsfunktionen
+
+def _atomic_write(path: Path, write) -> None:
+    """Schreibt über write(stream) in path.tmp, fsync, dann os.replace"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _header_id(chunk_id: str) -> str:
+    """CHUNK_0042 → 42, CHUNK_0042.01 → 42.01 (wie in den Batch-Dateien)"""
+    if chunk_id.startswith('CHUNK_'):
+        number, _, part = chunk_id[6:].partition('.')
+        return f"{int(number)}.{part}" if part else str(int(number))
+    return chunk_id
+
+
+def write_batch_text(batch: Dict, stream, total: Optional[int] = None) -> None:
+    """Ein Batch im Text-Format der Claude-Batches"""
+    number = int(batch['batch_id'].rpartition('_')[2])
+    stream.write(f"# BATCH {number}" + (f" von {total}" if total else "") + "\n")
+    stream.write(f"# Anweisung: {batch.get('instruction_ref', INSTRUCTION_FILE)}\n\n")
+    for chunk in batch['chunks']:
+        stream.write(f"## CHUNK {_header_id(chunk['id'])}\n")
+        stream.write("### Hebräischer Original-Text:\n```hebrew\n")
+        # Text unverändert (auch Zeilenumbrüche am Ende): translation_store
+        # liest genau ihn zurück, Teile ergeben wieder den ganzen Chunk
+        stream.write(chunk['text'])
+        stream.write("\n```\n\n### Deutsche Übersetzung (WWAQ-konform):\n")
+        stream.write(f"{PLACEHOLDER}\n\n---\n\n")
+
+
+class BatchWriter:
+    """Schreibt Batches atomar und merkt sich fertige Batches im Journal"""
+
+    def __init__(self, output_dir: Union[str, Path], instruction: str,
+                 fmt: str = 'txt', restart: bool = False,
+                 params: Optional[Dict] = None):
+        """
+        Args:
+            output_dir: Zielverzeichnis
+            instruction: gemeinsame Anweisung (einmal als instruction.md)
+            fmt: 'txt' oder 'yaml'
+            restart: Journal verwerfen und von vorn beginnen
+            params: Batch-Parameter für den Stempel (z.B. batch_size, token_budget)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unbekanntes Batch-Format: {fmt}")
+        self.output_dir = Path(output_dir)
+        self.instruction = instruction
+        self.fmt = fmt
+        self.journal_path = self.output_dir / JOURNAL_FILE
+        self.params = dict(params or {})
+        stamp_source = f"{fmt}\n{json.dumps(self.params, sort_keys=True)}\n{instruction}"
+        self.stamp = hashlib.sha256(stamp_source.encode('utf-8')).hexdigest()
+        self.completed: Set[str] = set()
+        # Batch-ID → Chunk-IDs laut Journal
+        self.journaled: Dict[str, List[str]] = {}
+        self._formatter = None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Reste eines abgebrochenen Laufs
+        for tmp_path in self.output_dir.glob('*.tmp'):
+            tmp_path.unlink()
+
+        if restart and self.journal_path.exists():
+            self.journal_path.unlink()
+        self._load_journal()
+        self._write_instruction()
+
+    def _load_journal(self) -> None:
+        """Liest fertige Batch-IDs; eine halb geschriebene letzte Zeile zählt nicht"""
+        if not self.journal_path.exists():
+            with open(self.journal_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'stamp': self.stamp}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            return
+
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if not content.endswith('\n'):
+            # Abbruch mitten im Anhängen: unvollständige Zeile abschneiden
+            content = content[:content.rfind('\n') + 1]
+            _atomic_write(self.journal_path, lambda f: f.write(content))
+        lines = content.split('\n')
+        try:
+            header = json.loads(lines[0])
+        except (json.JSONDecodeError, IndexError):
+            header = {}
+        if header.get('stamp') != self.stamp:
+            raise ValueError(f"Journal in {self.output_dir} gehört zu einem anderen Lauf "
+                             "(Format, Anweisung oder Batch-Parameter geändert), "
+                             "restart=True zum Neubeginn")
+
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self.completed.add(entry['batch_id'])
+            self.journaled[entry['batch_id']] = entry.get('chunks', [])
+
+    def _write_instruction(self) -> None:
+        path = self.output_dir / INSTRUCTION_FILE
+        if path.exists() and path.read_text(encoding='utf-8') == self.instruction:
+            return
+        _atomic_write(path, lambda f: f.write(self.instruction))
+
+    def path_for(self, batch_id: str) -> Path:
+        """BATCH_007 → batch_007.txt (bzw. .yaml)"""
+        return self.output_dir / f"{batch_id.lower()}.{self.fmt}"
+
+    def write(self, batch: Dict, total: Optional[int] = None) -> Optional[Path]:
+        """
+        Schreibt einen Batch (None, wenn er laut Journal schon fertig ist)
+
+        Die Anweisung des Batches wird nicht mitgeschrieben, nur der Verweis.
+        Ein fertiger Batch mit anderen Chunks als im Journal ist ein Fehler
+        (ValueError): die Aufteilung hat sich seit dem ersten Lauf geändert.
+        """
+        batch_id = batch['batch_id']
+        chunk_ids = [chunk['id'] for chunk in batch['chunks']]
+        if batch_id in self.completed:
+            if batch_id in self.journaled and self.journaled[batch_id] != chunk_ids:
+                raise ValueError(f"{batch_id} enthält andere Chunks als im Journal "
+                                 f"({self.output_dir}), restart=True zum Neubeginn")
+            return None
+
+        batch = {key: value for key, value in batch.items() if key != 'instruction'}
+        batch['instruction_ref'] = INSTRUCTION_FILE
+        path = self.path_for(batch_id)
+
+        if self.fmt == 'yaml':
+            if self._formatter is None:
+                from yaml_ez_chajim_formatter import create_formatter
+                self._formatter = create_formatter()
+            _atomic_write(path, lambda f: self._formatter.write_batch_yaml(batch, f))
+        else:
+            _atomic_write(path, lambda f: write_batch_text(batch, f, total))
+
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'batch_id': batch_id,
+                'file': path.name,
+                'chunks': chunk_ids
+            }, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed.add(batch_id)
+        self.journaled[batch_id] = chunk_ids
+        return path
+
+    def write_all(self, batches: Iterable[Dict], total: Optional[int] = None) -> Dict:
+        """
+        Schreibt alle Batches eines (Generator-)Stroms, fertige werden übersprungen
+
+        Returns:
+            Statistik-Dictionary (geschrieben, übersprungen)
+        """
+        written = skipped = 0
+        for batch in batches:
+            if self.write(batch, total) is None:
+                skipped += 1
+            else:
+                written += 1
+        return {
+            'output_dir': str(self.output_dir),
+            'written': written,
+            'skipped': skipped,
+            'completed': len(self.completed)
+        }
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+
+    from analysis_cache import AnalysisCache
+    from manuscript_processor import ManuscriptProcessor
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Batch-Writer (fortsetzbar)")
+    parser.add_argument('output_dir', help="Zielverzeichnis")
+    parser.add_argument('--source', default=None, help="Corpus Pack oder Chunk-Verzeichnis")
+    parser.add_argument('--format', default='txt', choices=FORMATS)
+    parser.add_argument('--batch-size', type=int, default=10, help="Chunks pro Batch")
+    parser.add_argument('--token-budget', type=int, default=None, help="Tokens pro Batch statt fester Anzahl")
+    parser.add_argument('--restart', action='store_true', help="Journal verwerfen, von vorn beginnen")
+    args = parser.parse_args()
+
+    processor = ManuscriptProcessor()
+    analysis = processor.analyze_corpus(args.source, cache=AnalysisCache(processor.ruleset_stamp()))
+    params = ({'token_budget': args.token_budget} if args.token_budget
+              else {'batch_size': args.batch_size})
+    writer = BatchWriter(args.output_dir, processor._create_translation_instruction(),
+                         args.format, args.restart, params)
+    total = None if args.token_budget else -(-len(analysis['chunks']) // args.batch_size)
+    stats = writer.write_all(
+        processor.iter_translation_batches(analysis['chunks'], args.batch_size, args.token_budget),
+        total
+    )
+
+    print(f"✓ {stats['written']} Batches geschrieben, {stats['skipped']} übersprungen "
+          f"({stats['completed']} fertig)")
+    print(f"  → {stats['output_dir']}")
+    print("\nQ!")
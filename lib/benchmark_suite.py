@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark-Suite für Ez Chajim
+=============================
+
+Misst die heißen Pfade auf echten Daten statt auf Beispielsätzen:
+
+    Hebräisch (Corpus chunks-hebr, alle Chunks):
+        gematria_methods   ManuscriptProcessor.calculate_gematria_methods
+        wwaq_transform     ManuscriptProcessor.apply_wwaq_transformation
+        extract_chunks     ManuscriptProcessor.extract_chunks
+        format_chunk       YAMLEzChajimFormatter.format_chunk
+    Deutsch (Stichprobe der Claude-Batch-Dateien):
+        meister_frage      MeisterFrageTool.verarbeite_text
+        wwak_check         WWAKBuchstabenLehre.check_text
+        integrity_check    SpiritualIntegrityChecker.check_integrity
+
+Pro Benchmark: Operationen/s, Latenz p50/p99 (jede Operation einzeln
+gemessen) und Speicher-Peak der Operationen (eigener Durchlauf mit
+tracemalloc, nur Allokationen dieses Benchmarks; ru_maxrss wäre der Peak
+des ganzen Prozesses über alle Benchmarks). Ergebnisse als JSON; gegen
+eine gespeicherte Baseline verglichen, mit einstellbaren Schwellen.
+
+Die deutschen Pfade haben wenige, große Eingaben: sie laufen mindestens
+BATCH_MIN_REPEAT Mal (ops/s aus dem schnellsten Durchlauf) und haben eine
+eigene, weitere ops-Schwelle.
+
+    python lib/benchmark_suite.py --save-baseline
+    python lib/benchmark_suite.py --compare            # Exit-Code 1 bei Regression
+
+Module, die sich nicht importieren lassen, werden übersprungen.
+
+Stand: 5. Cheschwan 5787
+"""
+
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from corpus_pack import CACHE_DIR, REPO_ROOT, open_corpus
+from translation_store import batch_files
+
+DEFAULT_RESULTS_PATH = CACHE_DIR / 'benchmarks' / 'latest.json'
+DEFAULT_BASELINE_PATH = CACHE_DIR / 'benchmarks' / 'baseline.json'
+
+# Quellverzeichnisse der Module außerhalb von lib/
+MODULE_DIRS = (
+    REPO_ROOT / 'modules' / 'core' / 'meister-frage-tool' / 'src',
+    REPO_ROOT / 'modules' / 'core' / 'brija',
+    REPO_ROOT / 'modules' / 'core' / 'core',
+)
+
+DEFAULT_BATCH_SAMPLE = 10
+
+# Benchmarks über die Batch-Stichprobe (wenige Eingaben, mehr Streuung)
+BATCH_BENCHMARKS = ('meister_frage', 'wwak_check', 'integrity_check')
+BATCH_MIN_REPEAT = 5
+
+
+@dataclass
+class Thresholds:
+    """Erlaubte Verschlechterung gegenüber der Baseline (Anteile)"""
+    ops: float = 0.10        # Operationen/s dürfen um 10 % fallen
+    p99: float = 0.25        # p99-Latenz darf um 25 % steigen
+    memory: float = 0.20     # Speicher-Peak darf um 20 % steigen
+    batch_ops: float = 0.25  # ops/s der BATCH_BENCHMARKS
+
+
+@dataclass
+class BenchmarkResult:
+    """Messwerte eines Benchmarks"""
+    name: str
+    ops: int
+    seconds: float
+    ops_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_alloc_kb: int
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+# Hilfsfunktionen
+
+def _percentile(sorted_values: Sequence[int], fraction: float) -> int:
+    """Nächstgelegener Rang (ohne Interpolation)"""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _peak_rss_kb() -> int:
+    """Peak-RSS des Prozesses in KiB (macOS meldet Bytes)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _peak_alloc_kb(func: Callable[[Any], Any], inputs: Sequence[Any]) -> int:
+    """Speicher-Peak (tracemalloc) eines Durchlaufs über inputs, in KiB"""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        for item in inputs:
+            func(item)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return max(0, peak - before) // 1024
+
+
+def _import_modules() -> None:
+    for module_dir in MODULE_DIRS:
+        if str(module_dir) not in sys.path:
+            sys.path.insert(0, str(module_dir))
+
+
+def measure(name: str, func: Callable[[Any], Any], inputs: Sequence[Any],
+            repeat: int = 1) -> BenchmarkResult:
+    """
+    Ruft func für jede Eingabe auf (repeat Durchläufe), jede Operation einzeln gemessen
+
+    Ein Aufruf vorab wärmt Caches und Lazy-Imports auf und zählt nicht.
+    ops/s kommt aus dem schnellsten Durchlauf (wie timeit: langsamere
+    Durchläufe messen vor allem andere Last auf der Maschine), die
+    Latenzen aus allen. Der Speicher wird danach in einem eigenen Durchlauf gemessen
+    (tracemalloc bremst, die Zeiten bleiben davon unberührt).
+    """
+    if not inputs:
+        raise ValueError(f"Keine Eingaben für {name}")
+    func(inputs[0])
+
+    clock = time.perf_counter_ns
+    latencies: List[int] = []
+    rounds: List[int] = []
+    for _ in range(repeat):
+        start = clock()
+        for item in inputs:
+            before = clock()
+            func(item)
+            latencies.append(clock() - before)
+        rounds.append(clock() - start)
+    total = sum(rounds) / 1e9
+    fastest = min(rounds) / 1e9
+
+    latencies.sort()
+    return BenchmarkResult(
+        name=name,
+        ops=len(latencies),
+        seconds=round(total, 4),
+        ops_per_second=round(len(inputs) / fastest, 1) if fastest > 0 else 0.0,
+        p50_ms=round(_percentile(latencies, 0.50) / 1e6, 4),
+        p99_ms=round(_percentile(latencies, 0.99) / 1e6, 4),
+        peak_alloc_kb=_peak_alloc_kb(func, inputs)
+    )
+
+
+# Datenquellen
+
+def load_corpus_texts(source=None) -> List[Tuple[int, str]]:
+    """Alle Chunks (ID, Text) aus Corpus Pack oder Chunk-Verzeichnis"""
+    return list(open_corpus(source))
+
+
+def load_batch_sample(count: int = DEFAULT_BATCH_SAMPLE) -> List[str]:
+    """Gleichmäßig verteilte Stichprobe der Batch-Dateien (voller Text)"""
+    paths = batch_files()
+    if count < len(paths):
+        step = len(paths) / count
+        paths = [paths[int(i * step)] for i in range(count)]
+    return [path.read_text(encoding='utf-8') for path in paths]
+
+
+# Benchmarks: Name → Setup(chunks, batches) → (Funktion, Eingaben)
+
+def _setup_processor(method: str) -> Callable:
+    def setup(chunks: List[Tuple[int, str]], batches: List[str]):
+        from manuscript_processor import ManuscriptProcessor
+        processor = ManuscriptProcessor()
+        return getattr(processor, method), [text for _, text in chunks]
+    return setup
+
+
+def _setup_extract_chunks(chunks, batches):
+    from manuscript_processor import ManuscriptProcessor
+    processor = ManuscriptProcessor()
+    return (lambda text: processor.extract_chunks(text, 500)), [text for _, text in chunks]
+
+
+def _setup_format_chunk(chunks, batches):
+    from manuscript_processor import ManuscriptProcessor
+    from yaml_ez_chajim_formatter import create_formatter
+    processor = ManuscriptProcessor()
+    formatter = create_formatter()
+    # Chunk-Analyse gehört zum Setup, gemessen wird nur das Formatieren
+    records = []
+    for chunk_id, text in chunks:
+        chunk = processor._create_chunk(text, chunk_id)
+        records.append({
+            'id': chunk['id'],
+            'original': chunk['original'],
+            'translation': '',
+            'metadata': chunk['metadata']
+        })
+    return formatter.format_chunk, records
+
+
+def _setup_meister_frage(chunks, batches):
+    _import_modules()
+    from meister_frage_tool import MeisterFrageTool
+    return MeisterFrageTool().verarbeite_text, batches
+
+
+def _setup_wwak_check(chunks, batches):
+    _import_modules()
+    from wwaq_transformer import WWAKBuchstabenLehre
+    return WWAKBuchstabenLehre().check_text, batches
+
+
+def _setup_integrity_check(chunks, batches):
+    _import_modules()
+    from spiritual_integrity import SpiritualIntegrityChecker
+    return SpiritualIntegrityChecker().check_integrity, batches
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    'gematria_methods': _setup_processor('calculate_gematria_methods'),
+    'wwaq_transform': _setup_processor('apply_wwaq_transformation'),
+    'extract_chunks': _setup_extract_chunks,
+    'format_chunk': _setup_format_chunk,
+    'meister_frage': _setup_meister_frage,
+    'wwak_check': _setup_wwak_check,
+    'integrity_check': _setup_integrity_check,
+}
+
+
+def run_suite(names: Optional[Sequence[str]] = None, source=None,
+              batch_sample: int = DEFAULT_BATCH_SAMPLE, repeat: int = 1,
+              progress: Optional[Callable[[BenchmarkResult], None]] = None) -> Dict:
+    """
+    Führt die Benchmarks aus
+
+    Args:
+        names: Auswahl aus BENCHMARKS (None = alle)
+        source: Corpus Pack oder Chunk-Verzeichnis (None = Standard)
+        batch_sample: Anzahl Batch-Dateien für die deutschen Pfade
+        repeat: Durchläufe über die Eingaben (BATCH_BENCHMARKS mindestens BATCH_MIN_REPEAT)
+        progress: Callback pro fertigem Benchmark
+
+    Returns:
+        JSON-fähiges Dictionary (meta, benchmarks, skipped)
+    """
+    names = list(names or BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unbekannte Benchmarks: {', '.join(unknown)}")
+
+    chunks = load_corpus_texts(source)
+    batches = load_batch_sample(batch_sample)
+
+    results: Dict[str, Dict] = {}
+    skipped: Dict[str, str] = {}
+    for name in names:
+        try:
+            func, inputs = BENCHMARKS[name](chunks, batches)
+        except ImportError as e:
+            skipped[name] = str(e)
+            continue
+        runs = max(repeat, BATCH_MIN_REPEAT) if name in BATCH_BENCHMARKS else repeat
+        result = measure(name, func, inputs, runs)
+        results[name] = result.to_dict()
+        if progress:
+            progress(result)
+
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'corpus_chunks': len(chunks),
+            'batch_files': len(batches),
+            'repeat': repeat,
+            'peak_rss_kb': _peak_rss_kb()
+        },
+        'benchmarks': results,
+        'skipped': skipped
+    }
+
+
+def compare(results: Dict, baseline: Dict,
+            thresholds: Optional[Thresholds] = None) -> List[Dict]:
+    """
+    Vergleicht mit einer Baseline
+
+    Returns:
+        Eine Zeile pro Benchmark (Änderungen als Anteile, 'regression' = Schwelle überschritten)
+    """
+    thresholds = thresholds or Thresholds()
+    rows = []
+    for name, current in results['benchmarks'].items():
+        base = baseline.get('benchmarks', {}).get(name)
+        if base is None:
+            continue
+        ops_change = current['ops_per_second'] / base['ops_per_second'] - 1 if base['ops_per_second'] else 0.0
+        p99_change = current['p99_ms'] / base['p99_ms'] - 1 if base['p99_ms'] else 0.0
+        # Ältere Baselines ohne Speicher-Peak: kein Vergleich
+        base_memory = base.get('peak_alloc_kb')
+        memory_change = current['peak_alloc_kb'] / base_memory - 1 if base_memory else 0.0
+        max_slowdown = thresholds.batch_ops if name in BATCH_BENCHMARKS else thresholds.ops
+        failures = []
+        if ops_change < -max_slowdown:
+            failures.append('ops')
+        if p99_change > thresholds.p99:
+            failures.append('p99')
+        if memory_change > thresholds.memory:
+            failures.append('memory')
+        rows.append({
+            'name': name,
+            'ops_change': round(ops_change, 4),
+            'p99_change': round(p99_change, 4),
+            'memory_change': round(memory_change, 4),
+            'regression': failures
+        })
+    return rows
+
+
+def save_results(results: Dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    tmp_path.replace(path)
+
+
+def load_results(path: Path) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Benchmark-Suite (echter Corpus)")
+    parser.add_argument('benchmarks', nargs='*', help=f"Auswahl (Standard: alle): {', '.join(BENCHMARKS)}")
+    parser.add_argument('--source', default=None, help="Corpus Pack oder Chunk-Verzeichnis")
+    parser.add_argument('--batches', type=int, default=DEFAULT_BATCH_SAMPLE, help="Batch-Dateien in der Stichprobe")
+    parser.add_argument('--repeat', type=int, default=1, help="Durchläufe über die Eingaben")
+    parser.add_argument('--output', type=Path, default=DEFAULT_RESULTS_PATH, help="Ergebnis-JSON")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE_PATH, help="Baseline-JSON")
+    parser.add_argument('--save-baseline', action='store_true', help="Ergebnis als neue Baseline speichern")
+    parser.add_argument('--compare', action='store_true', help="Mit Baseline vergleichen")
+    parser.add_argument('--max-slowdown', type=float, default=Thresholds.ops, help="erlaubter Rückgang ops/s (Anteil)")
+    parser.add_argument('--max-p99', type=float, default=Thresholds.p99, help="erlaubter Anstieg p99 (Anteil)")
+    parser.add_argument('--max-memory', type=float, default=Thresholds.memory, help="erlaubter Anstieg Speicher-Peak (Anteil)")
+    parser.add_argument('--max-batch-slowdown', type=float, default=Thresholds.batch_ops,
+                        help="erlaubter Rückgang ops/s der Batch-Pfade (Anteil)")
+    args = parser.parse_args()
+
+    def report(result: BenchmarkResult) -> None:
+        print(f"  {result.name:<18} {result.ops_per_second:>10.1f} ops/s  "
+              f"p50 {result.p50_ms:>9.3f} ms  p99 {result.p99_ms:>9.3f} ms  "
+              f"Speicher {result.peak_alloc_kb:>7} KiB")
+
+    print("=== Ez Chajim Benchmarks ===\n")
+    results = run_suite(args.benchmarks, args.source, args.batches, args.repeat, report)
+    for name, reason in results['skipped'].items():
+        print(f"  {name:<18} übersprungen: {reason}")
+
+    save_results(results, args.output)
+    print(f"\n✓ Ergebnis: {args.output}")
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"✓ Baseline: {args.baseline}")
+
+    exit_code = 0
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"✗ Keine Baseline unter {args.baseline}")
+            sys.exit(2)
+        thresholds = Thresholds(args.max_slowdown, args.max_p99, args.max_memory, args.max_batch_slowdown)
+        print("\nVergleich mit Baseline:")
+        for row in compare(results, load_results(args.baseline), thresholds):
+            marker = "✗" if row['regression'] else "✓"
+            print(f"  {marker} {row['name']:<18} ops/s {row['ops_change']:+.1%}  "
+                  f"p99 {row['p99_change']:+.1%}  Speicher {row['memory_change']:+.1%}")
+            if row['regression']:
+                exit_code = 1
+
+    print("\nQ!")
+    sys.exit(exit_code)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kompakte Datensätze für Ez Chajim
+=================================
+
+Unveränderliche Records (frozen, __slots__) für Chunks, Omer-Studienpfade
+und Batch-Einträge. Sie ersetzen die verschachtelten Template-Dictionaries
+des YAMLEzChajimFormatter:
+
+    • pro Record nur die variablen Felder, konstante Felder (Quelle,
+      Autor, Tradition, Platzhalter) stehen einmal auf Modulebene
+    • kein geteilter Zustand zwischen Chunks (frozen, Tupel statt Listen)
+    • to_dict() baut die bisherige YAML/JSON-Form erst bei der Ausgabe
+
+Stand: 5. Cheschwan 5787
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
+
+# Konstante Chunk-Felder (einmal für alle Records)
+CHUNK_SOURCE = 'Ez Chajim'
+CHUNK_AUTHOR = 'Chajim Vital'
+CHUNK_TRADITION = 'Lurianische Qabbala'
+
+TRANSLATION_PLACEHOLDER = "[DEUTSCHE ÜBERSETZUNG HIER]"
+
+# Gematria-Methodennamen: ein Tupel pro Kombination, von allen Records geteilt
+_METHOD_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def shared_methods(methods: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Geteiltes Tupel für eine Folge von Methodennamen"""
+    return _METHOD_TUPLES.setdefault(methods, methods)
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkRecord:
+    """Ein Chunk mit Übersetzung und Analyse"""
+    id: Optional[str]
+    hebrew: str
+    german: str
+    gematria_methods: Tuple[str, ...] = ()
+    gematria_values: Tuple[int, ...] = ()
+    key_terms: Tuple[Tuple[str, str], ...] = ()
+    created: Optional[str] = None
+    wwaq_validated: bool = False
+
+    @classmethod
+    def from_chunk(cls, chunk_data: Mapping, created: Optional[str] = None,
+                   wwaq_validated: bool = False) -> 'ChunkRecord':
+        """Aus einem Chunk-Dictionary (id, original, translation, metadata)"""
+        meta = chunk_data.get('metadata', {})
+        gematria = meta.get('gematria', {})
+        return cls(
+            chunk_data.get('id'),
+            chunk_data.get('original', ''),
+            chunk_data.get('translation', ''),
+            shared_methods(tuple(gematria)),
+            tuple(gematria.values()),
+            tuple((term['hebrew'], term['translation']) for term in meta.get('key_terms', [])),
+            created,
+            wwaq_validated
+        )
+
+    def to_dict(self) -> Dict:
+        """Form des bisherigen Chunk-Templates (frisch aufgebaut)"""
+        return {
+            'chunk_info': {
+                'id': self.id,
+                'source': CHUNK_SOURCE,
+                'author': CHUNK_AUTHOR,
+                'tradition': CHUNK_TRADITION
+            },
+            'content': {
+                'hebrew': self.hebrew,
+                'german': self.german,
+                'commentary': []
+            },
+            'analysis': {
+                'gematria': dict(zip(self.gematria_methods, self.gematria_values)),
+                'key_concepts': [f"{hebrew} ({translation})" for hebrew, translation in self.key_terms],
+                'cross_references': []
+            },
+            'metadata': {
+                'created': self.created,
+                'modified': None,
+                'wwaq_validated': self.wwaq_validated
+            }
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class OmerStudyRecord:
+    """Studienpfad für einen Omer-Tag"""
+    day: int
+    week_sefira: str
+    day_sefira: str
+    theme: str
+    meditation: str
+    practical_work: str
+    assigned_chunks: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict:
+        """Form des bisherigen Omer-Templates"""
+        return {
+            'omer_day': self.day,
+            'date': f"Tag {self.day} des Omer",
+            'sefirot_combination': {
+                'week': self.week_sefira,
+                'day': self.day_sefira,
+                'full': f"{self.day_sefira} שב{self.week_sefira}"
+            },
+            'study_focus': {
+                'theme': self.theme,
+                'meditation': self.meditation,
+                'practical_work': self.practical_work
+            },
+            'assigned_chunks': list(self.assigned_chunks),
+            'reflections': []
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BatchEntry:
+    """Ein zu übersetzender Chunk in einem Batch"""
+    chunk_id: str
+    hebrew_text: str
+    gematria_value: int
+    key_terms: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_chunk(cls, chunk: Mapping) -> 'BatchEntry':
+        """Aus einem Batch-Chunk (id, text, gematria_hint, key_terms)"""
+        return cls(
+            chunk['id'],
+            chunk['text'],
+            chunk['gematria_hint'],
+            tuple((term['hebrew'], term['translation']) for term in chunk['key_terms'])
+        )
+
+    def to_dict(self) -> Dict:
+        """Form eines Eintrags in chunks_to_translate"""
+        return {
+            'chunk_id': self.chunk_id,
+            'hebrew_text': self.hebrew_text,
+            'context': {
+                'gematria_value': self.gematria_value,
+                'key_terms': [
+                    {'hebrew': hebrew, 'meaning': meaning}
+                    for hebrew, meaning in self.key_terms
+                ]
+            },
+            'translation_placeholder': TRANSLATION_PLACEHOLDER
+        }
+
+
+RECORD_TYPES = (ChunkRecord, OmerStudyRecord, BatchEntry)
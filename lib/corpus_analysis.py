@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallele Corpus-Analyse für Ez Chajim
+======================================
+
+Verteilt die Chunk-Analyse (WWAQ-Transformation, Gematria, Schlüsselbegriffe)
+auf einen ProcessPoolExecutor. Die Worker lesen ihre Chunks selbst aus dem
+Corpus Pack; übertragen werden nur Chunk-IDs und Teilsummen.
+
+Die Teilergebnisse werden in Auftragsreihenfolge zusammengeführt, dadurch ist
+das Ergebnis unabhängig von der Worker-Anzahl identisch.
+
+Aufruf:
+    python lib/corpus_analysis.py analyze-corpus --workers 4
+
+Stand: 5. Cheschwan 5787
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from analysis_cache import AnalysisCache, content_hash
+from corpus_pack import Corpus, open_corpus
+from manuscript_processor import AnalysisTotals, ManuscriptProcessor
+
+# Chunks pro Auftrag an einen Worker
+DEFAULT_TASK_SIZE = 32
+
+# Worker-Zustand (einmal pro Prozess)
+_worker_processor: Optional[ManuscriptProcessor] = None
+_worker_corpus: Optional[Corpus] = None
+
+
+def _init_worker(source: str) -> None:
+    """Initialisiert Prozessor und Corpus einmal pro Worker-Prozess"""
+    global _worker_processor, _worker_corpus
+    _worker_processor = ManuscriptProcessor()
+    _worker_corpus = open_corpus(source)
+
+
+def _analyze_task(chunk_ids: List[int], keep_chunks: bool) -> Tuple[AnalysisTotals, List[Dict]]:
+    """Analysiert einen Auftrag (Liste von Chunk-IDs) im Worker"""
+    totals = AnalysisTotals()
+    chunks = []
+    for chunk_id in chunk_ids:
+        text = _worker_corpus.get(chunk_id)
+        chunk = _worker_processor._create_chunk(text.strip(), chunk_id)
+        totals.add(chunk)
+        if keep_chunks:
+            chunks.append(chunk)
+    return totals, chunks
+
+
+def _print_progress(done: int, total: int, elapsed: float) -> None:
+    rate = done / elapsed if elapsed > 0 else 0.0
+    print(f"\r  {done}/{total} Chunks ({rate:.1f} Chunks/s)", end='', file=sys.stderr, flush=True)
+
+
+def _run_tasks(source_path: str, tasks: List[List[int]], workers: int, keep_chunks: bool,
+               reduce: Callable[[Tuple[AnalysisTotals, List[Dict]]], None],
+               progress: Optional[Callable[[int], None]]) -> None:
+    """Führt Aufträge aus und ruft reduce strikt in Auftragsreihenfolge auf"""
+    done = 0
+    if workers <= 1:
+        _init_worker(source_path)
+        for task in tasks:
+            reduce(_analyze_task(task, keep_chunks))
+            done += len(task)
+            if progress:
+                progress(done)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(source_path,)) as executor:
+        futures = {
+            executor.submit(_analyze_task, task, keep_chunks): index
+            for index, task in enumerate(tasks)
+        }
+
+        # Fertige Aufträge puffern, Zusammenführung strikt in Auftragsreihenfolge
+        pending = {}
+        next_index = 0
+        for future in as_completed(futures):
+            index = futures[future]
+            pending[index] = future.result()
+            done += len(tasks[index])
+
+            while next_index in pending:
+                reduce(pending.pop(next_index))
+                next_index += 1
+
+            if progress:
+                progress(done)
+
+
+def analyze_corpus_parallel(source: Optional[Union[str, Path, Corpus]] = None,
+                            workers: Optional[int] = None,
+                            task_size: int = DEFAULT_TASK_SIZE,
+                            keep_chunks: bool = False,
+                            progress: Optional[Callable[[int, int, float], None]] = None,
+                            cache: Optional[AnalysisCache] = None) -> Dict:
+    """
+    Analysiert den gesamten Corpus mit mehreren Prozessen
+
+    Args:
+        source: Corpus Pack oder Chunk-Verzeichnis (None = Standard)
+        workers: Anzahl Worker-Prozesse (None = CPU-Anzahl, 1 = ohne Pool)
+        task_size: Chunks pro Auftrag
+        keep_chunks: Chunk-Dicts ins Ergebnis übernehmen
+        progress: Callback(fertig, gesamt, sekunden)
+        cache: Analyse-Cache; nur neue/geänderte Chunks gehen an die Worker
+
+    Returns:
+        Dictionary im Format von analyze_corpus plus 'performance'
+    """
+    if task_size < 1:
+        raise ValueError("task_size muss mindestens 1 sein")
+
+    corpus = open_corpus(source)
+    source_path = str(corpus.path)
+    chunk_ids = corpus.ids()
+    workers = workers or os.cpu_count() or 1
+
+    totals = AnalysisTotals()
+    chunks: List[Dict] = []
+    start = time.perf_counter()
+
+    if cache is None:
+        todo = chunk_ids
+    else:
+        # Manifest-Abgleich: nur Chunks ohne passenden Cache-Eintrag berechnen
+        digests = {cid: content_hash(corpus.get_bytes(cid)) for cid in chunk_ids}
+        resolved = {}
+        todo = []
+        for cid in chunk_ids:
+            cached = cache.get(cid, digests[cid])
+            if cached is None:
+                todo.append(cid)
+            else:
+                resolved[cid] = cached
+
+    tasks = [todo[i:i + task_size] for i in range(0, len(todo), task_size)]
+
+    def reduce(result: Tuple[AnalysisTotals, List[Dict]]) -> None:
+        part_totals, part_chunks = result
+        if cache is None:
+            totals.merge(part_totals)
+            chunks.extend(part_chunks)
+            return
+        for chunk in part_chunks:
+            cid = int(chunk['id'].split('_')[1])
+            cache.put(cid, digests[cid], chunk)
+            resolved[cid] = chunk
+
+    def report(done: int) -> None:
+        if progress:
+            progress(done, len(todo), time.perf_counter() - start)
+
+    _run_tasks(source_path, tasks, workers, keep_chunks or cache is not None, reduce, report)
+
+    if cache is not None:
+        # In Chunk-Reihenfolge falten = gleiches Ergebnis wie ohne Cache
+        for cid in chunk_ids:
+            chunk = resolved[cid]
+            totals.add(chunk)
+            if keep_chunks:
+                chunks.append(chunk)
+        cache.retain(chunk_ids)
+        cache.save()
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        'file': source_path,
+        'analysis': totals.as_dict(),
+        'chunks': chunks,
+        'performance': {
+            'workers': workers,
+            'task_size': task_size,
+            'analyzed': len(todo),
+            'from_cache': len(chunk_ids) - len(todo),
+            'seconds': round(elapsed, 3),
+            'chunks_per_second': round(len(chunk_ids) / elapsed, 1) if elapsed > 0 else 0.0
+        }
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: analyze-corpus"""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Corpus-Analyse")
+    sub = parser.add_subparsers(dest='befehl', required=True)
+
+    analyze = sub.add_parser('analyze-corpus', help="Gesamten Corpus parallel analysieren")
+    analyze.add_argument('source', nargs='?', default=None,
+                         help="Corpus Pack oder Chunk-Verzeichnis")
+    analyze.add_argument('--workers', type=int, default=None,
+                         help="Anzahl Worker-Prozesse (Standard: CPU-Anzahl)")
+    analyze.add_argument('--task-size', type=int, default=DEFAULT_TASK_SIZE,
+                         help="Chunks pro Worker-Auftrag")
+    analyze.add_argument('--output', default=None, help="Ergebnis als JSON speichern")
+    analyze.add_argument('--with-chunks', action='store_true',
+                         help="Chunk-Details in die JSON-Ausgabe übernehmen")
+    analyze.add_argument('--quiet', action='store_true', help="Keine Fortschrittsanzeige")
+    analyze.add_argument('--no-cache', action='store_true',
+                         help="Analyse-Cache ignorieren und alles neu berechnen")
+
+    args = parser.parse_args(argv)
+
+    result = analyze_corpus_parallel(
+        args.source,
+        workers=args.workers,
+        task_size=args.task_size,
+        keep_chunks=args.with_chunks,
+        progress=None if args.quiet else _print_progress,
+        cache=None if args.no_cache else AnalysisCache(ManuscriptProcessor().ruleset_stamp())
+    )
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    analysis = result['analysis']
+    perf = result['performance']
+    print(f"Corpus: {result['file']}")
+    print(f"  • {analysis['total_chunks']} Chunks, {analysis['total_words']} Wörter")
+    print(f"  • Gematria gesamt: {analysis['total_gematria']}")
+    print(f"  • {perf['analyzed']} analysiert, {perf['from_cache']} aus dem Cache")
+    print(f"  • {perf['workers']} Worker, {perf['seconds']}s, {perf['chunks_per_second']} Chunks/s")
+
+    if args.output:
+        if not args.with_chunks:
+            result.pop('chunks')
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"✓ Ergebnis gespeichert: {args.output}")
+
+    print("\nQ!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corpus Pack für Ez Chajim
+=========================
+
+Packt die 1342 hebräischen Chunks aus original-texts/chunks-hebr
+in eine einzige Datei mit festem Offset/Längen-Index und lädt sie
+per mmap. Chunk-Texte werden erst beim Zugriff dekodiert.
+
+Format (Little Endian):
+    Header:  magic (8 Bytes) | anzahl (u32) | reserviert (u32)
+    Index:   anzahl × (chunk_id u32 | offset u64 | länge u32)
+    Daten:   UTF-8 Texte ohne BOM, hintereinander
+
+Stand: 5. Cheschwan 5787
+"""
+
+import mmap
+import os
+import re
+import struct
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Pfade
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CHUNKS_HEBR_DIR = REPO_ROOT / 'original-texts' / 'chunks-hebr'
+CACHE_DIR = REPO_ROOT / '.cache'
+DEFAULT_PACK_PATH = CACHE_DIR / 'chunks-hebr.pack'
+
+# Pack-Format
+PACK_MAGIC = b'EZCPAK01'
+HEADER_STRUCT = struct.Struct('<8sII')
+INDEX_STRUCT = struct.Struct('<IQI')
+
+CHUNK_FILE_PATTERN = re.compile(r'^chunk_(\d+)_hebr\.txt$')
+UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def chunk_files(source_dir: Path = CHUNKS_HEBR_DIR) -> List[Tuple[int, Path]]:
+    """Liefert (chunk_id, pfad) aller Chunk-Dateien, nach ID sortiert"""
+    files = []
+    for path in Path(source_dir).iterdir():
+        match = CHUNK_FILE_PATTERN.match(path.name)
+        if match:
+            files.append((int(match.group(1)), path))
+    files.sort()
+    return files
+
+
+def decode_chunk_bytes(raw: bytes, name: str = '') -> str:
+    """Entfernt BOM und validiert UTF-8"""
+    if raw.startswith(UTF8_BOM):
+        raw = raw[len(UTF8_BOM):]
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Kein gültiges UTF-8 in {name}: {e}") from e
+
+
+def is_corpus_pack(path: Union[str, Path]) -> bool:
+    """Prüft anhand der Magic-Bytes, ob eine Datei ein Corpus Pack ist"""
+    path = Path(path)
+    if not path.is_file():
+        return False
+    with open(path, 'rb') as f:
+        return f.read(len(PACK_MAGIC)) == PACK_MAGIC
+
+
+def build_corpus_pack(source_dir: Union[str, Path] = CHUNKS_HEBR_DIR,
+                      pack_path: Union[str, Path] = DEFAULT_PACK_PATH) -> Dict:
+    """
+    Baut ein Corpus Pack aus einem Chunk-Verzeichnis
+
+    Args:
+        source_dir: Verzeichnis mit chunk_NNNNN_hebr.txt Dateien
+        pack_path: Zieldatei (wird atomar ersetzt)
+
+    Returns:
+        Statistik-Dictionary
+    """
+    files = chunk_files(Path(source_dir))
+    if not files:
+        raise ValueError(f"Keine Chunk-Dateien in {source_dir} gefunden")
+
+    # Einmal dekodieren = einmal validieren
+    payloads = []
+    for chunk_id, path in files:
+        text = decode_chunk_bytes(path.read_bytes(), path.name)
+        payloads.append((chunk_id, text.encode('utf-8')))
+
+    index = bytearray()
+    offset = 0
+    for chunk_id, data in payloads:
+        index += INDEX_STRUCT.pack(chunk_id, offset, len(data))
+        offset += len(data)
+
+    pack_path = Path(pack_path)
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = pack_path.with_name(pack_path.name + '.tmp')
+
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER_STRUCT.pack(PACK_MAGIC, len(payloads), 0))
+        f.write(index)
+        for _, data in payloads:
+            f.write(data)
+    os.replace(tmp_path, pack_path)
+
+    return {
+        'pack': str(pack_path),
+        'chunks': len(payloads),
+        'bytes': offset,
+        'first_id': payloads[0][0],
+        'last_id': payloads[-1][0]
+    }
+
+
+class CorpusPack:
+    """Lesezugriff auf ein Corpus Pack via mmap"""
+
+    def __init__(self, pack_path: Union[str, Path] = DEFAULT_PACK_PATH):
+        self.path = Path(pack_path)
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, _ = HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} ist kein Ez Chajim Corpus Pack")
+
+        index_start = HEADER_STRUCT.size
+        self._data_start = index_start + count * INDEX_STRUCT.size
+
+        # Index ist nach chunk_id sortiert
+        self._ids: List[int] = []
+        self._offsets: List[int] = []
+        self._lengths: List[int] = []
+        for chunk_id, offset, length in INDEX_STRUCT.iter_unpack(
+                self._mmap[index_start:self._data_start]):
+            self._ids.append(chunk_id)
+            self._offsets.append(offset)
+            self._lengths.append(length)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, chunk_id: int) -> bool:
+        return self._position(chunk_id) is not None
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        for pos in range(len(self._ids)):
+            yield self._ids[pos], self._text_at(pos)
+
+    def __enter__(self) -> 'CorpusPack':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def ids(self) -> List[int]:
+        """Alle Chunk-IDs im Pack"""
+        return list(self._ids)
+
+    def get(self, chunk_id: int) -> str:
+        """Gibt den Text eines Chunks zurück"""
+        pos = self._position(chunk_id)
+        if pos is None:
+            raise KeyError(f"Chunk {chunk_id} nicht im Pack")
+        return self._text_at(pos)
+
+    def get_bytes(self, chunk_id: int) -> bytes:
+        """Gibt die rohen UTF-8 Bytes eines Chunks zurück"""
+        pos = self._position(chunk_id)
+        if pos is None:
+            raise KeyError(f"Chunk {chunk_id} nicht im Pack")
+        start = self._data_start + self._offsets[pos]
+        return self._mmap[start:start + self._lengths[pos]]
+
+    def range(self, start_id: int, end_id: int) -> Iterator[Tuple[int, str]]:
+        """Iteriert über Chunks mit start_id <= id <= end_id"""
+        lo = bisect_left(self._ids, start_id)
+        hi = bisect_right(self._ids, end_id)
+        for pos in range(lo, hi):
+            yield self._ids[pos], self._text_at(pos)
+
+    def size(self, chunk_id: int) -> int:
+        """Byte-Länge eines Chunks ohne Dekodierung"""
+        pos = self._position(chunk_id)
+        if pos is None:
+            raise KeyError(f"Chunk {chunk_id} nicht im Pack")
+        return self._lengths[pos]
+
+    def close(self) -> None:
+        """Schließt mmap und Datei"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _position(self, chunk_id: int) -> Optional[int]:
+        pos = bisect_left(self._ids, chunk_id)
+        if pos < len(self._ids) and self._ids[pos] == chunk_id:
+            return pos
+        return None
+
+    def _text_at(self, pos: int) -> str:
+        start = self._data_start + self._offsets[pos]
+        return self._mmap[start:start + self._lengths[pos]].decode('utf-8')
+
+
+class CorpusDirectory:
+    """Gleiche Schnittstelle wie CorpusPack, liest direkt aus dem Verzeichnis"""
+
+    def __init__(self, source_dir: Union[str, Path] = CHUNKS_HEBR_DIR):
+        self.path = Path(source_dir)
+        self._files = dict(chunk_files(self.path))
+        self._ids = sorted(self._files)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, chunk_id: int) -> bool:
+        return chunk_id in self._files
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        for chunk_id in self._ids:
+            yield chunk_id, self.get(chunk_id)
+
+    def __enter__(self) -> 'CorpusDirectory':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def ids(self) -> List[int]:
+        return list(self._ids)
+
+    def get(self, chunk_id: int) -> str:
+        if chunk_id not in self._files:
+            raise KeyError(f"Chunk {chunk_id} nicht in {self.path}")
+        path = self._files[chunk_id]
+        return decode_chunk_bytes(path.read_bytes(), path.name)
+
+    def get_bytes(self, chunk_id: int) -> bytes:
+        return self.get(chunk_id).encode('utf-8')
+
+    def range(self, start_id: int, end_id: int) -> Iterator[Tuple[int, str]]:
+        lo = bisect_left(self._ids, start_id)
+        hi = bisect_right(self._ids, end_id)
+        for chunk_id in self._ids[lo:hi]:
+            yield chunk_id, self.get(chunk_id)
+
+    def size(self, chunk_id: int) -> int:
+        return len(self.get_bytes(chunk_id))
+
+    def close(self) -> None:
+        pass
+
+
+Corpus = Union[CorpusPack, CorpusDirectory]
+
+
+def open_corpus(source: Optional[Union[str, Path, CorpusPack, CorpusDirectory]] = None) -> Corpus:
+    """
+    Öffnet den hebräischen Corpus
+
+    Args:
+        source: Pack-Datei, Chunk-Verzeichnis, bereits geöffneter Corpus
+                oder None (Standard-Pack falls vorhanden, sonst Verzeichnis)
+    """
+    if isinstance(source, (CorpusPack, CorpusDirectory)):
+        return source
+    if source is None:
+        source = DEFAULT_PACK_PATH if DEFAULT_PACK_PATH.exists() else CHUNKS_HEBR_DIR
+
+    path = Path(source)
+    if path.is_dir():
+        return CorpusDirectory(path)
+    if is_corpus_pack(path):
+        return CorpusPack(path)
+    raise ValueError(f"{path} ist weder Chunk-Verzeichnis noch Corpus Pack")
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Corpus Pack")
+    sub = parser.add_subparsers(dest='befehl', required=True)
+
+    build = sub.add_parser('build', help="Pack aus Chunk-Verzeichnis bauen")
+    build.add_argument('--source', default=str(CHUNKS_HEBR_DIR))
+    build.add_argument('--output', default=str(DEFAULT_PACK_PATH))
+
+    info = sub.add_parser('info', help="Pack-Inhalt anzeigen")
+    info.add_argument('pack', nargs='?', default=str(DEFAULT_PACK_PATH))
+
+    show = sub.add_parser('show', help="Chunk-Text ausgeben")
+    show.add_argument('chunk_id', type=int)
+    show.add_argument('--pack', default=str(DEFAULT_PACK_PATH))
+
+    args = parser.parse_args()
+
+    if args.befehl == 'build':
+        stats = build_corpus_pack(args.source, args.output)
+        print(f"✓ {stats['chunks']} Chunks gepackt ({stats['bytes']} Bytes)")
+        print(f"  → {stats['pack']}")
+    elif args.befehl == 'info':
+        with CorpusPack(args.pack) as pack:
+            ids = pack.ids()
+            print(f"Pack: {pack.path}")
+            print(f"Chunks: {len(ids)} ({ids[0]}–{ids[-1]})" if ids else "Chunks: 0")
+    elif args.befehl == 'show':
+        with CorpusPack(args.pack) as pack:
+            print(pack.get(args.chunk_id))
+
+    print("\nQ!")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gematria-Engine für Ez Chajim
+=============================
+
+Vektorisierte Gematria mit NumPy: der Text wird einmal in ein
+Codepoint-Array kodiert und über eine Lookup-Tabelle auf alle
+Methoden gleichzeitig abgebildet (eine Zeile pro Methode).
+
+    • methods(text)      alle Methoden in einem Durchlauf
+    • word_values(text)  Werte pro Wort (np.add.reduceat an Wortgrenzen)
+    • matrix(texts)      Bulk-API: Chunks × Methoden
+
+Methoden:
+    standard  Mispar Hechrachi (Schlussbuchstaben = Grundwert)
+    small     Mispar Katan ((wert - 1) % 9 + 1)
+    full      Milui (vereinfacht, ohne Schlussbuchstaben)
+    ordinal   Anzahl hebräischer Buchstaben
+
+Stand: 5. Cheschwan 5787
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+METHODS = ('standard', 'small', 'full', 'ordinal')
+
+# Standard-Gematria inkl. Schlussbuchstaben
+GEMATRIA_VALUES = {
+    'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5,
+    'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
+    'כ': 20, 'ך': 20, 'ל': 30, 'מ': 40, 'ם': 40,
+    'נ': 50, 'ן': 50, 'ס': 60, 'ע': 70, 'פ': 80,
+    'ף': 80, 'צ': 90, 'ץ': 90, 'ק': 100, 'ר': 200,
+    'ש': 300, 'ת': 400
+}
+
+# Volle Gematria (Milui) - vereinfacht
+FULL_VALUES = {
+    'א': 111, 'ב': 412, 'ג': 83, 'ד': 434, 'ה': 6,
+    'ו': 13, 'ז': 67, 'ח': 418, 'ט': 419, 'י': 20,
+    'כ': 100, 'ל': 74, 'מ': 90, 'נ': 106, 'ס': 120,
+    'ע': 130, 'פ': 81, 'צ': 104, 'ק': 186, 'ר': 510,
+    'ש': 360, 'ת': 406
+}
+
+# Unterhalb dieser Länge ist die Dictionary-Summe schneller als NumPy
+SMALL_TEXT = 48
+
+# Alle Zeichen, bei denen str.split() trennt (liegen unter U+3001)
+_WHITESPACE = np.array([c for c in range(0x3001) if chr(c).isspace()], dtype=np.uint32)
+
+
+class GematriaEngine:
+    """Lookup-Tabellen für alle Methoden, einmal aufgebaut"""
+
+    def __init__(self, values: Optional[Dict[str, int]] = None,
+                 full_values: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            values: Standard-Werte (None = GEMATRIA_VALUES)
+            full_values: Milui-Werte (None = FULL_VALUES)
+        """
+        self.values = dict(GEMATRIA_VALUES if values is None else values)
+        self.full_values = dict(FULL_VALUES if full_values is None else full_values)
+
+        letters = set(self.values) | set(self.full_values)
+        codepoints = [ord(letter) for letter in letters]
+        self._base = min(codepoints)
+        # Letzte Spalte = 0 für alle Zeichen außerhalb des Bereichs
+        self._outside = max(codepoints) - self._base + 1
+
+        self._table = np.zeros((len(METHODS), self._outside + 1), dtype=np.int64)
+        for letter, value in self.values.items():
+            column = ord(letter) - self._base
+            self._table[0, column] = value
+            self._table[1, column] = (value - 1) % 9 + 1
+            self._table[3, column] = 1
+        for letter, value in self.full_values.items():
+            self._table[2, ord(letter) - self._base] = value
+
+        # Pro Buchstabe alle Methoden (für kurze Texte ohne NumPy)
+        self._letters = {
+            letter: tuple(int(v) for v in self._table[:, ord(letter) - self._base])
+            for letter in letters
+        }
+
+    def encode(self, text: str) -> np.ndarray:
+        """Text → Codepoint-Array (uint32)"""
+        return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+    def columns(self, codepoints: np.ndarray) -> np.ndarray:
+        """Codepoints → Tabellenspalten (Nullspalte für alles Nicht-Hebräische)"""
+        # uint32-Subtraktion läuft unterhalb der Basis über → landet in der Nullspalte
+        return np.minimum(codepoints - np.uint32(self._base), self._outside)
+
+    def letter_values(self, codepoints: np.ndarray) -> np.ndarray:
+        """Codepoints → Wertmatrix (Methoden × Zeichen)"""
+        return self._table[:, self.columns(codepoints)]
+
+    def methods(self, text: str) -> Dict[str, int]:
+        """Alle Methoden für einen Text"""
+        if len(text) < SMALL_TEXT:
+            totals = [0, 0, 0, 0]
+            for char in text:
+                row = self._letters.get(char)
+                if row:
+                    for i in range(4):
+                        totals[i] += row[i]
+            return dict(zip(METHODS, totals))
+
+        # Buchstaben-Histogramm × Tabelle = alle Methoden auf einmal
+        counts = np.bincount(self.columns(self.encode(text)), minlength=self._outside + 1)
+        sums = self._table @ counts
+        return {method: int(value) for method, value in zip(METHODS, sums)}
+
+    def value(self, text: str, method: str = 'standard') -> int:
+        """Eine Methode für einen Text"""
+        if method not in METHODS:
+            raise ValueError(f"Unbekannte Gematria-Methode: {method}")
+        if len(text) < SMALL_TEXT and method == 'standard':
+            values = self.values
+            return sum(values[char] for char in text if char in values)
+        return self.methods(text)[method]
+
+    def word_values(self, text: str) -> Tuple[List[str], np.ndarray]:
+        """
+        Werte pro Wort (Trennung wie str.split())
+
+        Returns:
+            (Wörter, Matrix Wörter × Methoden)
+        """
+        words = text.split()
+        if not words:
+            return words, np.zeros((0, len(METHODS)), dtype=np.int64)
+
+        codepoints = self.encode(text)
+        is_space = np.isin(codepoints, _WHITESPACE)
+        # Wortanfang: kein Leerzeichen, Vorgänger Leerzeichen (oder Textanfang)
+        starts = np.flatnonzero(~is_space & np.concatenate(([True], is_space[:-1])))
+
+        values = self.letter_values(codepoints)
+        # Leerzeichen haben Wert 0, dürfen also im Segment bis zum nächsten Wort liegen
+        per_word = np.add.reduceat(values, starts, axis=1)
+        return words, per_word.T
+
+    def matrix(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Bulk-API: alle Methoden für viele Texte in einem Durchlauf
+
+        Returns:
+            Matrix Texte × Methoden (Spalten wie METHODS)
+        """
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, len(METHODS)), dtype=np.int64)
+
+        width = self._outside + 1
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        columns = self.columns(self.encode(''.join(texts))).astype(np.int64)
+
+        # Ein Histogramm pro Text (leere Texte ergeben eine Nullzeile),
+        # danach eine Matrixmultiplikation für alle Methoden
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        counts = np.bincount(rows * width + columns, minlength=len(texts) * width)
+        return counts.reshape(len(texts), width) @ self._table.T
+
+
+_default_engine: Optional[GematriaEngine] = None
+
+
+def get_engine() -> GematriaEngine:
+    """Gemeinsame Engine mit den Standard-Tabellen"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = GematriaEngine()
+    return _default_engine
+
+
+# Demo
+if __name__ == "__main__":
+    import time
+
+    print("=== Gematria-Engine Demo ===\n")
+
+    engine = get_engine()
+    text = "עץ חיים אין סוף צמצום"
+    print(f"Text: {text}")
+    print(f"Methoden: {engine.methods(text)}")
+
+    words, values = engine.word_values(text)
+    for word, row in zip(words, values):
+        print(f"  {word}: {dict(zip(METHODS, row.tolist()))}")
+
+    try:
+        from corpus_pack import open_corpus
+
+        corpus = open_corpus()
+        chunks = [chunk for _, chunk in corpus]
+        start = time.perf_counter()
+        result = engine.matrix(chunks)
+        elapsed = time.perf_counter() - start
+        print(f"\nCorpus: {result.shape[0]} Chunks in {elapsed * 1000:.1f} ms")
+        print(f"  Summe: {dict(zip(METHODS, result.sum(axis=0).tolist()))}")
+    except (OSError, ValueError) as e:
+        print(f"\nCorpus nicht verfügbar: {e}")
+
+    print("\nQ!")
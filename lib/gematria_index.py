@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gematria-Index für Ez Chajim
+============================
+
+Invertierter Index über den gesamten Corpus: jedes hebräische Wort
+mit seinen Werten (standard/small/full) und seinen Fundstellen
+(chunk_id, offset). Pro Methode sind die Wörter nach Wert sortiert,
+gleiche Werte und Wertbereiche sind damit eine Binärsuche.
+
+Die Datei wird per mmap geladen, die Arrays zeigen direkt in die
+Datei (keine Deserialisierung beim Öffnen).
+
+Format (Little Endian, alle Sektionen 4-Byte-Werte):
+    Header:    magic (8) | wörter u32 | fundstellen u32 | methoden u32 | reserviert u32 | blob u64
+    Wörter:    blob-offsets u32 × (wörter + 1)
+    Postings:  start u32 × (wörter + 1)
+    Werte:     i32 × (wörter × methoden)
+    Je Methode: wort-ids nach Wert u32 × wörter | sortierte Werte i32 × wörter
+    Fundstellen: chunk_id u32 × fundstellen | offset u32 × fundstellen
+    Blob:      UTF-8 Wörter, nach Bytes sortiert, ohne Trenner
+
+Offsets sind Zeichenpositionen im Chunk-Text (wie CorpusPack.get liefert).
+
+Stand: 5. Cheschwan 5787
+"""
+
+import mmap
+import os
+import re
+import struct
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from corpus_pack import CACHE_DIR, Corpus, open_corpus
+from gematria_engine import METHODS, get_engine
+
+DEFAULT_INDEX_PATH = CACHE_DIR / 'gematria.idx'
+
+INDEX_MAGIC = b'EZCGEM01'
+HEADER_STRUCT = struct.Struct('<8sIIIIQ')
+
+# Methoden im Index (ordinal ist nur eine Buchstabenzahl)
+INDEX_METHODS = ('standard', 'small', 'full')
+
+# Hebräisches Wort, auch Abkürzungen mit Gerschajim/Geresch (ע"ב, ה')
+WORD_PATTERN = re.compile(r"[א-ת]+(?:[\"'][א-ת]+)*'?")
+
+
+def _sections(n_words: int, n_postings: int, n_methods: int) -> Dict[str, Tuple[int, str, int]]:
+    """Offset, dtype und Länge aller Array-Sektionen"""
+    layout = [
+        ('word_offsets', '<u4', n_words + 1),
+        ('posting_starts', '<u4', n_words + 1),
+        ('values', '<i4', n_words * n_methods),
+    ]
+    for method in INDEX_METHODS[:n_methods]:
+        layout.append((f'order_{method}', '<u4', n_words))
+        layout.append((f'sorted_{method}', '<i4', n_words))
+    layout.append(('posting_chunks', '<u4', n_postings))
+    layout.append(('posting_offsets', '<u4', n_postings))
+
+    sections = {}
+    offset = HEADER_STRUCT.size
+    for name, dtype, count in layout:
+        sections[name] = (offset, dtype, count)
+        offset += count * 4
+    sections['blob'] = (offset, 'u1', 0)
+    return sections
+
+
+def build_gematria_index(source: Optional[Union[str, Path, Corpus]] = None,
+                         index_path: Union[str, Path] = DEFAULT_INDEX_PATH) -> Dict:
+    """
+    Baut den Gematria-Index über alle Chunks
+
+    Args:
+        source: Corpus Pack oder Chunk-Verzeichnis (None = Standard)
+        index_path: Zieldatei (wird atomar ersetzt)
+
+    Returns:
+        Statistik-Dictionary
+    """
+    corpus = open_corpus(source)
+
+    occurrences: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for chunk_id, text in corpus:
+        for match in WORD_PATTERN.finditer(text):
+            occurrences[match.group()].append((chunk_id, match.start()))
+    if not occurrences:
+        raise ValueError(f"Keine hebräischen Wörter in {corpus.path} gefunden")
+
+    # Nach UTF-8 Bytes sortiert = Binärsuche direkt auf dem Blob
+    encoded = sorted(word.encode('utf-8') for word in occurrences)
+    words = [raw.decode('utf-8') for raw in encoded]
+
+    word_offsets = np.zeros(len(words) + 1, dtype='<u4')
+    np.cumsum([len(raw) for raw in encoded], out=word_offsets[1:])
+
+    posting_starts = np.zeros(len(words) + 1, dtype='<u4')
+    np.cumsum([len(occurrences[word]) for word in words], out=posting_starts[1:])
+    postings = np.array([entry for word in words for entry in occurrences[word]],
+                        dtype='<u4').reshape(-1, 2)
+
+    columns = [METHODS.index(method) for method in INDEX_METHODS]
+    values = get_engine().matrix(words)[:, columns].astype('<i4')
+
+    arrays = {
+        'word_offsets': word_offsets,
+        'posting_starts': posting_starts,
+        'values': values.ravel(),
+        'posting_chunks': np.ascontiguousarray(postings[:, 0]),
+        'posting_offsets': np.ascontiguousarray(postings[:, 1]),
+    }
+    for i, method in enumerate(INDEX_METHODS):
+        order = np.argsort(values[:, i], kind='stable').astype('<u4')
+        arrays[f'order_{method}'] = order
+        arrays[f'sorted_{method}'] = values[order, i]
+
+    blob = b''.join(encoded)
+    sections = _sections(len(words), len(postings), len(INDEX_METHODS))
+
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(index_path.name + '.tmp')
+
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER_STRUCT.pack(INDEX_MAGIC, len(words), len(postings),
+                                   len(INDEX_METHODS), 0, len(blob)))
+        for name, (offset, dtype, count) in sorted(sections.items(), key=lambda s: s[1][0]):
+            if name == 'blob':
+                f.write(blob)
+            else:
+                f.write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+    os.replace(tmp_path, index_path)
+
+    return {
+        'index': str(index_path),
+        'words': len(words),
+        'postings': len(postings),
+        'bytes': index_path.stat().st_size
+    }
+
+
+class GematriaIndex:
+    """Lesezugriff auf den Gematria-Index via mmap"""
+
+    def __init__(self, index_path: Union[str, Path] = DEFAULT_INDEX_PATH):
+        self.path = Path(index_path)
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n_words, n_postings, n_methods, _, blob_bytes = HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} ist kein Ez Chajim Gematria-Index")
+
+        self.methods = INDEX_METHODS[:n_methods]
+        self._n_words = n_words
+        self._arrays = {}
+        for name, (offset, dtype, count) in _sections(n_words, n_postings, n_methods).items():
+            if name == 'blob':
+                self._blob_start = offset
+                continue
+            self._arrays[name] = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+        self._values = self._arrays['values'].reshape(n_words, n_methods)
+
+    def __len__(self) -> int:
+        return self._n_words
+
+    def __contains__(self, word: str) -> bool:
+        return self.lookup(word) is not None
+
+    def __enter__(self) -> 'GematriaIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Gibt Arrays, mmap und Datei frei"""
+        # Arrays zuerst: sie halten Verweise auf den mmap-Puffer
+        self._arrays = {}
+        self._values = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def word(self, word_id: int) -> str:
+        """Wort zu einer Wort-ID"""
+        offsets = self._arrays['word_offsets']
+        start = self._blob_start + int(offsets[word_id])
+        end = self._blob_start + int(offsets[word_id + 1])
+        return self._mmap[start:end].decode('utf-8')
+
+    def lookup(self, word: str) -> Optional[int]:
+        """Wort-ID per Binärsuche im Blob (None = nicht im Corpus)"""
+        raw = word.encode('utf-8')
+        offsets = self._arrays['word_offsets']
+        blob = self._blob_start
+
+        lo, hi = 0, self._n_words
+        while lo < hi:
+            mid = (lo + hi) // 2
+            candidate = self._mmap[blob + int(offsets[mid]):blob + int(offsets[mid + 1])]
+            if candidate < raw:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n_words and self.word(lo) == word:
+            return lo
+        return None
+
+    def values(self, word: str) -> Optional[Dict[str, int]]:
+        """Gematria-Werte eines Wortes"""
+        word_id = self.lookup(word)
+        if word_id is None:
+            return None
+        return dict(zip(self.methods, self._values[word_id].tolist()))
+
+    def postings(self, word: str) -> List[Tuple[int, int]]:
+        """Fundstellen (chunk_id, offset) eines Wortes"""
+        word_id = self.lookup(word)
+        if word_id is None:
+            return []
+        return self._postings(word_id)
+
+    def count(self, word: str) -> int:
+        """Anzahl Vorkommen im Corpus"""
+        word_id = self.lookup(word)
+        if word_id is None:
+            return 0
+        starts = self._arrays['posting_starts']
+        return int(starts[word_id + 1] - starts[word_id])
+
+    def words_with_value(self, value: int, method: str = 'standard') -> List[str]:
+        """Alle Wörter mit genau diesem Wert"""
+        return [word for word, _ in self.words_in_range(value, value, method)]
+
+    def words_in_range(self, low: int, high: int, method: str = 'standard') -> List[Tuple[str, int]]:
+        """Alle Wörter mit low <= wert <= high, nach Wert sortiert"""
+        order, sorted_values = self._method_arrays(method)
+        lo = int(np.searchsorted(sorted_values, low, side='left'))
+        hi = int(np.searchsorted(sorted_values, high, side='right'))
+        return [(self.word(int(word_id)), int(value))
+                for word_id, value in zip(order[lo:hi], sorted_values[lo:hi])]
+
+    def value_postings(self, value: int, method: str = 'standard') -> List[Tuple[str, int, int]]:
+        """Alle Fundstellen (wort, chunk_id, offset) von Wörtern mit diesem Wert"""
+        order, sorted_values = self._method_arrays(method)
+        lo = int(np.searchsorted(sorted_values, value, side='left'))
+        hi = int(np.searchsorted(sorted_values, value, side='right'))
+
+        result = []
+        for word_id in order[lo:hi].tolist():
+            word = self.word(word_id)
+            result.extend((word, chunk_id, offset) for chunk_id, offset in self._postings(word_id))
+        return result
+
+    def _method_arrays(self, method: str) -> Tuple[np.ndarray, np.ndarray]:
+        if method not in self.methods:
+            raise ValueError(f"Methode {method} nicht im Index (verfügbar: {', '.join(self.methods)})")
+        return self._arrays[f'order_{method}'], self._arrays[f'sorted_{method}']
+
+    def _postings(self, word_id: int) -> List[Tuple[int, int]]:
+        starts = self._arrays['posting_starts']
+        lo, hi = int(starts[word_id]), int(starts[word_id + 1])
+        return list(zip(self._arrays['posting_chunks'][lo:hi].tolist(),
+                        self._arrays['posting_offsets'][lo:hi].tolist()))
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Gematria-Index")
+    parser.add_argument('--index', default=str(DEFAULT_INDEX_PATH))
+    sub = parser.add_subparsers(dest='befehl', required=True)
+
+    build = sub.add_parser('build', help="Index aus dem Corpus bauen")
+    build.add_argument('--source', default=None, help="Corpus Pack oder Chunk-Verzeichnis")
+
+    value = sub.add_parser('value', help="Wörter mit gleichem Wert")
+    value.add_argument('wert', type=int)
+    value.add_argument('--method', default='standard', choices=INDEX_METHODS)
+    value.add_argument('--postings', action='store_true', help="Fundstellen ausgeben")
+
+    span = sub.add_parser('range', help="Wörter in einem Wertbereich")
+    span.add_argument('von', type=int)
+    span.add_argument('bis', type=int)
+    span.add_argument('--method', default='standard', choices=INDEX_METHODS)
+
+    word = sub.add_parser('word', help="Werte und Fundstellen eines Wortes")
+    word.add_argument('wort')
+
+    args = parser.parse_args()
+
+    if args.befehl == 'build':
+        stats = build_gematria_index(args.source, args.index)
+        print(f"✓ {stats['words']} Wörter, {stats['postings']} Fundstellen ({stats['bytes']} Bytes)")
+        print(f"  → {stats['index']}")
+    else:
+        with GematriaIndex(args.index) as index:
+            start = time.perf_counter()
+            if args.befehl == 'value':
+                if args.postings:
+                    results = index.value_postings(args.wert, args.method)
+                    for entry in results:
+                        print(f"  {entry[0]}  CHUNK_{entry[1]:04d} @ {entry[2]}")
+                else:
+                    results = index.words_with_value(args.wert, args.method)
+                    for entry in results:
+                        print(f"  {entry} ({index.count(entry)}x)")
+            elif args.befehl == 'range':
+                results = index.words_in_range(args.von, args.bis, args.method)
+                for entry, entry_value in results:
+                    print(f"  {entry_value}: {entry}")
+            else:
+                values = index.values(args.wort)
+                results = index.postings(args.wort)
+                if values is None:
+                    print(f"'{args.wort}' kommt im Corpus nicht vor")
+                else:
+                    print(f"{args.wort}: {values}, {len(results)} Fundstellen")
+                    for chunk_id, offset in results[:20]:
+                        print(f"  CHUNK_{chunk_id:04d} @ {offset}")
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"\n{len(results)} Treffer in {elapsed:.2f} ms")
+
+    print("\nQ!")
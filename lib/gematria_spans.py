@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gematria-Präfixsummen für Ez Chajim
+===================================
+
+Pro Chunk und Methode eine kumulierte Summe über die Zeichen:
+
+    P[0] = 0,  P[i] = Wert(text[:i])
+
+Damit ist die Gematria jedes Abschnitts text[start:end] eine Subtraktion
+P[end] - P[start], unabhängig von der Länge (span_gematria).
+
+Die Tabellen liegen neben dem Corpus Pack unter .cache/ und werden
+inkrementell neu gebaut: Chunks mit unverändertem sha256 übernehmen
+ihre Tabellen aus der alten Datei.
+
+Format (Little Endian):
+    Header:  magic (8) | chunks u32 | methoden u32 | elemente u64
+    Index:   chunks × (chunk_id u32 | start u64 | länge u32 | sha256 32 Bytes)
+    Daten:   je Methode elemente × i32 (pro Chunk länge + 1 Werte ab start)
+
+Positionen sind Zeichenpositionen im Chunk-Text (wie CorpusPack.get liefert).
+
+Stand: 5. Cheschwan 5787
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from analysis_cache import content_hash
+from corpus_pack import CACHE_DIR, Corpus, open_corpus
+from gematria_engine import METHODS, get_engine
+
+DEFAULT_SPANS_PATH = CACHE_DIR / 'gematria-spans.bin'
+
+SPANS_MAGIC = b'EZCSPN01'
+HEADER_STRUCT = struct.Struct('<8sIIQ')
+INDEX_STRUCT = struct.Struct('<IQI32s')
+
+
+def prefix_sums(text: str) -> np.ndarray:
+    """Präfixsummen aller Methoden für einen Text (Methoden × (len + 1))"""
+    engine = get_engine()
+    sums = np.zeros((len(METHODS), len(text) + 1), dtype=np.int64)
+    if text:
+        np.cumsum(engine.letter_values(engine.encode(text)), axis=1, out=sums[:, 1:])
+    return sums
+
+
+def build_span_tables(source: Optional[Union[str, Path, Corpus]] = None,
+                      spans_path: Union[str, Path] = DEFAULT_SPANS_PATH) -> Dict:
+    """
+    Baut die Präfixsummen-Tabellen (inkrementell über sha256)
+
+    Args:
+        source: Corpus Pack oder Chunk-Verzeichnis (None = Standard)
+        spans_path: Zieldatei (wird atomar ersetzt)
+
+    Returns:
+        Statistik-Dictionary mit neu berechneten und übernommenen Chunks
+    """
+    corpus = open_corpus(source)
+    spans_path = Path(spans_path)
+
+    previous = None
+    if spans_path.exists():
+        try:
+            previous = SpanTables(spans_path)
+        except ValueError:
+            previous = None
+
+    entries = []
+    blocks: List[np.ndarray] = []
+    rebuilt = reused = 0
+    start = 0
+    try:
+        for chunk_id in corpus.ids():
+            digest = content_hash(corpus.get_bytes(chunk_id))
+            block = previous.block(chunk_id, digest) if previous is not None else None
+            if block is None:
+                block = prefix_sums(corpus.get(chunk_id))
+                rebuilt += 1
+            else:
+                reused += 1
+
+            length = block.shape[1] - 1
+            entries.append((chunk_id, start, length, bytes.fromhex(digest)))
+            blocks.append(block)
+            start += length + 1
+    finally:
+        if previous is not None:
+            previous.close()
+
+    if start and max(int(block[:, -1].max()) for block in blocks) > np.iinfo(np.int32).max:
+        raise ValueError("Gematria-Summe eines Chunks sprengt int32")
+
+    spans_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = spans_path.with_name(spans_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER_STRUCT.pack(SPANS_MAGIC, len(entries), len(METHODS), start))
+        for entry in entries:
+            f.write(INDEX_STRUCT.pack(*entry))
+        for row in range(len(METHODS)):
+            for block in blocks:
+                f.write(block[row].astype('<i4').tobytes())
+    os.replace(tmp_path, spans_path)
+
+    return {
+        'spans': str(spans_path),
+        'chunks': len(entries),
+        'rebuilt': rebuilt,
+        'reused': reused,
+        'bytes': spans_path.stat().st_size
+    }
+
+
+class SpanTables:
+    """Lesezugriff auf die Präfixsummen via mmap"""
+
+    def __init__(self, spans_path: Union[str, Path] = DEFAULT_SPANS_PATH):
+        self.path = Path(spans_path)
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, n_methods, elements = HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != SPANS_MAGIC or n_methods != len(METHODS):
+            self.close()
+            raise ValueError(f"{self.path} ist keine passende Gematria-Präfixsummen-Datei")
+
+        index_start = HEADER_STRUCT.size
+        data_start = index_start + count * INDEX_STRUCT.size
+
+        # chunk_id → (start, länge, sha256)
+        self._chunks: Dict[int, Tuple[int, int, str]] = {}
+        for chunk_id, start, length, digest in INDEX_STRUCT.iter_unpack(
+                self._mmap[index_start:data_start]):
+            self._chunks[chunk_id] = (start, length, digest.hex())
+
+        self._data = np.frombuffer(self._mmap, dtype='<i4', count=len(METHODS) * elements,
+                                   offset=data_start).reshape(len(METHODS), elements)
+        self._rows = {method: row for row, method in enumerate(METHODS)}
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def __contains__(self, chunk_id: int) -> bool:
+        return chunk_id in self._chunks
+
+    def __enter__(self) -> 'SpanTables':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Gibt Array, mmap und Datei frei"""
+        # Array zuerst: es hält einen Verweis auf den mmap-Puffer
+        self._data = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def ids(self) -> List[int]:
+        return sorted(self._chunks)
+
+    def length(self, chunk_id: int) -> int:
+        """Zeichenanzahl eines Chunks"""
+        return self._entry(chunk_id)[1]
+
+    def digest(self, chunk_id: int) -> str:
+        """sha256 des Chunk-Inhalts, für den die Tabelle gebaut wurde"""
+        return self._entry(chunk_id)[2]
+
+    def span_gematria(self, chunk_id: int, start: int, end: int, method: str = 'standard') -> int:
+        """
+        Gematria von text[start:end] eines Chunks in O(1)
+
+        Args:
+            chunk_id: Chunk-ID
+            start, end: Zeichenpositionen, 0 <= start <= end <= Länge
+            method: standard, small, full oder ordinal
+        """
+        base, length, _ = self._entry(chunk_id)
+        if not 0 <= start <= end <= length:
+            raise ValueError(f"Ungültiger Abschnitt {start}:{end} für Chunk {chunk_id} (Länge {length})")
+        row = self._rows.get(method)
+        if row is None:
+            raise ValueError(f"Unbekannte Gematria-Methode: {method}")
+        prefix = self._data[row]
+        return int(prefix[base + end]) - int(prefix[base + start])
+
+    def block(self, chunk_id: int, digest: Optional[str] = None) -> Optional[np.ndarray]:
+        """
+        Kopie der Präfixsummen eines Chunks (Methoden × (Länge + 1))
+
+        Mit digest nur, wenn der Chunk-Inhalt unverändert ist.
+        """
+        entry = self._chunks.get(chunk_id)
+        if entry is None or (digest is not None and entry[2] != digest):
+            return None
+        base, length, _ = entry
+        return self._data[:, base:base + length + 1].astype(np.int64)
+
+    def _entry(self, chunk_id: int) -> Tuple[int, int, str]:
+        entry = self._chunks.get(chunk_id)
+        if entry is None:
+            raise KeyError(f"Chunk {chunk_id} nicht in den Präfixsummen")
+        return entry
+
+
+_default_tables: Optional[SpanTables] = None
+
+
+def span_gematria(chunk_id: int, start: int, end: int, method: str = 'standard') -> int:
+    """span_gematria über die Standard-Tabellen (.cache/gematria-spans.bin)"""
+    global _default_tables
+    if _default_tables is None:
+        _default_tables = SpanTables(DEFAULT_SPANS_PATH)
+    return _default_tables.span_gematria(chunk_id, start, end, method)
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Gematria-Präfixsummen")
+    parser.add_argument('--spans', default=str(DEFAULT_SPANS_PATH))
+    sub = parser.add_subparsers(dest='befehl', required=True)
+
+    build = sub.add_parser('build', help="Tabellen (inkrementell) bauen")
+    build.add_argument('--source', default=None, help="Corpus Pack oder Chunk-Verzeichnis")
+
+    span = sub.add_parser('span', help="Gematria eines Abschnitts")
+    span.add_argument('chunk_id', type=int)
+    span.add_argument('start', type=int)
+    span.add_argument('end', type=int)
+    span.add_argument('--method', default='standard', choices=METHODS)
+
+    args = parser.parse_args()
+
+    if args.befehl == 'build':
+        stats = build_span_tables(args.source, args.spans)
+        print(f"✓ {stats['chunks']} Chunks ({stats['rebuilt']} neu, {stats['reused']} übernommen)")
+        print(f"  → {stats['spans']} ({stats['bytes']} Bytes)")
+    else:
+        with SpanTables(args.spans) as tables, open_corpus() as corpus:
+            value = tables.span_gematria(args.chunk_id, args.start, args.end, args.method)
+            text = corpus.get(args.chunk_id)[args.start:args.end]
+            print(f"CHUNK_{args.chunk_id:04d} [{args.start}:{args.end}] {args.method}: {value}")
+            print(f"  {text}")
+
+    print("\nQ!")
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kalender-Schicht für HNS10
+==========================
+
+Eine Umrechnung pro Tag statt mehrerer Bibliotheksaufrufe pro Stempel:
+
+    • Datumstabellen: für einen Bereich hebräischer Jahre (Standard
+      5700–5900) werden beim ersten Zugriff dichte Arrays aufgebaut,
+      ein Eintrag pro gregorianischem Tag (hebräisch und islamisch).
+      Aufgebaut wird monatsweise, die Bibliotheken laufen nur einmal
+      pro Monat, nicht pro Tag.
+    • Außerhalb des Bereichs: Umrechnung über pyluach/hijri_converter,
+      gemerkt in einem begrenzten LRU-Cache.
+
+day_info(tag) liefert alle Felder für Spiralposition und Drei-Kalender-
+Stempel; ein Tabellenzugriff ist ein Array-Index.
+
+Islamische Daten gibt es nur im Umm-al-Qura-Bereich von hijri_converter
+(1924–2077); außerhalb sind die islamischen Felder None.
+
+numpy, pyluach und hijri_converter werden erst beim ersten Gebrauch
+importiert, der Import dieses Moduls bleibt billig.
+
+Stand: 5. Cheschwan 5787
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+
+DEFAULT_YEAR_RANGE = (5700, 5900)
+
+# Größe des LRU-Caches für Tage außerhalb der Tabellen
+DAY_CACHE_SIZE = 4096
+
+# pyluach-Monatsnummern: Nissan = 1 … Tischri = 7, Adar II = 13
+TISHREI = 7
+
+
+class DayInfo(NamedTuple):
+    """Ein gregorianischer Tag in hebräischer und islamischer Zählung"""
+    hebrew_year: int
+    hebrew_month: int
+    hebrew_day: int
+    hebrew_day_of_year: int   # 1 = 1. Tischri
+    hebrew_leap: bool
+    islamic_year: Optional[int] = None
+    islamic_month: Optional[int] = None
+    islamic_day: Optional[int] = None
+
+    @property
+    def hebrew_month_name(self) -> str:
+        return hebrew_month_name(self.hebrew_month, self.hebrew_leap)
+
+    @property
+    def islamic_month_name(self) -> Optional[str]:
+        if self.islamic_month is None:
+            return None
+        return islamic_month_name(self.islamic_month)
+
+    def hebrew_string(self) -> str:
+        """z.B. '20. Tammuz 5785'"""
+        return f"{self.hebrew_day}. {self.hebrew_month_name} {self.hebrew_year}"
+
+    def islamic_string(self) -> str:
+        """z.B. '21. Muharram 1447' (OverflowError außerhalb des Umm-al-Qura-Bereichs)"""
+        if self.islamic_year is None:
+            raise OverflowError("date out of range")
+        return f"{self.islamic_day}. {self.islamic_month_name} {self.islamic_year}"
+
+
+# Hilfsfunktionen
+
+@lru_cache(maxsize=None)
+def hebrew_month_name(month: int, leap: bool) -> str:
+    """Monatsname wie pyluach (Adar / Adar 1 / Adar 2)"""
+    from pyluach import dates
+
+    # 5784 ist ein Schaltjahr, 5785 nicht
+    return dates.HebrewDate(5784 if leap else 5785, month, 1).month_name()
+
+
+@lru_cache(maxsize=None)
+def islamic_month_name(month: int) -> str:
+    from hijri_converter import convert
+
+    return convert.Hijri(1446, month, 1).month_name()
+
+
+@lru_cache(maxsize=DAY_CACHE_SIZE)
+def convert_day(day: date) -> DayInfo:
+    """Umrechnung über die Bibliotheken (gemerkt)"""
+    from hijri_converter import convert
+    from pyluach import dates, hebrewcal
+
+    hebrew = dates.HebrewDate.from_pydate(day)
+    new_year = dates.HebrewDate(hebrew.year, TISHREI, 1)
+    day_of_year = (hebrew - new_year) + 1
+
+    islamic: Tuple[Optional[int], ...] = (None, None, None)
+    try:
+        hijri = convert.Gregorian(day.year, day.month, day.day).to_hijri()
+        islamic = (hijri.year, hijri.month, hijri.day)
+    except OverflowError:
+        pass
+
+    return DayInfo(hebrew.year, hebrew.month, hebrew.day, int(day_of_year),
+                   hebrewcal.Year(hebrew.year).leap, *islamic)
+
+
+class CalendarTables:
+    """Dichte Datumstabellen für einen Bereich hebräischer Jahre"""
+
+    def __init__(self, first_year: int = DEFAULT_YEAR_RANGE[0],
+                 last_year: int = DEFAULT_YEAR_RANGE[1]):
+        if first_year > last_year:
+            raise ValueError(f"Ungültiger Jahresbereich {first_year}–{last_year}")
+        import numpy as np
+        from pyluach import dates
+
+        self.first_year = first_year
+        self.last_year = last_year
+
+        # Tabellenbereich: 1. Tischri first_year bis Ende Elul last_year
+        self.first_ordinal = dates.HebrewDate(first_year, TISHREI, 1).to_pydate().toordinal()
+        end_ordinal = dates.HebrewDate(last_year + 1, TISHREI, 1).to_pydate().toordinal()
+        size = end_ordinal - self.first_ordinal
+
+        self._hebrew_year = np.zeros(size, dtype=np.int16)
+        self._hebrew_month = np.zeros(size, dtype=np.int8)
+        self._hebrew_day = np.zeros(size, dtype=np.int8)
+        self._day_of_year = np.zeros(size, dtype=np.int16)
+        self._leap: Dict[int, bool] = {}
+        self._islamic_year = np.zeros(size, dtype=np.int16)  # 0 = außerhalb
+        self._islamic_month = np.zeros(size, dtype=np.int8)
+        self._islamic_day = np.zeros(size, dtype=np.int8)
+
+        self._fill_hebrew()
+        self._fill_islamic(size)
+
+        # Eine Zeile pro Tag: ein Index + tolist() statt sieben Array-Zugriffe
+        self._rows = np.stack([
+            self._hebrew_year, self._hebrew_month, self._hebrew_day, self._day_of_year,
+            self._islamic_year, self._islamic_month, self._islamic_day
+        ], axis=1).astype(np.int32)
+
+    def _fill_hebrew(self) -> None:
+        import numpy as np
+        from pyluach import hebrewcal
+
+        pos = 0
+        for year in range(self.first_year, self.last_year + 1):
+            calendar_year = hebrewcal.Year(year)
+            self._leap[year] = calendar_year.leap
+            year_start = pos
+            for month in calendar_year.itermonths():
+                length = len(month)
+                self._hebrew_year[pos:pos + length] = year
+                self._hebrew_month[pos:pos + length] = month.month
+                self._hebrew_day[pos:pos + length] = np.arange(1, length + 1)
+                pos += length
+            self._day_of_year[year_start:pos] = np.arange(1, pos - year_start + 1)
+
+    def _fill_islamic(self, size: int) -> None:
+        import numpy as np
+        from hijri_converter import convert, ummalqura
+
+        # Nur im Umm-al-Qura-Bereich der Bibliothek
+        first_supported = date(*ummalqura.GREGORIAN_RANGE[0]).toordinal()
+        pos = max(0, first_supported - self.first_ordinal)
+        if pos >= size:
+            return
+        day = date.fromordinal(self.first_ordinal + pos)
+        try:
+            hijri = convert.Gregorian(day.year, day.month, day.day).to_hijri()
+        except OverflowError:
+            return
+
+        year, month, first_day = hijri.year, hijri.month, hijri.day
+        while pos < size:
+            try:
+                length = convert.Hijri(year, month, 1).month_length()
+            except OverflowError:
+                return
+            count = min(length - first_day + 1, size - pos)
+            self._islamic_year[pos:pos + count] = year
+            self._islamic_month[pos:pos + count] = month
+            self._islamic_day[pos:pos + count] = np.arange(first_day, first_day + count)
+            pos += count
+            first_day = 1
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, day: date) -> bool:
+        return 0 <= day.toordinal() - self.first_ordinal < len(self._rows)
+
+    def get(self, day: date) -> Optional[DayInfo]:
+        """Tabellen-Eintrag (None außerhalb des Bereichs)"""
+        index = day.toordinal() - self.first_ordinal
+        if not 0 <= index < len(self._rows):
+            return None
+        year, month, day_of_month, day_of_year, islamic_year, islamic_month, islamic_day = \
+            self._rows[index].tolist()
+        if not islamic_year:
+            return DayInfo(year, month, day_of_month, day_of_year, self._leap[year])
+        return DayInfo(year, month, day_of_month, day_of_year, self._leap[year],
+                       islamic_year, islamic_month, islamic_day)
+
+
+_tables: Optional[CalendarTables] = None
+_year_range: Tuple[int, int] = DEFAULT_YEAR_RANGE
+
+
+def set_year_range(first_year: int, last_year: int) -> None:
+    """Ändert den Tabellenbereich (Aufbau beim nächsten Zugriff)"""
+    global _tables, _year_range
+    _year_range = (first_year, last_year)
+    _tables = None
+
+
+def get_tables() -> CalendarTables:
+    """Gemeinsame Tabellen, beim ersten Zugriff aufgebaut"""
+    global _tables
+    if _tables is None:
+        _tables = CalendarTables(*_year_range)
+    return _tables
+
+
+def day_info(day: date) -> DayInfo:
+    """Kalenderdaten eines Tages: Tabelle, sonst LRU-Cache"""
+    info = get_tables().get(day)
+    return info if info is not None else convert_day(day)
+
+
+# Demo
+if __name__ == "__main__":
+    import time
+    from datetime import timedelta
+
+    print("=== HNS10 Kalender-Schicht Demo ===\n")
+
+    start = time.perf_counter()
+    tables = get_tables()
+    print(f"Tabellen {tables.first_year}–{tables.last_year}: "
+          f"{len(tables)} Tage in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    today = date.today()
+    info = day_info(today)
+    print(f"Heute: {info.hebrew_string()} / {info.islamic_string()}")
+
+    days = [today + timedelta(days=i) for i in range(10000)]
+    start = time.perf_counter()
+    for day in days:
+        day_info(day)
+    table_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for day in days:
+        convert_day.__wrapped__(day)
+    library_time = time.perf_counter() - start
+    print(f"10000 Tage: Tabelle {table_time * 1000:.1f} ms, Bibliotheken {library_time * 1000:.1f} ms")
+
+    print("\nQ!")
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HNS10 Zahlen für Ez Chajim
+==========================
+
+Hebräische Zahlzeichen in beide Richtungen, tabellengetrieben:
+
+    • encode / encode_many   Zahl → Zahlzeichen (Tabelle für 1–9999,
+                             ein Listenzugriff statt Aufbau pro Aufruf)
+    • decode / decode_many   Zahlzeichen → Zahl, z.B. aus Überschriften
+                             wie פרק י"ג oder שער ל"ט
+
+Schreibweise wie bisher in HNS10SpiralSystem.hebrew_to_hns10:
+Hunderter, Zehner, Einer; 15 = טו, 16 = טז; Tausender als Zahl mit
+nachgestelltem Geresch (5785 = ה'תשפה). 500–900 als ת + Rest (תק … תתק).
+
+Der Decoder ist tolerant:
+    • Geresch (' ׳ ’) und Gerschajim (" ״ ” oder '') an beliebiger Stelle
+    • Schlussbuchstaben (ך ם ן ף ץ) mit dem Wert des Grundbuchstabens
+    • Reihenfolge der Buchstaben wird nicht geprüft
+Ein Geresch zwischen zwei Buchstaben trennt die Tausender ab, am Ende
+markiert er nur das Zahlzeichen (ג' = 3). Volle Tausender (א' = 1000)
+sind damit nicht von Einern zu unterscheiden und werden als Einer gelesen.
+
+0 bleibt verboten (Null-Tabu, ValueError).
+
+Stand: 5. Cheschwan 5787
+"""
+
+from typing import Iterable, List, Optional
+
+HEBREW_NUMERALS = {
+    1: 'א', 2: 'ב', 3: 'ג', 4: 'ד', 5: 'ה',
+    6: 'ו', 7: 'ז', 8: 'ח', 9: 'ט', 10: 'י',
+    20: 'כ', 30: 'ל', 40: 'מ', 50: 'נ', 60: 'ס',
+    70: 'ע', 80: 'פ', 90: 'צ', 100: 'ק', 200: 'ר',
+    300: 'ש', 400: 'ת'
+}
+
+# Null-Tabu: Grad 0 ist verboten
+NULL_TABU_MESSAGE = "⚠️ NULL-TABU: Grad 0 ist im HNS10 verboten!"
+
+# Größte Zahl in der Tabelle
+TABLE_LIMIT = 9999
+
+GERESH = "'׳’"
+GERSHAYIM = '"״”'
+
+# Gerschajim und Leerzeichen zählen beim Lesen nicht
+IGNORED = GERSHAYIM + ' \t\n\r\xa0'
+
+FINAL_LETTERS = {'ך': 20, 'ם': 40, 'ן': 50, 'ף': 80, 'ץ': 90}
+
+LETTER_VALUES = {letter: value for value, letter in HEBREW_NUMERALS.items()}
+LETTER_VALUES.update(FINAL_LETTERS)
+
+# Zeichenarten für decode_many (Reihenfolge: alles über _SEPARATOR zählt)
+_UNKNOWN, _IGNORED, _SEPARATOR, _MINUS, _GERESH, _LETTER = range(6)
+
+_table: Optional[List[str]] = None
+_table_array = None
+_lookups = None
+
+
+# Hilfsfunktionen
+
+def _below_thousand(value: int) -> str:
+    """1–999 → Zahlzeichen (Hunderter, Zehner, Einer)"""
+    result = 'ת' * (value // 400)
+    hundreds = value % 400 // 100 * 100
+    if hundreds:
+        result += HEBREW_NUMERALS[hundreds]
+    value %= 100
+
+    if value == 15:
+        return result + 'טו'
+    if value == 16:
+        return result + 'טז'
+    if value >= 10:
+        result += HEBREW_NUMERALS[value // 10 * 10]
+        value %= 10
+    if value:
+        result += HEBREW_NUMERALS[value]
+    return result
+
+
+def get_table() -> List[str]:
+    """Zahlzeichen für 0–9999 (Index 0 = leer), beim ersten Zugriff aufgebaut"""
+    global _table
+    if _table is None:
+        table = [''] + [_below_thousand(value) for value in range(1, 1000)]
+        for thousands in range(1, 10):
+            prefix = table[thousands] + "'"
+            table.extend(prefix + table[rest] for rest in range(1000))
+        _table = table
+    return _table
+
+
+def encode(value: int) -> str:
+    """Zahl → HNS10-Zahlzeichen (ValueError bei 0)"""
+    if value == 0:
+        raise ValueError(NULL_TABU_MESSAGE)
+    if value < 0:
+        return f"-{encode(-value)}"
+    table = get_table()
+    if value <= TABLE_LIMIT:
+        return table[value]
+    # Tausender über 9 rekursiv, wie bisher
+    return encode(value // 1000) + "'" + table[value % 1000]
+
+
+def encode_many(values: Iterable[int]) -> List[str]:
+    """
+    Bulk-API: viele Zahlen auf einmal (ein Array-Index für 1–9999)
+
+    Raises:
+        ValueError: wenn eine 0 dabei ist (Null-Tabu)
+    """
+    global _table_array
+    import numpy as np
+
+    values = np.asarray(values if hasattr(values, '__len__') else list(values), dtype=np.int64)
+    if not values.size:
+        return []
+    if not values.all():
+        raise ValueError(NULL_TABU_MESSAGE)
+
+    if _table_array is None:
+        _table_array = np.array(get_table(), dtype=object)
+    if values.min() >= 1 and values.max() <= TABLE_LIMIT:
+        return _table_array[values].tolist()
+    return [encode(value) for value in values.tolist()]
+
+
+def decode(text: str) -> int:
+    """
+    HNS10-Zahlzeichen → Zahl
+
+    Raises:
+        ValueError: bei Zeichen, die kein Zahlzeichen sind, oder leerem Wert
+    """
+    numeral = text.replace("''", '"')
+    sign = 1
+    total = current = 0
+    previous = ''
+    for i, char in enumerate(numeral):
+        value = LETTER_VALUES.get(char)
+        if value:
+            current += value
+        elif char in GERESH:
+            # Geresch zwischen zwei Buchstaben: Tausender-Trenner
+            if previous in LETTER_VALUES and numeral[i + 1:i + 2] in LETTER_VALUES:
+                total = (total + current) * 1000
+                current = 0
+        elif char == '-' and sign == 1 and not numeral[:i].strip(IGNORED):
+            sign = -1
+        elif char not in IGNORED:
+            raise ValueError(f"Keine HNS10-Zahl: {text!r}")
+        previous = char
+
+    total += current
+    if not total:
+        raise ValueError(f"Keine HNS10-Zahl: {text!r}")
+    return sign * total
+
+
+def _lookup_tables():
+    """(Werte, Zeichenarten) pro Codepoint bis zum höchsten bekannten Zeichen"""
+    global _lookups
+    if _lookups is None:
+        import numpy as np
+
+        known = {char: _GERESH for char in GERESH}
+        known.update((char, _IGNORED) for char in IGNORED)
+        known.update((letter, _LETTER) for letter in LETTER_VALUES)
+        known['-'] = _MINUS
+        known['\0'] = _SEPARATOR
+
+        # Letzte Spalte: alle Codepoints darüber (unbekannt)
+        size = max(map(ord, known)) + 2
+        values = np.zeros(size, dtype=np.int64)
+        kinds = np.full(size, _UNKNOWN, dtype=np.int8)
+        for char, kind in known.items():
+            kinds[ord(char)] = kind
+        for letter, value in LETTER_VALUES.items():
+            values[ord(letter)] = value
+        _lookups = (values, kinds)
+    return _lookups
+
+
+def decode_many(texts: Iterable[str], invalid: Optional[int] = None):
+    """
+    Bulk-API: viele Zahlzeichen in einem NumPy-Durchlauf
+
+    Alle Texte werden zu einem Codepoint-Array verbunden (NUL als Trenner);
+    Buchstabenwerte, Tausender-Trenner und Summen pro Text entstehen ohne
+    Python-Schleife über die Texte.
+
+    Args:
+        texts: Zahlzeichen (z.B. letzte Wörter von Überschriften)
+        invalid: Wert für ungültige Texte (None = ValueError)
+
+    Returns:
+        int64-Array, ein Wert pro Text
+    """
+    import numpy as np
+
+    originals = texts if isinstance(texts, list) else list(texts)
+    count = len(originals)
+    if not count:
+        return np.zeros(0, dtype=np.int64)
+
+    joined = '\0'.join(originals).replace("''", '"')
+    if not joined:
+        if invalid is None:
+            raise ValueError(f"Keine HNS10-Zahl: {originals[0]!r}")
+        return np.full(count, invalid, dtype=np.int64)
+    codepoints = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+    values, kinds = _lookup_tables()
+    columns = np.minimum(codepoints, np.uint32(len(kinds) - 1))
+    values = values[columns]
+    kinds = kinds[columns]
+
+    is_separator = kinds == _SEPARATOR
+    segment = np.cumsum(is_separator, dtype=np.int32)
+    boundaries = np.flatnonzero(is_separator)
+    starts = np.concatenate(([0], boundaries + 1))
+    ends = np.concatenate((boundaries, [len(codepoints)]))
+
+    # Minus: erstes Zeichen (nach Leerzeichen/Gerschajim) eines Textes
+    significant = kinds > _SEPARATOR
+    before = np.cumsum(significant, dtype=np.int32) - significant
+    is_sign = (kinds == _MINUS) & (before == np.append(before, 0)[starts][segment])
+    unknown = (kinds == _UNKNOWN) | ((kinds == _MINUS) & ~is_sign)
+
+    # Tausender-Trenner: Geresch mit Buchstaben direkt davor und danach
+    # (NUL ist kein Buchstabe, Nachbarn anderer Texte zählen also nicht)
+    is_letter = kinds == _LETTER
+    separator = kinds == _GERESH
+    separator[1:] &= is_letter[:-1]
+    separator[:-1] &= is_letter[1:]
+    separator[-1] = False
+
+    weighted = values
+    if separator.any():
+        # Jeder Buchstabe × 1000 pro Trenner, der im selben Text noch folgt
+        # (leere Texte haben keine Buchstaben, ihr Wert wird auf 0 begrenzt)
+        marks = np.cumsum(separator, dtype=np.int32)
+        later = np.maximum(marks[ends - 1][segment] - marks, 0)
+        weighted = values * np.power(1000, later, dtype=np.int64)
+
+    # Summe pro Text: reduceat über die Textanfänge (NUL hat Wert 0)
+    totals = np.add.reduceat(np.concatenate((weighted, [0])), starts)
+    totals[ends == starts] = 0
+    totals[np.bincount(segment[is_sign], minlength=count) > 0] *= -1
+
+    bad = (np.bincount(segment[unknown], minlength=count) > 0) | (totals == 0)
+    if bad.any():
+        if invalid is None:
+            raise ValueError(f"Keine HNS10-Zahl: {originals[int(np.argmax(bad))]!r}")
+        totals[bad] = invalid
+    return totals
+
+
+# Demo
+if __name__ == "__main__":
+    import time
+
+    import numpy as np
+
+    print("=== HNS10 Zahlen Demo ===\n")
+
+    for value in (1, 15, 16, 115, 613, 999, 5785):
+        print(f"  {value} → {encode(value)}")
+    for heading in ('פרק י"ג', 'שער ל"ט', "דרוש א'", 'שער מ״ב'):
+        print(f"  {heading} → {decode(heading.split()[-1])}")
+
+    numbers = np.tile(np.arange(1, TABLE_LIMIT + 1), 10)
+    start = time.perf_counter()
+    numerals = encode_many(numbers)
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed = decode_many(numerals)
+    decode_time = time.perf_counter() - start
+    print(f"\n{len(numbers)} Zahlen: encode_many {encode_time * 1000:.1f} ms, "
+          f"decode_many {decode_time * 1000:.1f} ms")
+
+    print("\nQ!")
@@ -11,25 +11,15 @@ Stand: 20. Tammus 5785
 WWAQ-konform
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, Tuple, List, Optional, Union
-import pyluach
-from hijri_converter import convert
 import math
 import json
 from dataclasses import dataclass
 
-# HNS10 Konstanten
-HEBREW_NUMERALS = {
-    1: 'א', 2: 'ב', 3: 'ג', 4: 'ד', 5: 'ה',
-    6: 'ו', 7: 'ז', 8: 'ח', 9: 'ט', 10: 'י',
-    20: 'כ', 30: 'ל', 40: 'מ', 50: 'נ', 60: 'ס',
-    70: 'ע', 80: 'פ', 90: 'צ', 100: 'ק', 200: 'ר',
-    300: 'ש', 400: 'ת'
-}
-
-# Null-Tabu: Grad 0 ist verboten
-NULL_TABU_MESSAGE = "⚠️ NULL-TABU: Grad 0 ist im HNS10 verboten!"
+# pyluach, hijri_converter und numpy (Gematria-Engine) erst beim ersten Gebrauch
+from hns10_calendar import DayInfo, day_info
+from hns10_numerals import HEBREW_NUMERALS, NULL_TABU_MESSAGE, decode as decode_hns10, encode as encode_hns10
 
 # Spiralzeit-Konstanten
 SPIRAL_SEGMENTS = {
@@ -58,75 +48,73 @@ class HNS10SpiralSystem:
     """Hauptklasse für das HNS10 Spiralsystem"""
     
     def __init__(self):
-        self.current_hebrew_date = pyluach.HebrewDate.today()
-        self.omer_count = self._calculate_omer()
+        # Heutiges Datum und Omer: beim ersten Zugriff berechnet,
+        # nach einem Datumswechsel neu
+        self._today: Optional[date] = None
+        self._current_hebrew_date = None
+        self._omer_count: Optional[int] = None
+    
+    def _refresh_today(self) -> None:
+        """Berechnet Datum und Omer neu, wenn sich der Tag geändert hat"""
+        today = date.today()
+        if today != self._today:
+            from pyluach import dates
+            self._current_hebrew_date = dates.HebrewDate.from_pydate(today)
+            self._omer_count = self._calculate_omer(self._current_hebrew_date)
+            self._today = today
     
-    def _calculate_omer(self) -> Optional[int]:
-        """Berechnet aktuellen Omer-Tag (1-49)"""
-        today = pyluach.today()
-        pesach_16 = pyluach.HebrewDate(today.year, 1, 16)
-        shavuot = pyluach.HebrewDate(today.year, 3, 6)
+    @property
+    def current_hebrew_date(self):
+        """Heutiges hebräisches Datum (pyluach HebrewDate)"""
+        self._refresh_today()
+        return self._current_hebrew_date
+    
+    @property
+    def omer_count(self) -> Optional[int]:
+        """Heutiger Omer-Tag (1-49) oder None"""
+        self._refresh_today()
+        return self._omer_count
+    
+    def _calculate_omer(self, today=None) -> Optional[int]:
+        """Berechnet Omer-Tag (1-49) für ein hebräisches Datum (Standard: heute)"""
+        from pyluach import dates
+        
+        if today is None:
+            today = dates.HebrewDate.today()
+        pesach_16 = dates.HebrewDate(today.year, 1, 16)
+        shavuot = dates.HebrewDate(today.year, 3, 6)
         
-        if pesach_16 <= today <= shavuot:
-            return (today - pesach_16).days + 1
+        # 16. Nissan bis 5. Siwan = Tag 1-49, Schawuot selbst zählt nicht mehr
+        if pesach_16 <= today < shavuot:
+            return (today - pesach_16) + 1
         return None
     
     def hebrew_to_hns10(self, value: int) -> str:
         """Konvertiert Zahl zu hebräischen Buchstaben (HNS10)"""
-        if value == 0:
-            raise ValueError(NULL_TABU_MESSAGE)
-        
-        if value < 0:
-            return f"-{self.hebrew_to_hns10(abs(value))}"
-        
-        result = []
-        
-        # Tausender
-        thousands = value // 1000
-        if thousands > 0:
-            result.append(self.hebrew_to_hns10(thousands))
-            result.append("'")
-            value %= 1000
-        
-        # Hunderter
-        hundreds = value // 100
-        if hundreds > 0:
-            result.append(HEBREW_NUMERALS[hundreds * 100])
-            value %= 100
-        
-        # Zehner und Einer
-        if value >= 10:
-            if value == 15:
-                result.extend(['ט', 'ו'])
-            elif value == 16:
-                result.extend(['ט', 'ז'])
-            else:
-                tens = (value // 10) * 10
-                ones = value % 10
-                result.append(HEBREW_NUMERALS[tens])
-                if ones > 0:
-                    result.append(HEBREW_NUMERALS[ones])
-        elif value > 0:
-            result.append(HEBREW_NUMERALS[value])
-        
-        return ''.join(result)
+        return encode_hns10(value)
+    
+    def hns10_to_int(self, numeral: str) -> int:
+        """Liest hebräische Zahlzeichen (mit Geresch/Gerschajim) als Zahl"""
+        return decode_hns10(numeral)
     
     def calculate_spiral_position(self, date: datetime) -> SpiralCoordinate:
         """Berechnet Spiralposition für gegebenes Datum"""
-        hebrew_date = pyluach.from_pydate(date)
-        
+        return self._spiral_from_day(day_info(date.date()), date)
+    
+    def _spiral_from_day(self, info: DayInfo, date: datetime) -> SpiralCoordinate:
+        """Spiralposition aus bereits umgerechneten Kalenderdaten"""
         # Windung = Jahr
-        windung = hebrew_date.year
+        windung = info.hebrew_year
         
         # Segment = Monat
-        segment = hebrew_date.month
+        segment = info.hebrew_month
         
         # Punkt = Tag + Stunde als Dezimal
-        punkt = hebrew_date.day + (date.hour / 24.0)
+        punkt = info.hebrew_day + (date.hour / 24.0)
         
         # Grad berechnen (Spiralwinkel, nie 0)
-        total_days = hebrew_date.day_of_year
-        year_days = 354 if not hebrew_date.is_leap_year else 384
+        total_days = info.hebrew_day_of_year
+        year_days = 354 if not info.hebrew_leap else 384
         grad = int((total_days / year_days) * 360)
         
         # Null-Tabu beachten
@@ -137,22 +125,17 @@ class HNS10SpiralSystem:
     
     def get_three_calendars(self, date: datetime) -> Dict[str, str]:
         """Gibt Datum in drei Kalendersystemen zurück"""
-        # Hebräisch
-        hebrew = pyluach.from_pydate(date)
-        hebrew_str = f"{hebrew.day}. {hebrew.month_name()} {hebrew.year}"
-        
-        # Islamisch
-        islamic = convert.Gregorian(date.year, date.month, date.day).to_hijri()
-        islamic_str = f"{islamic.day}. {islamic.month_name()} {islamic.year}"
+        # Eine Umrechnung (Tabelle oder LRU) für alle Angaben
+        info = day_info(date.date())
         
         # Solar (Gregorianisch)
         solar_str = date.strftime("%d. %B %Y")
         
         return {
-            'hebrew': hebrew_str,
-            'islamic': islamic_str,
+            'hebrew': info.hebrew_string(),
+            'islamic': info.islamic_string(),
             'solar': solar_str,
-            'spiral': self.calculate_spiral_position(date).to_string()
+            'spiral': self._spiral_from_day(info, date).to_string()
         }
     
     def create_frage_antwort_lade(self, question: str, answer: str) -> Dict:
@@ -175,21 +158,8 @@ class HNS10SpiralSystem:
     
     def calculate_gematria(self, text: str) -> int:
         """Berechnet Gematria-Wert eines hebräischen Textes"""
-        gematria_values = {
-            'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5,
-            'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
-            'כ': 20, 'ך': 20, 'ל': 30, 'מ': 40, 'ם': 40,
-            'נ': 50, 'ן': 50, 'ס': 60, 'ע': 70, 'פ': 80,
-            'ף': 80, 'צ': 90, 'ץ': 90, 'ק': 100, 'ר': 200,
-            'ש': 300, 'ת': 400
-        }
-        
-        total = 0
-        for char in text:
-            if char in gematria_values:
-                total += gematria_values[char]
-        
-        return total
+        from gematria_engine import get_engine as get_gematria_engine
+        return get_gematria_engine().value(text)
     
     def generate_omer_path(self, day: int) -> Dict:
         """Generiert Studienpfad für Omer-Tag"""
@@ -255,9 +225,18 @@ def create_system() -> HNS10SpiralSystem:
     """Factory-Funktion für HNS10-System"""
     return HNS10SpiralSystem()
 
+_default_system: Optional[HNS10SpiralSystem] = None
+
+def get_system() -> HNS10SpiralSystem:
+    """Gemeinsames HNS10-System (beim ersten Zugriff erzeugt)"""
+    global _default_system
+    if _default_system is None:
+        _default_system = HNS10SpiralSystem()
+    return _default_system
+
 def get_current_spiral_time() -> str:
     """Gibt aktuelle Spiralzeit zurück"""
-    system = create_system()
+    system = get_system()
     return system.calculate_spiral_position(datetime.now()).to_string()
 
 def validate_wwaq_text(text: str) -> Dict[str, bool]:
@@ -278,7 +257,7 @@ if __name__ == "__main__":
     print("HNS10 Spiral System - Test")
     print("=" * 50)
     
-    system = create_system()
+    system = get_system()
     
     # Aktuelle Spiralzeit
     current_spiral = system.calculate_spiral_position(datetime.now())
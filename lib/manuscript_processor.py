@@ -11,12 +11,113 @@ Stand: 20. Tammus 5785
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+import queue
+import threading
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 from collections import defaultdict
 import json
 from pathlib import Path
 from datetime import datetime
 
+from corpus_pack import Corpus, is_corpus_pack, open_corpus
+from gematria_engine import GematriaEngine
+from rewrite_engine import get_engine
+from analysis_cache import AnalysisCache, content_hash
+from batch_packer import pack as pack_batches
+from work_scheduler import balanced_schedule, chunk_weights
+
+# Bei jeder Änderung der Chunk-Analyse erhöhen (invalidiert den Analyse-Cache)
+PROCESSOR_VERSION = "1.1"
+
+# Satzenden für die Chunk-Bildung
+SENTENCE_END = re.compile(r'[.!?:]\s+')
+
+# Getrennt geschriebenes כ ב ל ה
+SEPARATED_KABBALA = re.compile(r'כ\s*ב\s*ל\s*ה')
+
+class AnalysisTotals:
+    """Fortlaufende Gesamtanalyse - wird Chunk für Chunk gefaltet"""
+    
+    def __init__(self):
+        self.total_chunks = 0
+        self.total_words = 0
+        self.total_gematria = 0
+        self.key_terms_frequency = defaultdict(int)
+        self.wwaq_transformations = defaultdict(int)
+    
+    def add(self, chunk: Dict) -> None:
+        """Nimmt einen Chunk in die Summen auf"""
+        meta = chunk['metadata']
+        self.total_chunks += 1
+        self.total_words += meta['words']
+        self.total_gematria += meta['gematria']['standard']
+        
+        for term in meta['key_terms']:
+            self.key_terms_frequency[term['hebrew']] += term['count']
+        
+        for change in meta['wwaq_changes']:
+            self.wwaq_transformations[change] += 1
+    
+    def merge(self, other: 'AnalysisTotals') -> None:
+        """Übernimmt die Summen eines Teilergebnisses (z.B. aus einem Worker)"""
+        self.total_chunks += other.total_chunks
+        self.total_words += other.total_words
+        self.total_gematria += other.total_gematria
+        
+        for term, count in other.key_terms_frequency.items():
+            self.key_terms_frequency[term] += count
+        
+        for change, count in other.wwaq_transformations.items():
+            self.wwaq_transformations[change] += count
+    
+    def as_dict(self) -> Dict:
+        """Gesamtanalyse im Format von analyze_manuscript"""
+        return {
+            'total_chunks': self.total_chunks,
+            'total_words': self.total_words,
+            'total_gematria': self.total_gematria,
+            'average_gematria': self.total_gematria // self.total_chunks if self.total_chunks else 0,
+            'key_terms_frequency': dict(self.key_terms_frequency),
+            'wwaq_transformations': dict(self.wwaq_transformations)
+        }
+
+def _read_ahead(corpus: Corpus, buffer_size: int) -> Iterator[Tuple[int, str]]:
+    """Liest Corpus-Einträge in einem Hintergrund-Thread vor"""
+    buffer = queue.Queue(maxsize=buffer_size)
+    done = object()
+    stop = threading.Event()
+    errors = []
+    
+    def reader():
+        try:
+            for entry in corpus:
+                if stop.is_set():
+                    return
+                buffer.put(entry)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            buffer.put(done)
+    
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            entry = buffer.get()
+            if entry is done:
+                if errors:
+                    raise errors[0]
+                break
+            yield entry
+    finally:
+        stop.set()
+        # Lese-Thread nicht blockiert zurücklassen
+        while thread.is_alive():
+            try:
+                buffer.get_nowait()
+            except queue.Empty:
+                thread.join(0.01)
+
 class ManuscriptProcessor:
     """Hauptklasse für Manuskript-Verarbeitung"""
     
@@ -30,6 +131,8 @@ class ManuscriptProcessor:
             'ש': 300, 'ת': 400
         }
         
+        self.gematria_engine = GematriaEngine(self.gematria_values)
+        
         # WWAQ-Transformationen
         self.wwaq_replacements = {
             'כבלה': 'קבלה',
@@ -52,90 +155,82 @@ class ManuscriptProcessor:
             'עשיה': 'Asijah'
         }
     
+    def ruleset_stamp(self) -> str:
+        """Stempel aus Prozessor-Version und allen Regeltabellen"""
+        rules = json.dumps({
+            'version': PROCESSOR_VERSION,
+            'gematria': self.gematria_values,
+            'wwaq': self.wwaq_replacements,
+            'terms': self.ez_chajim_terms
+        }, ensure_ascii=False, sort_keys=True)
+        return content_hash(rules.encode('utf-8'))
+    
     def calculate_gematria(self, text: str) -> int:
         """Berechnet Gematria-Wert eines Textes"""
-        total = 0
-        for char in text:
-            if char in self.gematria_values:
-                total += self.gematria_values[char]
-        return total
+        return self.gematria_engine.value(text)
     
     def calculate_gematria_methods(self, text: str) -> Dict[str, int]:
-        """Berechnet verschiedene Gematria-Methoden"""
-        # Standard Gematria
-        standard = self.calculate_gematria(text)
-        
-        # Kleine Gematria (Mispar Katan)
-        small = sum((self.gematria_values.get(char, 0) - 1) % 9 + 1 
-                   for char in text if char in self.gematria_values)
-        
-        # Volle Gematria (Milui) - vereinfacht
-        full_values = {
-            'א': 111, 'ב': 412, 'ג': 83, 'ד': 434, 'ה': 6,
-            'ו': 13, 'ז': 67, 'ח': 418, 'ט': 419, 'י': 20,
-            'כ': 100, 'ל': 74, 'מ': 90, 'נ': 106, 'ס': 120,
-            'ע': 130, 'פ': 81, 'צ': 104, 'ק': 186, 'ר': 510,
-            'ש': 360, 'ת': 406
-        }
-        full = sum(full_values.get(char, 0) for char in text)
-        
-        return {
-            'standard': standard,
-            'small': small,
-            'full': full,
-            'ordinal': len([c for c in text if c in self.gematria_values])
-        }
+        """Berechnet alle Gematria-Methoden in einem Durchlauf (standard, small, full, ordinal)"""
+        return self.gematria_engine.methods(text)
     
     def apply_wwaq_transformation(self, text: str) -> Tuple[str, List[str]]:
-        """Wendet WWAQ-Transformationen an"""
-        transformed = text
-        changes = []
-        
-        for old, new in self.wwaq_replacements.items():
-            if old in transformed and old != new:
-                count = transformed.count(old)
-                transformed = transformed.replace(old, new)
-                changes.append(f"{old} → {new} ({count}x)")
+        """Wendet WWAQ-Transformationen an (ein Durchlauf über die Rewrite-Engine)"""
+        transformed, hits = get_engine(self.wwaq_replacements).rewrite(text)
+        changes = [
+            f"{old} → {new} ({hits[old]}x)"
+            for old, new in self.wwaq_replacements.items()
+            if old != new and hits.get(old)
+        ]
         
         # Spezielle Regeln
         if 'כ' in transformed and 'בלה' in transformed:
             # Prüfe auf versteckte Kabbala-Schreibweisen
-            pattern = r'כ\s*ב\s*ל\s*ה'
-            if re.search(pattern, transformed):
-                transformed = re.sub(pattern, 'קבלה', transformed)
+            if SEPARATED_KABBALA.search(transformed):
+                transformed = SEPARATED_KABBALA.sub('קבלה', transformed)
                 changes.append("כ-ב-ל-ה → קבלה (getrennt)")
         
         return transformed, changes
     
     def extract_chunks(self, text: str, chunk_size: int = 500) -> List[Dict]:
         """Teilt Text in Chunks mit Metadaten"""
+        return list(self.iter_chunks(text, chunk_size))
+    
+    def iter_chunks(self, text: str, chunk_size: int = 500) -> Iterator[Dict]:
+        """Wie extract_chunks, liefert die Chunks aber einzeln (Generator)"""
         # Bereinige Text
         clean_text = re.sub(r'\s+', ' ', text.strip())
         
-        # Finde natürliche Trennstellen (Satzenden)
-        sentences = re.split(r'([.!?:]\s+)', clean_text)
-        
-        chunks = []
         current_chunk = ""
         chunk_id = 1
+        position = 0
         
-        for i in range(0, len(sentences), 2):
-            sentence = sentences[i]
-            separator = sentences[i + 1] if i + 1 < len(sentences) else ""
+        # Natürliche Trennstellen (Satzenden), ohne Zwischenliste
+        for match in SENTENCE_END.finditer(clean_text):
+            sentence = clean_text[position:match.start()]
+            separator = match.group()
+            position = match.end()
             
             if len(current_chunk) + len(sentence) + len(separator) > chunk_size:
                 if current_chunk:
-                    chunks.append(self._create_chunk(current_chunk.strip(), chunk_id))
+                    yield self._create_chunk(current_chunk.strip(), chunk_id)
                     chunk_id += 1
                 current_chunk = sentence + separator
             else:
                 current_chunk += sentence + separator
         
+        # Rest nach dem letzten Satzende
+        sentence = clean_text[position:]
+        if len(current_chunk) + len(sentence) > chunk_size:
+            if current_chunk:
+                yield self._create_chunk(current_chunk.strip(), chunk_id)
+                chunk_id += 1
+            current_chunk = sentence
+        else:
+            current_chunk += sentence
+        
         # Letzter Chunk
         if current_chunk:
-            chunks.append(self._create_chunk(current_chunk.strip(), chunk_id))
-        
-        return chunks
+            yield self._create_chunk(current_chunk.strip(), chunk_id)
     
     def _create_chunk(self, text: str, chunk_id: int) -> Dict:
         """Erstellt einen Chunk mit Metadaten"""
@@ -173,50 +268,120 @@ class ManuscriptProcessor:
     
     def analyze_manuscript(self, file_path: Path) -> Dict:
         """Analysiert komplettes Manuskript"""
+        # Corpus Pack oder Chunk-Verzeichnis
+        if Path(file_path).is_dir() or is_corpus_pack(file_path):
+            return self.analyze_corpus(file_path)
+        
         with open(file_path, 'r', encoding='utf-8') as f:
             text = f.read()
         
         # Chunks erstellen
         chunks = self.extract_chunks(text)
         
-        # Gesamtanalyse
-        total_gematria = sum(chunk['metadata']['gematria']['standard'] for chunk in chunks)
-        all_key_terms = defaultdict(int)
+        return self._summarize_chunks(str(file_path), chunks)
+    
+    def analyze_corpus(self, source: Optional[Union[str, Path, Corpus]] = None,
+                       keep_chunks: bool = True, read_ahead: int = 0,
+                       cache: Optional[AnalysisCache] = None) -> Dict:
+        """Analysiert den hebräischen Corpus (Pack oder Verzeichnis)
         
-        for chunk in chunks:
-            for term in chunk['metadata']['key_terms']:
-                all_key_terms[term['hebrew']] += term['count']
+        Jede Corpus-Datei wird ein Chunk, die ID folgt der Dateinummer.
+        Mit keep_chunks=False bleibt der Speicherbedarf konstant, das
+        Ergebnis enthält dann nur die Gesamtanalyse. Mit cache werden
+        nur neue oder geänderte Chunks analysiert; der Cache wird am
+        Ende gespeichert.
+        """
+        corpus = open_corpus(source)
+        totals = AnalysisTotals()
+        chunks = []
+        
+        for chunk in self.iter_analysis(corpus, totals, read_ahead, cache):
+            if keep_chunks:
+                chunks.append(chunk)
+        
+        if cache is not None:
+            cache.retain(corpus.ids())
+            cache.save()
+        
+        return {
+            'file': str(corpus.path),
+            'analysis': totals.as_dict(),
+            'chunks': chunks
+        }
+    
+    def iter_analysis(self, source: Optional[Union[str, Path, Corpus]] = None,
+                      totals: Optional['AnalysisTotals'] = None,
+                      read_ahead: int = 0,
+                      cache: Optional[AnalysisCache] = None) -> Iterator[Dict]:
+        """Liefert analysierte Corpus-Chunks einzeln
+        
+        Args:
+            source: Corpus Pack, Chunk-Verzeichnis oder geöffneter Corpus
+            totals: Wird mit jedem Chunk fortgeschrieben (optional)
+            read_ahead: > 0 startet einen Lese-Thread mit so vielen Puffer-Plätzen
+            cache: Analyse-Cache; Treffer werden ohne Neuberechnung geliefert
+        """
+        corpus = open_corpus(source)
+        entries = _read_ahead(corpus, read_ahead) if read_ahead > 0 else iter(corpus)
         
-        # WWAQ-Statistik
-        wwaq_stats = defaultdict(int)
+        for chunk_id, text in entries:
+            chunk = None
+            if cache is not None:
+                digest = content_hash(text.encode('utf-8'))
+                chunk = cache.get(chunk_id, digest)
+            
+            if chunk is None:
+                chunk = self._create_chunk(text.strip(), chunk_id)
+                if cache is not None:
+                    cache.put(chunk_id, digest, chunk)
+            
+            if totals is not None:
+                totals.add(chunk)
+            yield chunk
+    
+    def _summarize_chunks(self, source: str, chunks: List[Dict]) -> Dict:
+        """Berechnet Gesamtanalyse über alle Chunks"""
+        totals = AnalysisTotals()
         for chunk in chunks:
-            for change in chunk['metadata']['wwaq_changes']:
-                wwaq_stats[change] += 1
+            totals.add(chunk)
         
         return {
-            'file': str(file_path),
-            'analysis': {
-                'total_chunks': len(chunks),
-                'total_words': sum(chunk['metadata']['words'] for chunk in chunks),
-                'total_gematria': total_gematria,
-                'average_gematria': total_gematria // len(chunks) if chunks else 0,
-                'key_terms_frequency': dict(all_key_terms),
-                'wwaq_transformations': dict(wwaq_stats)
-            },
+            'file': source,
+            'analysis': totals.as_dict(),
             'chunks': chunks
         }
     
-    def create_translation_batch(self, chunks: List[Dict], batch_size: int = 10) -> List[Dict]:
-        """Erstellt Batches für Claude-Übersetzung"""
-        batches = []
+    def create_translation_batch(self, chunks: List[Dict], batch_size: int = 10,
+                                 token_budget: Optional[int] = None) -> List[Dict]:
+        """
+        Erstellt Batches für Claude-Übersetzung
+        
+        Ohne token_budget: feste Anzahl batch_size Chunks pro Batch.
+        Mit token_budget: Batches nach geschätzten Tokens (batch_packer),
+        zu große Chunks werden an Satzgrenzen in Teile zerlegt.
+        """
+        return list(self.iter_translation_batches(chunks, batch_size, token_budget))
+    
+    def iter_translation_batches(self, chunks: List[Dict], batch_size: int = 10,
+                                 token_budget: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Wie create_translation_batch, liefert die Batches aber einzeln
+        
+        Die Anweisung wird einmal erzeugt; alle Batches verweisen auf
+        denselben String (für BatchWriter: einmal schreiben, dann referenzieren).
+        """
+        instruction = self._create_translation_instruction()
+        if token_budget is not None:
+            yield from self._iter_budget_batches(chunks, token_budget, instruction)
+            return
         
         for i in range(0, len(chunks), batch_size):
             batch_chunks = chunks[i:i + batch_size]
             
-            batch = {
+            yield {
                 'batch_id': f"BATCH_{i//batch_size + 1:03d}",
                 'chunk_ids': [chunk['id'] for chunk in batch_chunks],
-                'instruction': self._create_translation_instruction(),
+                'instruction': instruction,
                 'chunks': [
                     {
                         'id': chunk['id'],
@@ -227,10 +392,49 @@ class ManuscriptProcessor:
                     for chunk in batch_chunks
                 ]
             }
-            
-            batches.append(batch)
+    
+    def _iter_budget_batches(self, chunks: List[Dict], token_budget: int,
+                             instruction: str) -> Iterator[Dict]:
+        """Batches nach Token-Budget, Teile zerlegter Chunks mit Unter-IDs"""
+        by_id = {chunk['id']: chunk for chunk in chunks}
+        packed = pack_batches(
+            ((chunk['id'], chunk['transformed']) for chunk in chunks),
+            token_budget, instruction
+        )
         
-        return batches
+        for number, pieces in enumerate(packed.batches, 1):
+            yield {
+                'batch_id': f"BATCH_{number:03d}",
+                'chunk_ids': [piece.id for piece in pieces],
+                'instruction': instruction,
+                'estimated_tokens': packed.batch_tokens(pieces),
+                'chunks': [
+                    {
+                        'id': piece.id,
+                        'chunk_id': piece.chunk_id,
+                        'part': piece.part,
+                        'parts': piece.parts,
+                        'text': piece.text,
+                        'gematria_hint': by_id[piece.chunk_id]['metadata']['gematria']['standard'],
+                        'key_terms': by_id[piece.chunk_id]['metadata']['key_terms']
+                    }
+                    for piece in pieces
+                ]
+            }
+    
+    def create_worker_queues(self, chunks: List[Dict], workers: int,
+                             measure: str = 'tokens') -> Dict[int, List[str]]:
+        """
+        Verteilt Chunks auf Übersetzungs-/Review-Worker nach Größe
+        
+        Zusammenhängend und in Original-Reihenfolge; die größte Worker-Last
+        (geschätzte Tokens oder Zeichen des transformierten Texts) ist minimal.
+        
+        Returns:
+            {Worker (ab 1): [Chunk-IDs]}
+        """
+        weights = chunk_weights((chunk['transformed'] for chunk in chunks), measure)
+        return balanced_schedule([chunk['id'] for chunk in chunks], weights, workers)
     
     def _create_translation_instruction(self) -> str:
         """Erstellt Übersetzungsanweisung für Claude"""
@@ -275,15 +479,32 @@ class ManuscriptProcessor:
         }
 
 # Hilfsfunktionen
-def process_ez_chajim_manuscript(file_path: str) -> Dict:
-    """Verarbeitet ein Ez Chajim Manuskript"""
+def process_ez_chajim_manuscript(file_path: str, use_cache: bool = True) -> Dict:
+    """Verarbeitet ein Ez Chajim Manuskript (Datei, Chunk-Verzeichnis oder Corpus Pack)
+    
+    Für Pack und Verzeichnis werden unveränderte Chunks aus dem Analyse-Cache geholt.
+    """
     processor = ManuscriptProcessor()
-    return processor.analyze_manuscript(Path(file_path))
+    path = Path(file_path)
+    if use_cache and (path.is_dir() or is_corpus_pack(path)):
+        cache = AnalysisCache(processor.ruleset_stamp())
+        return processor.analyze_corpus(path, cache=cache)
+    return processor.analyze_manuscript(path)
 
-def create_translation_batches(manuscript_analysis: Dict, batch_size: int = 10) -> List[Dict]:
+def create_translation_batches(manuscript_analysis: Dict, batch_size: int = 10,
+                               token_budget: Optional[int] = None) -> List[Dict]:
     """Erstellt Übersetzungs-Batches aus Manuskript-Analyse"""
     processor = ManuscriptProcessor()
-    return processor.create_translation_batch(manuscript_analysis['chunks'], batch_size)
+    return processor.create_translation_batch(manuscript_analysis['chunks'], batch_size, token_budget)
+
+def create_corpus_batches(source: Optional[Union[str, Path, Corpus]] = None,
+                          batch_size: int = 10, use_cache: bool = True,
+                          token_budget: Optional[int] = None) -> List[Dict]:
+    """Erstellt Übersetzungs-Batches direkt aus Corpus Pack oder Verzeichnis"""
+    processor = ManuscriptProcessor()
+    cache = AnalysisCache(processor.ruleset_stamp()) if use_cache else None
+    analysis = processor.analyze_corpus(source, cache=cache)
+    return processor.create_translation_batch(analysis['chunks'], batch_size, token_budget)
 
 # Test und Beispiel
 if __name__ == "__main__":
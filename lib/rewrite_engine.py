@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rewrite-Engine für WWAQ/Q-System Ersetzungen
+============================================
+
+Ersetzt eine ganze Ersetzungstabelle in einem einzigen Durchlauf statt
+N hintereinander ausgeführter str.replace/re.sub Aufrufe.
+
+Die Muster werden in einen Präfixbaum (Trie) übersetzt und als ein
+einziger regulärer Ausdruck kompiliert: pro Textposition wird höchstens
+ein Pfad durch den Baum verfolgt, die Suche selbst läuft in C. Treffer
+werden anschließend gegen die Regeln aufgelöst:
+
+    • längster Treffer gewinnt (unabhängig von der Tabellenreihenfolge)
+    • Wortgrenzen wie bei \\b (optional, pro Regel)
+    • Groß-/Kleinschreibung ignorieren (optional, pro Regel)
+    • Schreibweise des Originals übernehmen (optional, pro Regel)
+
+Ergebnis ist der neue Text plus Trefferzahl pro Regel; finditer liefert
+die Treffer selbst (z.B. für Prüfungen ohne Ersetzung).
+
+Stand: 5. Cheschwan 5787
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class RewriteRule:
+    """Eine Ersetzungsregel"""
+    pattern: str
+    replacement: str
+    word_boundary: bool = False
+    ignore_case: bool = False
+    preserve_case: bool = False
+
+
+RuleTable = Union[Dict[str, str], Iterable[RewriteRule]]
+
+
+# Hilfsfunktionen
+
+def _fold(text: str) -> str:
+    """Kleinschreibung Zeichen für Zeichen (Länge bleibt erhalten)"""
+    folded = []
+    for char in text:
+        lower = char.lower()
+        folded.append(lower if len(lower) == 1 else char)
+    return ''.join(folded)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """Wortgrenze an Position pos (Semantik von \\b)"""
+    left = pos > 0 and _is_word_char(text[pos - 1])
+    right = pos < len(text) and _is_word_char(text[pos])
+    return left != right
+
+
+def match_case(original: str, replacement: str) -> str:
+    """Überträgt die Schreibweise des Originals auf die Ersetzung"""
+    if not replacement:
+        return replacement
+    if len(original) > 1 and original.isupper():
+        return replacement.upper()
+    if original[:1].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    if original[:1].islower():
+        return replacement[:1].lower() + replacement[1:]
+    return replacement
+
+
+class _Node:
+    __slots__ = ('children', 'rules')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.rules: List[RewriteRule] = []
+
+
+def _trie_regex(node: _Node) -> str:
+    """Übersetzt einen Teilbaum in einen regulären Ausdruck (längste Variante zuerst)"""
+    alternatives = [
+        re.escape(char) + _trie_regex(child)
+        for char, child in sorted(node.children.items())
+    ]
+    if not alternatives:
+        return ''
+    if len(alternatives) == 1 and not node.rules:
+        return alternatives[0]
+    group = '(?:' + '|'.join(alternatives) + ')'
+    return group + '?' if node.rules else group
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """Regulärer Ausdruck für eine Wortliste als Präfixbaum (längste Variante zuerst)"""
+    root = _Node()
+    for word in words:
+        node = root
+        for char in word:
+            node = node.children.setdefault(char, _Node())
+        # Markiert das Wortende (wie eine Regel ohne Ersetzung)
+        node.rules.append(RewriteRule(word, word))
+    return _trie_regex(root)
+
+
+class RewriteEngine:
+    """Kompilierte Ersetzungstabelle, ein Durchlauf pro Text"""
+
+    def __init__(self, rules: RuleTable, word_boundary: bool = False,
+                 ignore_case: bool = False, preserve_case: bool = False):
+        """
+        Args:
+            rules: Dictionary alt → neu oder Liste von RewriteRule
+            word_boundary, ignore_case, preserve_case: Vorgaben für Dictionary-Regeln
+        """
+        if isinstance(rules, dict):
+            rules = [
+                RewriteRule(old, new, word_boundary, ignore_case, preserve_case)
+                for old, new in rules.items()
+            ]
+        self.rules: List[RewriteRule] = [rule for rule in rules if rule.pattern]
+        self._folding = any(rule.ignore_case for rule in self.rules)
+
+        self._root = _Node()
+        for rule in self.rules:
+            node = self._root
+            for char in self._key(rule.pattern):
+                node = node.children.setdefault(char, _Node())
+            node.rules.append(rule)
+
+        # Exakte Regeln vor Regeln ohne Groß-/Kleinschreibung
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            node.rules.sort(key=lambda rule: rule.ignore_case)
+            stack.extend(node.children.values())
+
+        self._regex: Optional[re.Pattern] = None
+        if self.rules:
+            flags = re.IGNORECASE if self._folding else 0
+            pattern = _trie_regex(self._root)
+            if all(rule.word_boundary for rule in self.rules):
+                # Wortgrenzen schon in der Suche prüfen (weniger Kandidaten)
+                pattern = r'\b(?:' + pattern + r')\b'
+            self._regex = re.compile(pattern, flags)
+
+    def _key(self, text: str) -> str:
+        return _fold(text) if self._folding else text
+
+    def _resolve(self, text: str, start: int, end: int) -> Optional[Tuple[RewriteRule, int]]:
+        """Längste gültige Regel, die bei start beginnt (end = Ende des Kandidaten)"""
+        node = self._root
+        candidates = []
+        for pos in range(start, end):
+            node = node.children.get(self._key(text[pos]))
+            if node is None:
+                break
+            if node.rules:
+                candidates.append((node, pos + 1))
+
+        for node, stop in reversed(candidates):
+            for rule in node.rules:
+                if not rule.ignore_case and text[start:stop] != rule.pattern:
+                    continue
+                if rule.word_boundary and not (_is_boundary(text, start) and _is_boundary(text, stop)):
+                    continue
+                return rule, stop
+        return None
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, RewriteRule]]:
+        """Liefert (start, ende, regel) aller Treffer, links nach rechts, ohne Überlappung"""
+        if self._regex is None or not text:
+            return
+        search_from = 0
+        search = self._regex.search
+        while True:
+            match = search(text, search_from)
+            if match is None:
+                return
+            start = match.start()
+            resolved = self._resolve(text, start, match.end())
+            if resolved is None:
+                # Kandidat verworfen (Wortgrenze/Schreibweise): eine Position weiter
+                search_from = start + 1
+                continue
+            rule, stop = resolved
+            yield start, stop, rule
+            search_from = stop
+
+    def rewrite(self, text: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Wendet alle Regeln in einem Durchlauf an
+
+        Returns:
+            (neuer Text, Treffer pro Regel-Muster)
+        """
+        hits: Dict[str, int] = {}
+        parts = []
+        pos = 0
+        for start, stop, rule in self.finditer(text):
+            replacement = rule.replacement
+            if rule.preserve_case:
+                replacement = match_case(text[start:stop], replacement)
+            parts.append(text[pos:start])
+            parts.append(replacement)
+            hits[rule.pattern] = hits.get(rule.pattern, 0) + 1
+            pos = stop
+
+        if not parts:
+            return text, hits
+        parts.append(text[pos:])
+        return ''.join(parts), hits
+
+    def sub(self, text: str) -> str:
+        """Wie rewrite, nur der neue Text"""
+        return self.rewrite(text)[0]
+
+
+@lru_cache(maxsize=64)
+def _cached_engine(rules: Tuple, word_boundary: bool, ignore_case: bool,
+                   preserve_case: bool) -> RewriteEngine:
+    if rules and isinstance(rules[0], RewriteRule):
+        return RewriteEngine(rules)
+    return RewriteEngine(dict(rules), word_boundary, ignore_case, preserve_case)
+
+
+def get_engine(rules: RuleTable, word_boundary: bool = False,
+               ignore_case: bool = False, preserve_case: bool = False) -> RewriteEngine:
+    """
+    Kompilierte Engine für eine Tabelle, zwischengespeichert
+
+    Geänderte Tabellen ergeben automatisch eine neue Engine.
+    """
+    key = tuple(rules.items()) if isinstance(rules, dict) else tuple(rules)
+    return _cached_engine(key, word_boundary, ignore_case, preserve_case)
+
+
+# Demo
+if __name__ == "__main__":
+    print("=== Rewrite-Engine Demo ===\n")
+
+    engine = RewriteEngine({
+        'Kabbala': 'Qabbala',
+        'Kabbalah': 'Qabbala',
+        'Tikkun': 'Tiqqun',
+        'zerstören': 'wandeln',
+    }, word_boundary=True, ignore_case=True, preserve_case=True)
+
+    text = "Die Kabbalah lehrt TIKKUN, nicht zerstören. Kabbalistisch bleibt."
+    result, hits = engine.rewrite(text)
+    print(f"Vorher:  {text}")
+    print(f"Nachher: {result}")
+    print(f"Treffer: {hits}")
+
+    print("\nQ!")
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Übersetzungs-Speicher für Ez Chajim
+===================================
+
+Liest die Claude-Batches (processing/translation/claude-batches/batch_NNN.txt)
+zeilenweise ein und legt sie in einer SQLite-Datenbank ab, eine Zeile pro
+Chunk: hebräischer Text, Übersetzung, Status und Batch-Nummer.
+
+Aufbau eines Batches:
+    # BATCH n von m
+    ## CHUNK k
+    ### Hebräischer Original-Text:
+    ```hebrew
+    …
+    ```
+    ### Deutsche Übersetzung (WWAQ-konform):
+    [HIER ÜBERSETZT CLAUDE]   (oder die eingefügte Übersetzung)
+    ---
+
+Teile eines zerlegten Chunks (## CHUNK 42.01, 42.02, … aus dem Batch-Packer)
+werden beim Einlesen wieder zu einem Chunk zusammengeführt, auch wenn sie
+über mehrere Batch-Dateien verteilt sind; der Hebräisch-Text ist dann
+wieder genau der Chunk-Text.
+
+Status:
+    offen      Platzhalter steht noch da
+    übersetzt  Übersetzung eingefügt
+    teilweise  nur ein Teil der Chunk-Teile übersetzt
+    leer       weder Platzhalter noch Text
+
+Die Datenbank (.cache/translations.sqlite) ist abgeleitet und kann jederzeit
+mit `ingest` neu aufgebaut werden. Abfragen per Chunk-ID laufen über den
+Primärschlüssel (merge_translations braucht kein Dictionary im Speicher).
+
+Stand: 5. Cheschwan 5787
+"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from corpus_pack import CACHE_DIR, REPO_ROOT
+
+BATCHES_DIR = REPO_ROOT / 'processing' / 'translation' / 'claude-batches'
+DEFAULT_DB_PATH = CACHE_DIR / 'translations.sqlite'
+
+PLACEHOLDER = '[HIER ÜBERSETZT CLAUDE]'
+STATUS_OPEN = 'offen'
+STATUS_TRANSLATED = 'übersetzt'
+STATUS_PARTIAL = 'teilweise'
+STATUS_EMPTY = 'leer'
+
+# Zeilen pro executemany-Aufruf
+INSERT_BATCH = 500
+
+BATCH_FILE_PATTERN = re.compile(r'^batch_(\d+)\.txt$')
+BATCH_HEADER = re.compile(r'^# BATCH (\d+)')
+CHUNK_HEADER = re.compile(r'^## CHUNK (\d+)(?:\.(\d+))?\s*$')
+CHUNK_ID_PATTERN = re.compile(r'^CHUNK_(\d+)(?:\.(\d+))?$')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    chunk_id    INTEGER PRIMARY KEY,
+    batch_id    INTEGER NOT NULL,
+    hebrew      TEXT NOT NULL,
+    translation TEXT,
+    status      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_batch ON chunks (batch_id);
+"""
+
+
+@dataclass
+class BatchChunk:
+    """Ein Chunk aus einem Claude-Batch"""
+    chunk_id: int
+    batch_id: int
+    hebrew: str
+    translation: Optional[str]
+    status: str
+
+
+# Hilfsfunktionen
+
+def batch_files(batches_dir: Union[str, Path] = BATCHES_DIR) -> List[Path]:
+    """batch_NNN.txt Dateien, nach Nummer sortiert"""
+    found = []
+    for path in Path(batches_dir).iterdir():
+        match = BATCH_FILE_PATTERN.match(path.name)
+        if match:
+            found.append((int(match.group(1)), path))
+    return [path for _, path in sorted(found)]
+
+
+def chunk_number(chunk_id: Union[int, str]) -> int:
+    """
+    Chunk-ID als Zahl (42, 'CHUNK_0042' oder 'CHUNK_0042.01')
+
+    Unter-IDs zerlegter Chunks zählen zum ganzen Chunk: gespeichert wird
+    nur der zusammengeführte Chunk.
+    """
+    if isinstance(chunk_id, int):
+        return chunk_id
+    match = CHUNK_ID_PATTERN.match(chunk_id)
+    if not match:
+        raise ValueError(f"Ungültige Chunk-ID: {chunk_id}")
+    return int(match.group(1))
+
+
+def _translation_status(lines: List[str]) -> Tuple[Optional[str], str]:
+    """(Übersetzung, Status) aus den Zeilen nach der Übersetzungs-Überschrift"""
+    text = '\n'.join(lines).strip()
+    # Trenner des nächsten Chunks gehört nicht zur Übersetzung
+    if text.endswith('---'):
+        text = text[:-3].rstrip()
+    if text == PLACEHOLDER:
+        return None, STATUS_OPEN
+    if not text:
+        return None, STATUS_EMPTY
+    return text, STATUS_TRANSLATED
+
+
+def _parse_parts(path: Union[str, Path]) -> Iterator[Tuple[BatchChunk, Optional[int]]]:
+    """(Chunk oder Chunk-Teil, Teil-Nummer oder None) in Reihenfolge der Datei"""
+    path = Path(path)
+    match = BATCH_FILE_PATTERN.match(path.name)
+    batch_id = int(match.group(1)) if match else 0
+
+    chunk_id = part = None
+    hebrew: List[str] = []
+    translation: List[str] = []
+    section = None
+
+    def finish() -> Tuple[BatchChunk, Optional[int]]:
+        text, status = _translation_status(translation)
+        return BatchChunk(chunk_id, batch_id, '\n'.join(hebrew), text, status), part
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for line in f:
+            line = line.rstrip('\n')
+
+            header = CHUNK_HEADER.match(line)
+            if header:
+                if chunk_id is not None:
+                    yield finish()
+                chunk_id = int(header.group(1))
+                part = int(header.group(2)) if header.group(2) else None
+                hebrew, translation = [], []
+                section = None
+                continue
+
+            if chunk_id is None:
+                batch_header = BATCH_HEADER.match(line)
+                if batch_header:
+                    batch_id = int(batch_header.group(1))
+                continue
+
+            if section == 'hebrew':
+                if line.strip() == '```':
+                    section = None
+                else:
+                    hebrew.append(line)
+            elif section == 'translation':
+                translation.append(line)
+            elif line.startswith('```hebrew'):
+                section = 'hebrew'
+            elif line.startswith('### Deutsche Übersetzung'):
+                section = 'translation'
+
+    if chunk_id is not None:
+        yield finish()
+
+
+def _merge_parts(parts: List[BatchChunk]) -> BatchChunk:
+    """Führt die Teile eines zerlegten Chunks zusammen (in Teil-Reihenfolge)"""
+    if len(parts) == 1:
+        return parts[0]
+    first = parts[0]
+    # Die Teile ergeben aneinandergehängt den Chunk-Text (batch_packer.split_text)
+    hebrew = ''.join(part.hebrew for part in parts)
+    statuses = {part.status for part in parts}
+    if statuses == {STATUS_TRANSLATED}:
+        translation = '\n\n'.join(part.translation for part in parts)
+        return BatchChunk(first.chunk_id, first.batch_id, hebrew, translation, STATUS_TRANSLATED)
+    if STATUS_TRANSLATED in statuses:
+        return BatchChunk(first.chunk_id, first.batch_id, hebrew, None, STATUS_PARTIAL)
+    return BatchChunk(first.chunk_id, first.batch_id, hebrew, None, first.status)
+
+
+def _assemble(parts: Iterable[Tuple[BatchChunk, Optional[int]]]) -> Iterator[BatchChunk]:
+    """
+    Ganze Chunks sofort, zerlegte Chunks am Ende
+
+    Teile werden über alle Dateien hinweg pro Chunk-ID gesammelt (ein Chunk
+    kann über mehrere Batches verteilt sein) und nach Teil-Nummer
+    zusammengeführt; ein späterer gleicher Teil ersetzt einen früheren.
+    """
+    split: Dict[int, Dict[int, BatchChunk]] = {}
+    for chunk, part in parts:
+        if part is None:
+            yield chunk
+        else:
+            split.setdefault(chunk.chunk_id, {})[part] = chunk
+    for chunk_id in sorted(split):
+        pieces = split[chunk_id]
+        yield _merge_parts([pieces[part] for part in sorted(pieces)])
+
+
+def parse_batch(path: Union[str, Path]) -> Iterator[BatchChunk]:
+    """
+    Liest eine Batch-Datei zeilenweise und liefert ihre Chunks
+
+    Die Batch-Nummer kommt aus der Kopfzeile '# BATCH n', sonst aus dem Dateinamen.
+    Zerlegte Chunks kommen zusammengeführt am Ende (nur die Teile dieser Datei).
+    """
+    return _assemble(_parse_parts(path))
+
+
+def parse_batches(paths: Iterable[Union[str, Path]]) -> Iterator[BatchChunk]:
+    """Alle Chunks mehrerer Batch-Dateien, Teile zerlegter Chunks dateiübergreifend vereint"""
+    return _assemble(part for path in paths for part in _parse_parts(path))
+
+
+class TranslationStore:
+    """SQLite-Speicher, eine Zeile pro Chunk"""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_PATH):
+        self.path = Path(db_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> 'TranslationStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def __contains__(self, chunk_id: Union[int, str]) -> bool:
+        return self.get(chunk_id) is not None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def ingest(self, source: Optional[Iterable[Union[str, Path]]] = None) -> Dict:
+        """
+        Liest Batch-Dateien ein (bestehende Chunks werden ersetzt)
+
+        Args:
+            source: Batch-Dateien (None = alle aus BATCHES_DIR)
+
+        Returns:
+            Statistik-Dictionary (Dateien, Chunks, pro Status)
+        """
+        paths = batch_files() if source is None else [Path(p) for p in source]
+        sql = ("INSERT OR REPLACE INTO chunks (chunk_id, batch_id, hebrew, translation, status) "
+               "VALUES (?, ?, ?, ?, ?)")
+
+        statuses: Dict[str, int] = {}
+        rows = []
+        total = 0
+        with self._conn:
+            for chunk in parse_batches(paths):
+                rows.append((chunk.chunk_id, chunk.batch_id, chunk.hebrew,
+                             chunk.translation, chunk.status))
+                statuses[chunk.status] = statuses.get(chunk.status, 0) + 1
+                if len(rows) >= INSERT_BATCH:
+                    self._conn.executemany(sql, rows)
+                    total += len(rows)
+                    rows = []
+            if rows:
+                self._conn.executemany(sql, rows)
+                total += len(rows)
+
+        return {
+            'database': str(self.path),
+            'files': len(paths),
+            'chunks': total,
+            'status': statuses
+        }
+
+    def chunk(self, chunk_id: Union[int, str]) -> Optional[BatchChunk]:
+        """Vollständiger Eintrag eines Chunks (None wenn unbekannt)"""
+        row = self._conn.execute(
+            "SELECT chunk_id, batch_id, hebrew, translation, status FROM chunks WHERE chunk_id = ?",
+            (chunk_number(chunk_id),)
+        ).fetchone()
+        return BatchChunk(*row) if row else None
+
+    def get(self, chunk_id: Union[int, str], default: Optional[str] = None) -> Optional[str]:
+        """Übersetzung eines Chunks (default wenn unbekannt oder noch offen)"""
+        row = self._conn.execute(
+            "SELECT translation FROM chunks WHERE chunk_id = ?", (chunk_number(chunk_id),)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return default
+        return row[0]
+
+    def batch(self, batch_id: int) -> List[BatchChunk]:
+        """Alle Chunks eines Batches, nach Chunk-ID"""
+        rows = self._conn.execute(
+            "SELECT chunk_id, batch_id, hebrew, translation, status FROM chunks "
+            "WHERE batch_id = ? ORDER BY chunk_id", (batch_id,)
+        )
+        return [BatchChunk(*row) for row in rows]
+
+    def status_counts(self) -> Dict[str, int]:
+        """Anzahl Chunks pro Status"""
+        rows = self._conn.execute("SELECT status, COUNT(*) FROM chunks GROUP BY status")
+        return dict(rows.fetchall())
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Übersetzungs-Speicher")
+    parser.add_argument('--db', default=str(DEFAULT_DB_PATH))
+    sub = parser.add_subparsers(dest='befehl', required=True)
+
+    ingest = sub.add_parser('ingest', help="Claude-Batches einlesen")
+    ingest.add_argument('files', nargs='*', help="Batch-Dateien (Standard: alle)")
+
+    show = sub.add_parser('show', help="Eintrag eines Chunks anzeigen")
+    show.add_argument('chunk_id', help="Nummer oder CHUNK_nnnn")
+
+    sub.add_parser('status', help="Chunks pro Status")
+
+    args = parser.parse_args()
+
+    with TranslationStore(args.db) as store:
+        if args.befehl == 'ingest':
+            stats = store.ingest(args.files or None)
+            print(f"✓ {stats['chunks']} Chunks aus {stats['files']} Batches")
+            for status, count in sorted(stats['status'].items()):
+                print(f"  {status}: {count}")
+            print(f"  → {stats['database']}")
+        elif args.befehl == 'show':
+            chunk_id = int(args.chunk_id) if args.chunk_id.isdigit() else args.chunk_id
+            entry = store.chunk(chunk_id)
+            if entry is None:
+                print(f"Chunk {args.chunk_id} nicht gefunden")
+            else:
+                print(f"CHUNK_{entry.chunk_id:04d} (Batch {entry.batch_id}, {entry.status})")
+                print(entry.hebrew)
+                print(f"\n{entry.translation or PLACEHOLDER}")
+        else:
+            for status, count in sorted(store.status_counts().items()):
+                print(f"{status}: {count}")
+
+    print("\nQ!")
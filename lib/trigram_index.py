@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trigramm-Volltextindex für Ez Chajim
+====================================
+
+Volltextsuche über den hebräischen Corpus (original-texts/chunks-hebr).
+
+Normalisierung (Index und Anfrage gleich):
+    • Schlussbuchstaben → Grundform (ך→כ, ם→מ, ן→נ, ף→פ, ץ→צ)
+    • Niqqud und Teamim entfernt
+    • Geresch/Gerschajim in allen Varianten entfernt (׳ ״ ' " ’ ” …)
+    • Whitespace-Folgen → ein Leerzeichen
+
+Der Index speichert pro Trigramm die Chunks, in denen es vorkommt,
+dazu den normalisierten Text jedes Chunks und die Abbildung jeder
+normalisierten Position auf die Original-Position. Eine Anfrage schneidet
+die Listen ihrer Trigramme (seltenste zuerst), sucht im normalisierten
+Text der Kandidaten und verifiziert jeden Treffer gegen den Text aus dem
+Corpus Pack. Treffer werden mit Original-Offsets als Keyword-in-Context
+(KWIC) geliefert.
+
+Format (Little Endian):
+    Header:     magic (8) | trigramme u32 | postings u32 | chunks u32 |
+                reserviert u32 | text-bytes u64 | positionen u64
+    Schlüssel:  u64 × trigramme (3 Codepoints à 21 Bit, sortiert)
+    Text-Start: u64 × (chunks + 1)   Byte-Offsets im normalisierten Text
+    Pos-Start:  u64 × (chunks + 1)   Offsets in der Positions-Tabelle
+    Starts:     u32 × (trigramme + 1)
+    Postings:   u32 × postings (Chunk-Nummern, je Trigramm sortiert)
+    Chunk-IDs:  u32 × chunks
+    Positionen: u32 × positionen (Original-Position je normalisiertem Zeichen)
+    Text:       normalisierte Chunks, UTF-8
+
+Aufruf:
+    python lib/trigram_index.py build
+    python lib/trigram_index.py search אצילות
+
+Stand: 5. Cheschwan 5787
+"""
+
+import mmap
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from corpus_pack import CACHE_DIR, Corpus, open_corpus
+
+DEFAULT_INDEX_PATH = CACHE_DIR / 'trigram.idx'
+
+INDEX_MAGIC = b'EZCTRI01'
+HEADER_STRUCT = struct.Struct('<8sIIIIQQ')
+
+# Schlussbuchstaben → Grundform
+FINAL_LETTERS = {'ך': 'כ', 'ם': 'מ', 'ן': 'נ', 'ף': 'פ', 'ץ': 'צ'}
+
+# Geresch/Gerschajim und ihre Ersatzzeichen
+GERESH_VARIANTS = '׳״\'"`´‘’“”„'
+
+# Niqqud und Teamim (ohne Maqaf, Paseq, Sof Pasuq, Nun Hafukha)
+NIQQUD = [chr(c) for c in list(range(0x0591, 0x05BE)) + [0x05BF, 0x05C1, 0x05C2, 0x05C4, 0x05C5, 0x05C7]]
+
+WHITESPACE_RUN = re.compile(r'\s+')
+
+# Standard-Kontext links und rechts im KWIC (Zeichen)
+DEFAULT_CONTEXT = 40
+
+# Lookup-Tabellen über alle Codepoints bis U+3000 (darüber: normales Zeichen)
+_LIMIT = 0x3001
+_NORMAL, _STRIPPED, _SPACE = 0, 1, 2
+
+_CLASS = np.zeros(_LIMIT + 1, dtype=np.uint8)
+_CLASS[[ord(c) for c in GERESH_VARIANTS + ''.join(NIQQUD)]] = _STRIPPED
+_CLASS[[c for c in range(_LIMIT) if chr(c).isspace()]] = _SPACE
+
+_MAP = np.arange(_LIMIT + 1, dtype=np.uint32)
+_MAP[_CLASS == _SPACE] = ord(' ')
+for _final, _base in FINAL_LETTERS.items():
+    _MAP[ord(_final)] = ord(_base)
+
+# Gleiche Normalisierung als str.translate-Tabelle (Whitespace danach per Regex)
+_TRANSLATE = {ord(c): None for c in GERESH_VARIANTS + ''.join(NIQQUD)}
+_TRANSLATE.update({ord(final): base for final, base in FINAL_LETTERS.items()})
+
+
+# Hilfsfunktionen
+
+def _encode(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+
+def normalize_codepoints(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalisiert einen Text
+
+    Returns:
+        (normalisierte Codepoints, Original-Position jedes Zeichens)
+    """
+    codepoints = _encode(text)
+    clipped = np.minimum(codepoints, _LIMIT)
+    classes = _CLASS[clipped]
+    positions = np.flatnonzero(classes != _STRIPPED)
+
+    # Whitespace-Folgen zusammenfassen (nach dem Entfernen, damit "א ' ב" eins wird)
+    is_space = classes[positions] == _SPACE
+    positions = positions[~(is_space & np.concatenate(([False], is_space[:-1])))]
+
+    mapped = _MAP[clipped[positions]]
+    # Zeichen oberhalb der Tabelle unverändert übernehmen
+    high = clipped[positions] == _LIMIT
+    if high.any():
+        mapped[high] = codepoints[positions[high]]
+    return mapped, positions
+
+
+def normalize(text: str) -> str:
+    """Normalisierte Form eines Textes (für Anfragen und Verifikation)"""
+    return WHITESPACE_RUN.sub(' ', text.translate(_TRANSLATE))
+
+
+def trigram_keys(codepoints: np.ndarray) -> np.ndarray:
+    """Eindeutige Trigramm-Schlüssel (3 × 21 Bit) einer Codepoint-Folge"""
+    if len(codepoints) < 3:
+        return np.zeros(0, dtype=np.uint64)
+    c = codepoints.astype(np.uint64)
+    keys = (c[:-2] << np.uint64(42)) | (c[1:-1] << np.uint64(21)) | c[2:]
+    return np.unique(keys)
+
+
+def build_trigram_index(source: Optional[Union[str, Path, Corpus]] = None,
+                        index_path: Union[str, Path] = DEFAULT_INDEX_PATH) -> Dict:
+    """
+    Baut den Trigramm-Index über alle Chunks
+
+    Args:
+        source: Corpus Pack oder Chunk-Verzeichnis (None = Standard)
+        index_path: Zieldatei (wird atomar ersetzt)
+
+    Returns:
+        Statistik-Dictionary
+    """
+    corpus = open_corpus(source)
+
+    chunk_ids = []
+    all_keys = []
+    all_chunks = []
+    all_positions = []
+    texts = []
+    try:
+        for number, (chunk_id, text) in enumerate(corpus):
+            codepoints, positions = normalize_codepoints(text)
+            keys = trigram_keys(codepoints)
+            chunk_ids.append(chunk_id)
+            all_keys.append(keys)
+            all_chunks.append(np.full(len(keys), number, dtype=np.uint32))
+            all_positions.append(positions.astype('<u4'))
+            texts.append(codepoints.astype('<u4').tobytes().decode('utf-32-le').encode('utf-8'))
+    finally:
+        if corpus is not source:
+            corpus.close()
+    if not chunk_ids:
+        raise ValueError(f"Keine Chunks in {corpus.path} gefunden")
+
+    keys = np.concatenate(all_keys)
+    chunks = np.concatenate(all_chunks)
+    order = np.lexsort((chunks, keys))
+    keys = keys[order]
+    chunks = chunks[order]
+
+    unique_keys, starts = np.unique(keys, return_index=True)
+    starts = np.append(starts, len(keys)).astype('<u4')
+
+    text_starts = np.zeros(len(texts) + 1, dtype='<u8')
+    np.cumsum([len(raw) for raw in texts], out=text_starts[1:])
+    position_starts = np.zeros(len(texts) + 1, dtype='<u8')
+    np.cumsum([len(positions) for positions in all_positions], out=position_starts[1:])
+
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(index_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER_STRUCT.pack(INDEX_MAGIC, len(unique_keys), len(chunks), len(chunk_ids),
+                                   0, int(text_starts[-1]), int(position_starts[-1])))
+        f.write(unique_keys.astype('<u8').tobytes())
+        f.write(text_starts.tobytes())
+        f.write(position_starts.tobytes())
+        f.write(starts.tobytes())
+        f.write(chunks.astype('<u4').tobytes())
+        f.write(np.array(chunk_ids, dtype='<u4').tobytes())
+        for positions in all_positions:
+            f.write(positions.tobytes())
+        for raw in texts:
+            f.write(raw)
+    os.replace(tmp_path, index_path)
+
+    return {
+        'index': str(index_path),
+        'chunks': len(chunk_ids),
+        'trigrams': len(unique_keys),
+        'postings': len(chunks),
+        'bytes': index_path.stat().st_size
+    }
+
+
+class TrigramIndex:
+    """Trigramm-Index via mmap plus Verifikation gegen den Corpus"""
+
+    def __init__(self, index_path: Union[str, Path] = DEFAULT_INDEX_PATH,
+                 source: Optional[Union[str, Path, Corpus]] = None):
+        """
+        Args:
+            index_path: Index-Datei
+            source: Corpus für die Verifikation (None = Standard-Pack)
+        """
+        self.path = Path(index_path)
+        self.corpus = open_corpus(source)
+        # Ein übergebener, schon geöffneter Corpus gehört dem Aufrufer
+        self._owns_corpus = self.corpus is not source
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, n_keys, n_postings, n_chunks, _,
+         text_bytes, n_positions) = HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} ist kein Ez Chajim Trigramm-Index")
+
+        offset = HEADER_STRUCT.size
+        sections = {}
+        for name, dtype, count in (('keys', '<u8', n_keys),
+                                   ('text_starts', '<u8', n_chunks + 1),
+                                   ('position_starts', '<u8', n_chunks + 1),
+                                   ('starts', '<u4', n_keys + 1),
+                                   ('postings', '<u4', n_postings),
+                                   ('chunk_ids', '<u4', n_chunks),
+                                   ('positions', '<u4', n_positions)):
+            sections[name] = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+            offset += count * np.dtype(dtype).itemsize
+        self._text_offset = offset
+        self._arrays = sections
+
+        self._keys = sections['keys']
+        self._chunk_ids = sections['chunk_ids'].tolist()
+        self._text_starts = sections['text_starts'].tolist()
+        self._position_starts = sections['position_starts'].tolist()
+
+    def __enter__(self) -> 'TrigramIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def close(self) -> None:
+        """Gibt Arrays, mmap und Datei frei, dazu den selbst geöffneten Corpus"""
+        # Arrays zuerst: sie halten Verweise auf den mmap-Puffer
+        self._arrays = {}
+        self._keys = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._owns_corpus:
+            self.corpus.close()
+            self._owns_corpus = False
+
+    def _numbers_for(self, key: int) -> np.ndarray:
+        """Chunk-Nummern eines Trigramms"""
+        pos = int(np.searchsorted(self._keys, np.uint64(key)))
+        if pos == len(self._keys) or int(self._keys[pos]) != key:
+            return np.zeros(0, dtype=np.uint32)
+        starts = self._arrays['starts']
+        return self._arrays['postings'][starts[pos]:starts[pos + 1]]
+
+    def _candidate_numbers(self, needle: str) -> List[int]:
+        keys = trigram_keys(np.frombuffer(needle.encode('utf-32-le'), dtype=np.uint32))
+        if len(keys) == 0:
+            # Unter 3 Zeichen: keine Trigramme, alle Chunks prüfen
+            return list(range(len(self._chunk_ids)))
+
+        lists = sorted((self._numbers_for(int(key)) for key in keys), key=len)
+        result = lists[0]
+        for numbers in lists[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, numbers, assume_unique=True)
+        return result.tolist()
+
+    def _normalized(self, number: int) -> str:
+        """Normalisierter Text eines Chunks (aus dem Index)"""
+        start = self._text_offset + self._text_starts[number]
+        end = self._text_offset + self._text_starts[number + 1]
+        return self._mmap[start:end].decode('utf-8')
+
+    def candidates(self, query: str) -> List[int]:
+        """Chunk-IDs, die alle Trigramme der (normalisierten) Anfrage enthalten"""
+        needle = normalize(query.strip())
+        return [self._chunk_ids[number] for number in self._candidate_numbers(needle)]
+
+    def search(self, query: str, context: int = DEFAULT_CONTEXT,
+               limit: Optional[int] = None) -> List[Dict]:
+        """
+        Sucht einen Begriff oder eine Phrase
+
+        Args:
+            query: Suchtext (wird normalisiert)
+            context: Zeichen Kontext links und rechts
+            limit: maximale Trefferzahl (None = alle)
+
+        Returns:
+            Liste von Treffern (chunk_id, offset, end, left, match, right),
+            Offsets beziehen sich auf den Original-Chunk-Text
+        """
+        needle = normalize(query.strip())
+        if not needle:
+            return []
+
+        positions = self._arrays['positions']
+        last = len(needle) - 1
+        hits = []
+        for number in self._candidate_numbers(needle):
+            haystack = self._normalized(number)
+            found = haystack.find(needle)
+            if found == -1:
+                continue
+
+            chunk_id = self._chunk_ids[number]
+            base = self._position_starts[number]
+            text = self.corpus.get(chunk_id)
+            while found != -1:
+                start = int(positions[base + found])
+                end = int(positions[base + found + last]) + 1
+                # Verifikation gegen den Pack (schützt auch vor veraltetem Index)
+                if normalize(text[start:end]) == needle:
+                    hits.append({
+                        'chunk_id': chunk_id,
+                        'offset': start,
+                        'end': end,
+                        'left': _context(text[max(0, start - context):start]),
+                        'match': text[start:end],
+                        'right': _context(text[end:end + context])
+                    })
+                    if limit is not None and len(hits) >= limit:
+                        return hits
+                found = haystack.find(needle, found + 1)
+        return hits
+
+
+def _context(text: str) -> str:
+    """Kontext einzeilig für die KWIC-Ausgabe (Leerzeichen am Rand bleiben)"""
+    return WHITESPACE_RUN.sub(' ', text)
+
+
+def format_kwic(hit: Dict, context: int = DEFAULT_CONTEXT) -> str:
+    """Eine KWIC-Zeile: CHUNK_nnnn @offset  …links[treffer]rechts…"""
+    left = hit['left'][-context:].rjust(context)
+    return f"CHUNK_{hit['chunk_id']:04d} @{hit['offset']:<5} {left}[{hit['match']}]{hit['right'][:context]}"
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Trigramm-Volltextindex")
+    parser.add_argument('--index', default=str(DEFAULT_INDEX_PATH))
+    parser.add_argument('--source', default=None, help="Corpus Pack oder Chunk-Verzeichnis")
+    sub = parser.add_subparsers(dest='befehl', required=True)
+
+    sub.add_parser('build', help="Index aus dem Corpus bauen")
+
+    search = sub.add_parser('search', help="Begriff oder Phrase suchen (KWIC)")
+    search.add_argument('query', nargs='+', help="Suchtext (mehrere Wörter = Phrase)")
+    search.add_argument('--context', type=int, default=DEFAULT_CONTEXT, help="Kontext in Zeichen")
+    search.add_argument('--limit', type=int, default=None, help="Maximale Trefferzahl")
+    search.add_argument('--json', action='store_true', help="Treffer als JSON ausgeben")
+
+    args = parser.parse_args()
+
+    if args.befehl == 'build':
+        stats = build_trigram_index(args.source, args.index)
+        print(f"✓ {stats['chunks']} Chunks, {stats['trigrams']} Trigramme, "
+              f"{stats['postings']} Postings ({stats['bytes']} Bytes)")
+        print(f"  → {stats['index']}")
+        print("\nQ!")
+    else:
+        with TrigramIndex(args.index, args.source) as index:
+            start = time.perf_counter()
+            hits = index.search(' '.join(args.query), args.context, args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+
+        if args.json:
+            print(json.dumps(hits, ensure_ascii=False, indent=2))
+        else:
+            for hit in hits:
+                print(format_kwic(hit, args.context))
+            chunks = len({hit['chunk_id'] for hit in hits})
+            print(f"\n{len(hits)} Treffer in {chunks} Chunks ({elapsed:.2f} ms)")
+            print("\nQ!")
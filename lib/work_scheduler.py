@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Größen-balancierter Arbeitsplan für Ez Chajim
+=============================================
+
+Verteilt Chunks zusammenhängend und in Original-Reihenfolge auf N Tage
+oder Worker, so dass die größte Last minimal wird (lineare Partition).
+Bisher wurde nach Anzahl geteilt (1342 // 49 Chunks pro Tag), egal wie
+lang die einzelnen Chunks sind.
+
+    • linear_partition   optimale Schnitte für eine Gewichtsfolge
+    • balanced_schedule  Dict[int, List[str]] wie create_study_schedule
+    • chunk_weights      Zeichen oder geschätzte Tokens pro Chunk
+
+Die DP über (Teile × Schnittposition) nutzt, dass die beste Last der
+ersten Teile mit der Schnittposition wächst und die Last des letzten
+Teils fällt: der optimale Schnitt liegt am Kreuzungspunkt und wird per
+np.searchsorted für alle Positionen zugleich gefunden
+(O(Teile · n log n) statt O(Teile · n²)).
+
+Stand: 5. Cheschwan 5787
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_packer import TokenEstimator
+
+MEASURES = ('tokens', 'chars')
+
+OMER_DAYS = 49
+
+
+def linear_partition(weights: Sequence[float], parts: int) -> List[Tuple[int, int]]:
+    """
+    Teilt weights in parts zusammenhängende Bereiche mit minimaler Maximal-Last
+
+    Returns:
+        (start, ende) pro Teil, ende exklusiv; leer ist ein Bereich nur,
+        wenn es mehr Teile als Gewichte gibt, und dann nur am Ende
+    """
+    if parts < 1:
+        raise ValueError("parts muss mindestens 1 sein")
+    weights = np.asarray(weights, dtype=np.float64)
+    if (weights < 0).any():
+        raise ValueError("Gewichte dürfen nicht negativ sein")
+
+    prefix = np.concatenate(([0.0], np.cumsum(weights)))
+
+    # best[i]: minimale Maximal-Last der ersten i Gewichte in j Teilen
+    best = prefix.copy()
+    cuts: List[np.ndarray] = []
+    for _ in range(1, parts):
+        # Kleinster Schnitt p mit best[p] >= Last des letzten Teils (prefix[i] - prefix[p]);
+        # best + prefix ist monoton, der Kreuzungspunkt also per Binärsuche
+        crossing = np.searchsorted(best + prefix, prefix, side='left')
+        before = np.maximum(crossing - 1, 0)
+        at_crossing = best[crossing]
+        before_crossing = np.where(crossing > 0, prefix - prefix[before], np.inf)
+
+        take_before = before_crossing < at_crossing
+        cuts.append(np.where(take_before, before, crossing))
+        best = np.where(take_before, before_crossing, at_crossing)
+
+    ranges = []
+    end = len(weights)
+    for cut in reversed(cuts):
+        start = int(cut[end])
+        ranges.append((start, end))
+        end = start
+    ranges.append((0, end))
+    ranges.reverse()
+    return _fill_empty(ranges, prefix, parts)
+
+
+def _fill_empty(ranges: List[Tuple[int, int]], prefix: np.ndarray,
+                parts: int) -> List[Tuple[int, int]]:
+    """
+    Leere Bereiche aus der DP (auch bei parts <= n möglich) durch Teilen füllen
+
+    Geteilt wird jeweils der schwerste Bereich mit mindestens zwei
+    Gewichten, am Lastmittelpunkt; Teilen erhöht die Maximal-Last nie.
+    Was nicht zu füllen ist, bleibt leer am Ende.
+    """
+    filled = [(start, end) for start, end in ranges if end > start]
+    while len(filled) < parts:
+        splittable = [index for index, (start, end) in enumerate(filled) if end - start > 1]
+        if not splittable:
+            break
+        index = max(splittable, key=lambda i: (prefix[filled[i][1]] - prefix[filled[i][0]], -i))
+        start, end = filled[index]
+        middle = int(np.searchsorted(prefix, (prefix[start] + prefix[end]) / 2, side='left'))
+        middle = min(max(middle, start + 1), end - 1)
+        # Nachbar links vom Mittelpunkt, wenn er die Hälften besser ausgleicht
+        if middle - 1 > start and (max(prefix[middle - 1] - prefix[start], prefix[end] - prefix[middle - 1])
+                                   < max(prefix[middle] - prefix[start], prefix[end] - prefix[middle])):
+            middle -= 1
+        filled[index:index + 1] = [(start, middle), (middle, end)]
+    total = len(prefix) - 1
+    return filled + [(total, total)] * (parts - len(filled))
+
+
+def balanced_schedule(ids: Sequence[str], weights: Sequence[float], parts: int,
+                      first: int = 1) -> Dict[int, List[str]]:
+    """
+    Arbeitsplan im Format von create_study_schedule
+
+    Args:
+        ids: Chunk-IDs in Original-Reihenfolge
+        weights: Last pro Chunk (Zeichen, Tokens, …)
+        parts: Anzahl Tage oder Worker
+        first: Nummer des ersten Tages/Workers
+
+    Returns:
+        {Tag/Worker: [Chunk-IDs]}
+    """
+    if len(ids) != len(weights):
+        raise ValueError(f"{len(ids)} IDs, aber {len(weights)} Gewichte")
+    return {
+        first + number: list(ids[start:end])
+        for number, (start, end) in enumerate(linear_partition(weights, parts))
+    }
+
+
+def chunk_weights(texts: Iterable[str], measure: str = 'tokens',
+                  estimator: Optional[TokenEstimator] = None) -> List[int]:
+    """Last pro Text: geschätzte Tokens (batch_packer) oder Zeichen"""
+    if measure not in MEASURES:
+        raise ValueError(f"Unbekanntes Maß: {measure}")
+    if measure == 'chars':
+        return [len(text) for text in texts]
+    estimator = estimator or TokenEstimator()
+    return [estimator.estimate(text) for text in texts]
+
+
+def schedule_loads(schedule: Dict[int, List[str]], weights: Dict[str, float]) -> Dict:
+    """Last pro Tag/Worker und Kennzahlen (max, min, Verhältnis max/Mittel)"""
+    loads = {part: sum(weights[chunk_id] for chunk_id in chunk_ids)
+             for part, chunk_ids in schedule.items()}
+    values = list(loads.values())
+    mean = sum(values) / len(values) if values else 0
+    return {
+        'loads': loads,
+        'max': max(values, default=0),
+        'min': min(values, default=0),
+        'imbalance': round(max(values) / mean, 4) if mean else 0.0
+    }
+
+
+def schedule_corpus(source=None, parts: int = OMER_DAYS, measure: str = 'tokens',
+                    first: int = 1) -> Dict[int, List[str]]:
+    """Balancierter Plan für den ganzen Corpus (Pack oder Chunk-Verzeichnis)"""
+    from corpus_pack import open_corpus
+
+    corpus = open_corpus(source)
+    ids = []
+    texts = []
+    for chunk_id, text in corpus:
+        ids.append(f"CHUNK_{chunk_id:04d}")
+        texts.append(text)
+    return balanced_schedule(ids, chunk_weights(texts, measure), parts, first)
+
+
+# CLI
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from corpus_pack import open_corpus
+
+    parser = argparse.ArgumentParser(description="Ez Chajim Arbeitsplan (größen-balanciert)")
+    parser.add_argument('--source', default=None, help="Corpus Pack oder Chunk-Verzeichnis")
+    parser.add_argument('--parts', type=int, default=OMER_DAYS, help="Tage oder Worker")
+    parser.add_argument('--measure', default='tokens', choices=MEASURES)
+    args = parser.parse_args()
+
+    corpus = open_corpus(args.source)
+    ids = []
+    texts = []
+    for chunk_id, text in corpus:
+        ids.append(f"CHUNK_{chunk_id:04d}")
+        texts.append(text)
+    weights = chunk_weights(texts, args.measure)
+    by_id = dict(zip(ids, weights))
+
+    # Bisher: nach Anzahl, die ersten Tage einen Chunk mehr
+    per_part, remainder = divmod(len(ids), args.parts)
+    counted: Dict[int, List[str]] = {}
+    index = 0
+    for part in range(1, args.parts + 1):
+        size = per_part + (part <= remainder)
+        counted[part] = ids[index:index + size]
+        index += size
+
+    start = time.perf_counter()
+    balanced = balanced_schedule(ids, weights, args.parts)
+    elapsed = time.perf_counter() - start
+
+    for name, schedule in (("Nach Anzahl", counted), ("Balanciert", balanced)):
+        stats = schedule_loads(schedule, by_id)
+        print(f"{name}: max {stats['max']}, min {stats['min']} {args.measure}, "
+              f"max/Mittel {stats['imbalance']:.3f}")
+    print(f"  ({len(ids)} Chunks auf {args.parts} Teile in {elapsed * 1000:.1f} ms)")
+
+    print("\nQ!")
@@ -7,24 +7,67 @@ YAML Ez Chajim Formatter
 Formatiert Ez Chajim Inhalte in strukturiertes YAML
 mit Omer-Studienpfaden und WWAQ-Validierung.
 
+YAML läuft über EzChajimDumper (libyaml/CSafeDumper wenn installiert),
+Chunks gibt es zusätzlich als JSON Lines (write_chunks, fmt='jsonl').
+Vergleich der Pfade: python yaml_ez_chajim_formatter.py --benchmark
+
 Stand: 20. Tammus 5785
 """
 
 import yaml
-from typing import Dict, List, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Any, Optional, Sequence, Union
 from datetime import datetime
+from functools import lru_cache
 import json
 from pathlib import Path
 import re
 
+from chunk_records import RECORD_TYPES, BatchEntry, ChunkRecord, OmerStudyRecord
+
+if TYPE_CHECKING:
+    from translation_store import TranslationStore
+
+# libyaml (C-Emitter) wenn vorhanden, sonst reines Python
+try:
+    from yaml import CSafeDumper as _BaseDumper
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper
+    LIBYAML = False
+
+HEBREW_PATTERN = re.compile('[\u0590-\u05FF]')
+
+OUTPUT_FORMATS = ('yaml', 'jsonl')
+
+@lru_cache(maxsize=8192)
+def contains_hebrew(text: str) -> bool:
+    """Enthält der String hebräische Zeichen? (ein Regex-Lauf, Ergebnis pro String gecacht)"""
+    return HEBREW_PATTERN.search(text) is not None
+
 # Eigene YAML-Representer für bessere Formatierung
 def hebrew_str_representer(dumper, data):
     """Spezielle Behandlung für hebräische Strings"""
-    if any('\u0590' <= char <= '\u05FF' for char in data):
+    if contains_hebrew(data):
         return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
     return dumper.represent_scalar('tag:yaml.org,2002:str', data)
 
-yaml.add_representer(str, hebrew_str_representer)
+class EzChajimDumper(_BaseDumper):
+    """Dumper mit Block-Stil für hebräische Strings (nur für diesen Formatter registriert)"""
+
+def record_representer(dumper, record):
+    """Records werden erst bei der Ausgabe zum Dictionary"""
+    return dumper.represent_dict(record.to_dict())
+
+EzChajimDumper.add_representer(str, hebrew_str_representer)
+for _record_type in RECORD_TYPES:
+    EzChajimDumper.add_representer(_record_type, record_representer)
+
+def dump_yaml(data: Any, stream=None, **options) -> Optional[str]:
+    """yaml.dump mit EzChajimDumper und den Formatter-Vorgaben"""
+    options.setdefault('default_flow_style', False)
+    options.setdefault('allow_unicode', True)
+    options.setdefault('sort_keys', False)
+    return yaml.dump(data, stream, Dumper=EzChajimDumper, **options)
 
 class YAMLEzChajimFormatter:
     """Hauptklasse für YAML-Formatierung"""
@@ -33,6 +76,8 @@ class YAMLEzChajimFormatter:
         # Ez Chajim Struktur-Schema
         self.schema_version = "1.0"
         self.current_date = datetime.now()
+        self._created_for: Optional[datetime] = None
+        self._created_iso = ''
         
         # Omer-Sefirot Mapping
         self.sefirot = {
@@ -45,58 +90,11 @@ class YAMLEzChajimFormatter:
             7: 'מלכות'   # Malchut
         }
         
-        # Struktur-Templates
+        # Struktur-Templates (Chunks und Omer-Pfade: chunk_records)
         self.templates = {
-            'chunk': self._get_chunk_template(),
-            'omer_study': self._get_omer_template(),
             'metadata': self._get_metadata_template()
         }
     
-    def _get_chunk_template(self) -> Dict:
-        """Template für Chunk-Struktur"""
-        return {
-            'chunk_info': {
-                'id': None,
-                'source': 'Ez Chajim',
-                'author': 'Chajim Vital',
-                'tradition': 'Lurianische Qabbala'
-            },
-            'content': {
-                'hebrew': None,
-                'german': None,
-                'commentary': []
-            },
-            'analysis': {
-                'gematria': {},
-                'key_concepts': [],
-                'cross_references': []
-            },
-            'metadata': {
-                'created': None,
-                'modified': None,
-                'wwaq_validated': False
-            }
-        }
-    
-    def _get_omer_template(self) -> Dict:
-        """Template für Omer-Studienpfad"""
-        return {
-            'omer_day': None,
-            'date': None,
-            'sefirot_combination': {
-                'week': None,
-                'day': None,
-                'full': None
-            },
-            'study_focus': {
-                'theme': None,
-                'meditation': None,
-                'practical_work': None
-            },
-            'assigned_chunks': [],
-            'reflections': []
-        }
-    
     def _get_metadata_template(self) -> Dict:
         """Template für Gesamt-Metadaten"""
         return {
@@ -119,68 +117,73 @@ class YAMLEzChajimFormatter:
             }
         }
     
+    def chunk_record(self, chunk_data: Dict) -> ChunkRecord:
+        """Chunk als unveränderlicher Record (YAML/JSON-Form über to_dict)"""
+        return ChunkRecord.from_chunk(
+            chunk_data,
+            created=self._created(),
+            wwaq_validated=self._validate_wwaq(chunk_data)
+        )
+    
+    def _created(self) -> str:
+        """Zeitstempel als String, einmal pro current_date (von allen Records geteilt)"""
+        if self._created_for != self.current_date:
+            self._created_for = self.current_date
+            self._created_iso = self.current_date.isoformat()
+        return self._created_iso
+    
     def format_chunk(self, chunk_data: Dict) -> str:
         """Formatiert einen Chunk als YAML"""
-        template = self.templates['chunk'].copy()
-        
-        # Fülle Template
-        template['chunk_info']['id'] = chunk_data.get('id')
-        template['content']['hebrew'] = chunk_data.get('original', '')
-        template['content']['german'] = chunk_data.get('translation', '')
-        
-        # Analyse-Daten
-        if 'metadata' in chunk_data:
-            meta = chunk_data['metadata']
-            template['analysis']['gematria'] = meta.get('gematria', {})
-            template['analysis']['key_concepts'] = [
-                f"{term['hebrew']} ({term['translation']})"
-                for term in meta.get('key_terms', [])
-            ]
+        return dump_yaml(self.chunk_record(chunk_data), width=80, indent=2)
+    
+    def format_chunk_json(self, chunk_data: Dict) -> str:
+        """Formatiert einen Chunk als eine JSON-Zeile (für JSON Lines)"""
+        return json.dumps(self.chunk_record(chunk_data).to_dict(), ensure_ascii=False)
+    
+    def write_chunks(self, chunks: Iterable[Dict], stream, fmt: str = 'yaml') -> int:
+        """
+        Schreibt Chunks nacheinander in einen Stream
         
-        # Metadaten
-        template['metadata']['created'] = self.current_date.isoformat()
-        template['metadata']['wwaq_validated'] = self._validate_wwaq(chunk_data)
+        fmt: 'yaml' (ein Dokument pro Chunk, getrennt durch ---)
+             oder 'jsonl' (eine JSON-Zeile pro Chunk)
         
-        # YAML generieren mit speziellen Optionen
-        return yaml.dump(
-            template,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            width=80,
-            indent=2
-        )
+        Returns:
+            Anzahl geschriebener Chunks
+        """
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unbekanntes Ausgabeformat: {fmt}")
+        count = 0
+        for chunk_data in chunks:
+            if fmt == 'jsonl':
+                stream.write(self.format_chunk_json(chunk_data) + '\n')
+            else:
+                stream.write('---\n')
+                dump_yaml(self.chunk_record(chunk_data), stream, width=80, indent=2)
+            count += 1
+        return count
     
     def format_omer_study_path(self, day: int, assigned_chunks: List[str]) -> str:
         """Erstellt Omer-Studienpfad für einen Tag"""
         if not 1 <= day <= 49:
             raise ValueError("Omer-Tag muss zwischen 1 und 49 liegen")
         
-        template = self.templates['omer_study'].copy()
-        
         # Berechne Sefirot-Kombination
         week = (day - 1) // 7 + 1
         weekday = (day - 1) % 7 + 1
         
-        template['omer_day'] = day
-        template['date'] = f"Tag {day} des Omer"
-        template['sefirot_combination'] = {
-            'week': self.sefirot[week],
-            'day': self.sefirot[weekday],
-            'full': f"{self.sefirot[weekday]} שב{self.sefirot[week]}"
-        }
-        
         # Studienthema basierend auf Sefirot-Kombination
-        template['study_focus'] = self._generate_study_focus(week, weekday)
-        template['assigned_chunks'] = assigned_chunks
-        
-        return yaml.dump(
-            template,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            indent=2
+        focus = self._generate_study_focus(week, weekday)
+        record = OmerStudyRecord(
+            day,
+            self.sefirot[week],
+            self.sefirot[weekday],
+            focus['theme'],
+            focus['meditation'],
+            focus['practical_work'],
+            tuple(assigned_chunks)
         )
+        
+        return dump_yaml(record, indent=2)
     
     def _generate_study_focus(self, week: int, day: int) -> Dict:
         """Generiert Studienfokus basierend auf Sefirot"""
@@ -219,13 +222,7 @@ class YAMLEzChajimFormatter:
         
         # Speichere Metadaten
         with open(output_dir / 'metadata.yaml', 'w', encoding='utf-8') as f:
-            yaml.dump(
-                structure['metadata.yaml'],
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False
-            )
+            dump_yaml(structure['metadata.yaml'], f)
         
         return structure
     
@@ -249,63 +246,70 @@ class YAMLEzChajimFormatter:
     
     def generate_batch_yaml(self, batch: Dict) -> str:
         """Generiert YAML für Übersetzungs-Batch"""
-        batch_structure = {
-            'batch_metadata': {
-                'id': batch['batch_id'],
-                'created': self.current_date.isoformat(),
-                'chunk_count': len(batch['chunks']),
-                'instruction': batch['instruction']
-            },
-            'chunks_to_translate': []
+        return dump_yaml(self._batch_structure(batch), width=100, indent=2)
+    
+    def write_batch_yaml(self, batch: Dict, stream) -> None:
+        """Schreibt das Batch-YAML direkt in einen Stream (ohne Zwischen-String)"""
+        dump_yaml(self._batch_structure(batch), stream, width=100, indent=2)
+    
+    def _batch_structure(self, batch: Dict) -> Dict:
+        """Batch als Dictionary für YAML (Anweisung inline oder als Verweis)"""
+        batch_metadata = {
+            'id': batch['batch_id'],
+            'created': self.current_date.isoformat(),
+            'chunk_count': len(batch['chunks'])
         }
+        if 'instruction_ref' in batch:
+            batch_metadata['instruction_ref'] = batch['instruction_ref']
+        else:
+            batch_metadata['instruction'] = batch['instruction']
         
-        for chunk in batch['chunks']:
-            chunk_entry = {
-                'chunk_id': chunk['id'],
-                'hebrew_text': chunk['text'],
-                'context': {
-                    'gematria_value': chunk['gematria_hint'],
-                    'key_terms': [
-                        {
-                            'hebrew': term['hebrew'],
-                            'meaning': term['translation']
-                        }
-                        for term in chunk['key_terms']
-                    ]
-                },
-                'translation_placeholder': "[DEUTSCHE ÜBERSETZUNG HIER]"
-            }
-            batch_structure['chunks_to_translate'].append(chunk_entry)
-        
-        return yaml.dump(
-            batch_structure,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            width=100,
-            indent=2
-        )
+        return {
+            'batch_metadata': batch_metadata,
+            'chunks_to_translate': [BatchEntry.from_chunk(chunk) for chunk in batch['chunks']]
+        }
     
     def merge_translations(self, original_chunks: List[Dict], 
-                         translations: Dict[str, str]) -> List[Dict]:
-        """Fügt Übersetzungen zu Original-Chunks hinzu"""
+                         translations: Union[Dict[str, str], 'TranslationStore']) -> List[Dict]:
+        """
+        Fügt Übersetzungen zu Original-Chunks hinzu
+        
+        translations: Dictionary chunk_id → Text oder TranslationStore
+        (Abfrage pro Chunk-ID, ohne alles in den Speicher zu laden;
+        Teile wie CHUNK_0042.01 bekommen dort die Übersetzung des ganzen Chunks)
+        """
         merged = []
         
         for chunk in original_chunks:
             chunk_id = chunk['id']
-            if chunk_id in translations:
-                chunk['translation'] = translations[chunk_id]
+            translation = translations.get(chunk_id)
+            if translation is not None:
+                chunk['translation'] = translation
                 chunk['translation_metadata'] = {
                     'translated': True,
                     'date': self.current_date.isoformat(),
-                    'validated': self._validate_wwaq({'text': translations[chunk_id]})
+                    'validated': self._validate_wwaq({'text': translation})
                 }
             merged.append(chunk)
         
         return merged
     
-    def create_study_schedule(self, total_chunks: int = 1342) -> Dict[int, List[str]]:
-        """Erstellt 49-Tage Omer-Studienplan für alle Chunks"""
+    def create_study_schedule(self, total_chunks: int = 1342,
+                              weights: Optional[Sequence[float]] = None) -> Dict[int, List[str]]:
+        """
+        Erstellt 49-Tage Omer-Studienplan für alle Chunks
+        
+        Ohne weights: gleich viele Chunks pro Tag.
+        Mit weights (Zeichen oder Tokens pro Chunk, siehe work_scheduler):
+        zusammenhängende Tage mit minimaler größter Tageslast.
+        """
+        if weights is not None:
+            from work_scheduler import OMER_DAYS, balanced_schedule
+            if len(weights) != total_chunks:
+                raise ValueError(f"{len(weights)} Gewichte für {total_chunks} Chunks")
+            ids = [f"CHUNK_{chunk_index:04d}" for chunk_index in range(1, total_chunks + 1)]
+            return balanced_schedule(ids, weights, OMER_DAYS)
+        
         chunks_per_day = total_chunks // 49
         remainder = total_chunks % 49
         
@@ -330,23 +334,107 @@ def create_formatter() -> YAMLEzChajimFormatter:
     """Factory-Funktion für Formatter"""
     return YAMLEzChajimFormatter()
 
-def format_for_claude_batch(chunks: List[Dict], batch_size: int = 10) -> List[str]:
-    """Formatiert Chunks für Claude-Batch-Verarbeitung"""
+def format_for_claude_batch(chunks: List[Dict], batch_size: int = 10,
+                            token_budget: Optional[int] = None) -> List[str]:
+    """
+    Formatiert Chunks für Claude-Batch-Verarbeitung
+    
+    Mit token_budget werden die Batches nach geschätzten Tokens gepackt
+    (batch_packer) statt nach fester Anzahl; zu große Chunks erscheinen
+    als Teile mit Unter-IDs (CHUNK_0042.01, …).
+    """
     formatter = create_formatter()
+    instruction = "Übersetze mit WWAQ-Konformität"
     batches = []
     
+    if token_budget is not None:
+        from batch_packer import pack
+        
+        by_id = {chunk['id']: chunk for chunk in chunks}
+        packed = pack(((chunk['id'], chunk['text']) for chunk in chunks), token_budget, instruction)
+        for number, pieces in enumerate(packed.batches, 1):
+            batch = {
+                'batch_id': f"BATCH_{number:03d}",
+                'chunks': [dict(by_id[piece.chunk_id], id=piece.id, text=piece.text)
+                           for piece in pieces],
+                'instruction': instruction
+            }
+            batches.append(formatter.generate_batch_yaml(batch))
+        return batches
+    
     for i in range(0, len(chunks), batch_size):
         batch = {
             'batch_id': f"BATCH_{i//batch_size + 1:03d}",
             'chunks': chunks[i:i + batch_size],
-            'instruction': "Übersetze mit WWAQ-Konformität"
+            'instruction': instruction
         }
         batches.append(formatter.generate_batch_yaml(batch))
     
     return batches
 
+def benchmark_emitters(chunks: List[Dict], rounds: int = 3) -> Dict[str, float]:
+    """
+    Vergleicht die Ausgabepfade für format_chunk über viele Chunks
+    
+    Returns:
+        Bester Lauf in Sekunden pro Pfad: python (SafeDumper, Zeichen-Scan
+        wie bisher), libyaml (EzChajimDumper), jsonl
+    """
+    import io
+    import time
+    
+    def scan_representer(dumper, data):
+        # Bisheriger Representer: Zeichen für Zeichen
+        if any('\u0590' <= char <= '\u05FF' for char in data):
+            return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
+        return dumper.represent_scalar('tag:yaml.org,2002:str', data)
+    
+    class PythonDumper(yaml.SafeDumper):
+        pass
+    
+    PythonDumper.add_representer(str, scan_representer)
+    
+    formatter = create_formatter()
+    records = [formatter.chunk_record(chunk) for chunk in chunks]
+    paths = {
+        'python': lambda out: [yaml.dump(record.to_dict(), out, Dumper=PythonDumper, default_flow_style=False,
+                                         allow_unicode=True, sort_keys=False, width=80, indent=2)
+                               for record in records],
+        'libyaml': lambda out: [dump_yaml(record, out, width=80, indent=2) for record in records],
+        'jsonl': lambda out: [out.write(json.dumps(record.to_dict(), ensure_ascii=False) + '\n')
+                              for record in records]
+    }
+    
+    results = {}
+    for name, run in paths.items():
+        best = None
+        for _ in range(rounds):
+            contains_hebrew.cache_clear()
+            start = time.perf_counter()
+            run(io.StringIO())
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+    return results
+
 # Test und Beispiel
 if __name__ == "__main__":
+    import sys
+    
+    if '--benchmark' in sys.argv:
+        from analysis_cache import AnalysisCache
+        from manuscript_processor import ManuscriptProcessor
+        
+        processor = ManuscriptProcessor()
+        analysis = processor.analyze_corpus(cache=AnalysisCache(processor.ruleset_stamp()))
+        print(f"Benchmark: {len(analysis['chunks'])} Chunks (libyaml: {'ja' if LIBYAML else 'nein'})")
+        results = benchmark_emitters(analysis['chunks'])
+        for name, elapsed in results.items():
+            speedup = results['python'] / elapsed
+            print(f"  {name:8} {elapsed * 1000:8.1f} ms  ({speedup:.1f}×)")
+        print("\nQ!")
+        sys.exit(0)
+    
     print("YAML Ez Chajim Formatter Test")
     print("=" * 50)
     
@@ -10,7 +10,16 @@ from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import unicodedata
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+# lib/ in den Suchpfad (Gematria- und Rewrite-Engine)
+_LIB_DIR = str(Path(__file__).resolve().parents[3] / 'lib')
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
+from gematria_engine import get_engine as get_gematria_engine
+from rewrite_engine import get_engine
 
 # ============= 1. TRANSLITERATION (UMSCHRIFT) =============
 
@@ -128,9 +137,8 @@ class HebraischDeutschTransliterator:
     
     def transliteriere(self, text: str) -> str:
         """Hauptfunktion für Transliteration mit Q-System"""
-        # Q-Regeln anwenden
-        for alt, neu in self.q_regeln.items():
-            text = text.replace(alt, neu)
+        # Q-Regeln anwenden (ein Durchlauf, längster Treffer gewinnt)
+        text, _ = get_engine(self.q_regeln).rewrite(text)
         
         return text
 
@@ -302,16 +310,14 @@ class ZerEliminator:
     
     def eliminiere_zer(self, text: str) -> Tuple[str, List[str]]:
         """Ersetzt alle zer-Wörter"""
-        aenderungen = []
-        
+        # Auch Großschreibung
+        tabelle = {}
         for alt, neu in self.zer_transformationen.items():
-            if alt in text:
-                text = text.replace(alt, neu)
-                aenderungen.append(f"{alt} → {neu}")
-            # Auch Großschreibung
-            if alt.capitalize() in text:
-                text = text.replace(alt.capitalize(), neu.capitalize())
-                aenderungen.append(f"{alt.capitalize()} → {neu.capitalize()}")
+            tabelle.setdefault(alt, neu)
+            tabelle.setdefault(alt.capitalize(), neu.capitalize())
+        
+        text, treffer = get_engine(tabelle).rewrite(text)
+        aenderungen = [f"{alt} → {neu}" for alt, neu in tabelle.items() if alt in treffer]
         
         return text, aenderungen
 
@@ -358,15 +364,8 @@ class SprachWerkzeuge:
         return herkunft_db.get(begriff, {'sprache': 'unbekannt'})
     
     def gematria_berechnung(self, wort: str) -> int:
-        """Berechnet Gematria-Wert"""
-        gematria_werte = {
-            'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5,
-            'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
-            'כ': 20, 'ל': 30, 'מ': 40, 'נ': 50, 'ס': 60,
-            'ע': 70, 'פ': 80, 'צ': 90, 'ק': 100, 'ר': 200,
-            'ש': 300, 'ת': 400
-        }
-        return sum(gematria_werte.get(buchstabe, 0) for buchstabe in wort)
+        """Berechnet Gematria-Wert (Schlussbuchstaben zählen mit Grundwert)"""
+        return get_gematria_engine().value(wort)
     
     def _silben_trennung(self, wort: str) -> List[str]:
         """Trennt Wort in Silben"""
@@ -14,7 +14,14 @@ KRITISCH: Jeder falsche Buchstabe leitet Licht zu den Qlipot!
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
-import re
+from pathlib import Path
+import sys
+
+# Gemeinsamer Matcher aus lib/
+_LIB_DIR = str(Path(__file__).resolve().parents[3] / 'lib')
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
+from rewrite_engine import RewriteEngine, RewriteRule
 
 # Integration mit anderen Modulen
 from typing import TYPE_CHECKING
@@ -37,6 +44,66 @@ class WWAKViolation:
     severity: str  # "kritisch", "warnung", "hinweis"
     world_impact: Optional[str] = None  # Welche Welt wird beeinflusst
 
+# Hebräische Lehnwörter die Q bekommen MÜSSEN
+HEBREW_LOANWORDS = {
+    "kabbala": "Qabbala",
+    "kabala": "Qabbala",
+    "kli": "Qli",
+    "klipot": "Qlipot",
+    "klipa": "Qlipa",
+    "kelim": "Qelim",
+    "kedusha": "Qedusha",
+    "kawana": "Qawana",
+    "tikkun": "Tiqqun",
+    "tikun": "Tiqqun",
+    # Spezielle Formen
+    "wwak": "WWAK",
+    "wwac": "WWAK"
+}
+
+# Deutsche Wörter die NIEMALS Q bekommen
+GERMAN_PROTECTED = [
+    "krone", "kronen", "qualität", "quelle", 
+    "kommen", "können", "kennen", "kraft"
+]
+
+# Adjektive und Deklinationen - IMMER klein, NIE mit Q
+FORBIDDEN_Q_FORMS = [
+    "qabbalistisch", "qabbalistische", "qabbalistischen",
+    "klipotisch", "klipotische", "klipotischen"
+]
+
+# Deutsche Wörter fälschlich mit Q ("Qrone", "Qraft" etc.)
+FALSE_Q_WORDS = ["qrone", "qraft", "qommen", "qönnen"]
+
+# Reihenfolge der Prüfungen im Ergebnis
+RULE_ORDER = {"false_q_in_german": 0, "missing_q_in_hebrew": 1, "forbidden_q_form": 2}
+
+
+def _compile_rule_matcher() -> Tuple[RewriteEngine, Dict[str, Tuple[str, int, Optional[str]]]]:
+    """
+    Kombiniert alle Wort-Regeln zu einem Matcher (ganze Wörter, ohne Groß-/Kleinschreibung)
+    
+    Returns:
+        (Engine, Wort → (violation_type, Regel-Index, Korrektur))
+    """
+    rules = {}
+    for word in FALSE_Q_WORDS:
+        rules[word] = ("false_q_in_german", 0, None)
+    for index, (wrong, correct) in enumerate(HEBREW_LOANWORDS.items()):
+        rules[wrong] = ("missing_q_in_hebrew", index, correct)
+    for index, forbidden in enumerate(FORBIDDEN_Q_FORMS):
+        rules[forbidden] = ("forbidden_q_form", index, None)
+    
+    engine = RewriteEngine(
+        [RewriteRule(word, word, word_boundary=True, ignore_case=True) for word in rules]
+    )
+    return engine, rules
+
+
+RULE_MATCHER, RULE_INFO = _compile_rule_matcher()
+
+
 class WWAKBuchstabenLehre:
     """
     Die heilige Geometrie der Buchstaben bewahren
@@ -54,113 +121,64 @@ class WWAKBuchstabenLehre:
         # Qi Ilu Azilut Modus - als ob es schon perfekt wäre
         self.qi_ilu_azilut_mode = False
         
-        # Hebräische Lehnwörter die Q bekommen MÜSSEN
-        self.hebrew_loanwords = {
-            "kabbala": "Qabbala",
-            "kabala": "Qabbala",
-            "kli": "Qli",
-            "klipot": "Qlipot",
-            "klipa": "Qlipa",
-            "kelim": "Qelim",
-            "kedusha": "Qedusha",
-            "kawana": "Qawana",
-            "tikkun": "Tiqqun",
-            "tikun": "Tiqqun",
-            # Spezielle Formen
-            "wwak": "WWAK",
-            "wwac": "WWAK"
-        }
-        
-        # Deutsche Wörter die NIEMALS Q bekommen
-        self.german_protected = [
-            "krone", "kronen", "qualität", "quelle", 
-            "kommen", "können", "kennen", "kraft"
-        ]
-        
-        # Adjektive und Deklinationen - IMMER klein, NIE mit Q
-        self.forbidden_q_forms = [
-            "qabbalistisch", "qabbalistische", "qabbalistischen",
-            "klipotisch", "klipotische", "klipotischen"
-        ]
+        # Regel-Tabellen (gemeinsam, beim Import kompiliert)
+        self.hebrew_loanwords = HEBREW_LOANWORDS
+        self.german_protected = GERMAN_PROTECTED
+        self.forbidden_q_forms = FORBIDDEN_Q_FORMS
         
     def check_text(self, text: str) -> List[WWAKViolation]:
         """Prüft einen Text auf WWAK-Konformität"""
-        violations = []
-        
-        # Prüfung 1: Falsche Q-Verwendung in deutschen Wörtern
-        violations.extend(self._check_false_q_usage(text))
-        
-        # Prüfung 2: Fehlende Q in hebräischen Lehnwörtern
-        violations.extend(self._check_missing_q(text))
-        
-        # Prüfung 3: Verbotene Q-Formen (Adjektive etc.)
-        violations.extend(self._check_forbidden_q(text))
+        # Prüfungen 1-3: Falsche Q-Verwendung, fehlende Q, verbotene Q-Formen
+        # (ein einziger Durchlauf über den kombinierten Matcher)
+        violations = self._scan_word_rules(text)
         
         # Prüfung 4: Kritische spirituelle Integrität
         violations.extend(self._check_spiritual_integrity(text))
         
         return violations
     
-    def _check_false_q_usage(self, text: str) -> List[WWAKViolation]:
-        """Findet deutsche Wörter die fälschlich mit Q geschrieben wurden"""
-        violations = []
-        
-        # Suche nach Wörtern wie "Qrone", "Qraft" etc.
-        false_q_pattern = r'\b[Qq](?:rone|raft|ommen|önnen)\b'
+    def _scan_word_rules(self, text: str) -> List[WWAKViolation]:
+        """Findet alle Wort-Verstöße in einem Durchlauf"""
+        found = []
         
-        for match in re.finditer(false_q_pattern, text, re.IGNORECASE):
-            word = match.group()
-            corrected = word.replace('Q', 'K').replace('q', 'k')
+        for start, stop, rule in RULE_MATCHER.finditer(text):
+            violation_type, index, correct = RULE_INFO[rule.pattern]
+            word = text[start:stop]
             
-            violations.append(WWAKViolation(
+            if violation_type == "false_q_in_german":
+                correction = word.replace('Q', 'K').replace('q', 'k')
+            elif violation_type == "missing_q_in_hebrew":
+                # Nur wenn es ein Substantiv ist (Großschreibung prüfen)
+                if not word[0].isupper():
+                    continue
+                correction = correct
+            else:
+                correction = word.replace('q', 'k').replace('Q', 'k')
+            
+            found.append((RULE_ORDER[violation_type], index, WWAKViolation(
                 text=word,
-                position=match.start(),
-                violation_type="false_q_in_german",
-                correction=corrected,
+                position=start,
+                violation_type=violation_type,
+                correction=correction,
                 severity="kritisch"
-            ))
-            
-        return violations
+            )))
+        
+        # Gleiche Reihenfolge wie die früheren Einzelprüfungen:
+        # nach Prüfung, dann Regel, dann Position (sort ist stabil)
+        found.sort(key=lambda entry: (entry[0], entry[1]))
+        return [violation for _, _, violation in found]
+    
+    def _check_false_q_usage(self, text: str) -> List[WWAKViolation]:
+        """Findet deutsche Wörter die fälschlich mit Q geschrieben wurden"""
+        return [v for v in self._scan_word_rules(text) if v.violation_type == "false_q_in_german"]
     
     def _check_missing_q(self, text: str) -> List[WWAKViolation]:
         """Findet hebräische Lehnwörter ohne Q"""
-        violations = []
-        
-        for wrong, correct in self.hebrew_loanwords.items():
-            pattern = r'\b' + re.escape(wrong) + r'\b'
-            
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Nur wenn es ein Substantiv ist (Großschreibung prüfen)
-                if match.group()[0].isupper():
-                    violations.append(WWAKViolation(
-                        text=match.group(),
-                        position=match.start(),
-                        violation_type="missing_q_in_hebrew",
-                        correction=correct,
-                        severity="kritisch"
-                    ))
-                    
-        return violations
+        return [v for v in self._scan_word_rules(text) if v.violation_type == "missing_q_in_hebrew"]
     
     def _check_forbidden_q(self, text: str) -> List[WWAKViolation]:
         """Findet verbotene Q-Verwendungen in Adjektiven/Deklinationen"""
-        violations = []
-        
-        for forbidden in self.forbidden_q_forms:
-            pattern = r'\b' + re.escape(forbidden) + r'\b'
-            
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                corrected = match.group().replace('q', 'k').replace('Q', 'k')
-                
-                violations.append(WWAKViolation(
-                    text=match.group(),
-                    position=match.start(),
-                    violation_type="forbidden_q_form",
-                    correction=corrected,
-                    severity="kritisch"
-                ))
-                
-        return violations
+        return [v for v in self._scan_word_rules(text) if v.violation_type == "forbidden_q_form"]
     
     def _check_spiritual_integrity(self, text: str) -> List[WWAKViolation]:
         """Prüft auf spirituelle Integrität - Männliches Qli"""
@@ -11,10 +11,19 @@ WWAK-konform implementiert
 """
 
 import re
+import sys
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
 import unicodedata
 
+# lib/ in den Suchpfad (Gematria- und Rewrite-Engine)
+_LIB_DIR = str(Path(__file__).resolve().parents[3] / 'lib')
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
+from gematria_engine import GematriaEngine
+from rewrite_engine import get_engine
+
 class ManuscriptProcessor:
     """
     Prozessor für Ez Chajim Manuskripte
@@ -39,6 +48,8 @@ class ManuscriptProcessor:
             'ש': 300, 'ת': 400
         }
         
+        self.gematria_engine = GematriaEngine(self.gematria_values)
+        
         # Struktur-Muster
         self.patterns = {
             'kapitel': re.compile(r'^#\s+(.+)$', re.MULTILINE),
@@ -77,17 +88,14 @@ class ManuscriptProcessor:
         Returns:
             Gematria-Wert
         """
-        total = 0
-        for char in text:
-            if char in self.gematria_values:
-                total += self.gematria_values[char]
-        
-        return total
+        return self.gematria_engine.value(text)
     
     def find_gematria_connections(self, words: List[str]) -> Dict[int, List[str]]:
         """
         Findet Wörter mit gleichem Gematria-Wert
         
+        Für Abfragen über den gesamten Corpus: lib/gematria_index.py
+        
         Args:
             words: Liste hebräischer Wörter
             
@@ -96,8 +104,9 @@ class ManuscriptProcessor:
         """
         connections = defaultdict(list)
         
-        for word in words:
-            value = self.calculate_gematria(word)
+        # Alle Werte in einem vektorisierten Durchlauf
+        values = self.gematria_engine.matrix(words)[:, 0].tolist()
+        for word, value in zip(words, values):
             if value > 0:
                 connections[value].append(word)
         
@@ -199,12 +208,7 @@ class ManuscriptProcessor:
         Returns:
             WWAK-konformer Text
         """
-        result = text
-        
-        for old, new in self.wwak_transforms.items():
-            result = result.replace(old, new)
-        
-        return result
+        return get_engine(self.wwak_transforms).sub(text)
     
     def segment_text(self, text: str, max_chunk_size: int = 1500) -> List[Dict]:
         """
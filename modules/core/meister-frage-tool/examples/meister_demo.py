@@ -9,6 +9,7 @@ Stand: 12. Tammus 5785
 """
 
 from meister_frage_tool import MeisterFrageTool, ParadoxTyp, FrageTyp
+from meister_batch import BatchStatistik
 import yaml
 from datetime import datetime
 
@@ -202,41 +203,30 @@ def demo_batch_analyse():
         "In der Stille hört man am meisten."
     ]
     
-    alle_fragen = []
-    statistik = {
-        'total_paradoxe': 0,
-        'total_fragen': 0,
-        'typen': {}
-    }
-    
-    for text in texte:
-        ergebnis = tool.verarbeite_text(text)
-        
-        statistik['total_paradoxe'] += len(ergebnis['paradoxe'])
-        statistik['total_fragen'] += len(ergebnis['alle_fragen'])
-        
-        # Sammle beste Frage
-        if ergebnis['beste_frage']:
-            alle_fragen.append({
-                'original': text,
-                'frage': ergebnis['beste_frage'].frage,
-                'score': ergebnis['beste_frage'].gesamt_score,
-                'typ': ergebnis['beste_frage'].typ.value
-            })
-            
-            # Zähle Typen
-            typ = ergebnis['beste_frage'].typ.value
-            statistik['typen'][typ] = statistik['typen'].get(typ, 0) + 1
+    # Ein Record pro Text, Statistik wird unterwegs gefaltet
+    statistik = BatchStatistik()
+    alle_fragen = [
+        {
+            'original': text,
+            'frage': record['beste_frage']['frage'],
+            'score': record['beste_frage']['score'],
+            'typ': record['beste_frage']['typ']
+        }
+        for text, record in zip(texte, tool.verarbeite_batch(texte, workers=1,
+                                                             statistik=statistik))
+        if record['beste_frage']
+    ]
     
     # Sortiere nach Score
     alle_fragen.sort(key=lambda x: x['score'], reverse=True)
     
+    zusammenfassung = statistik.as_dict()
     print("BATCH-ANALYSE ERGEBNIS")
     print(f"Texte analysiert: {len(texte)}")
-    print(f"Paradoxe gefunden: {statistik['total_paradoxe']}")
-    print(f"Fragen generiert: {statistik['total_fragen']}")
+    print(f"Paradoxe gefunden: {zusammenfassung['total_paradoxe']}")
+    print(f"Fragen generiert: {zusammenfassung['total_fragen']}")
     print(f"\nFrage-Typen Verteilung:")
-    for typ, count in statistik['typen'].items():
+    for typ, count in zusammenfassung['frage_typen'].items():
         print(f"  {typ}: {count}")
     
     print(f"\nTOP 3 FRAGEN:")
@@ -253,8 +243,8 @@ def demo_custom_paradox():
     
     tool = MeisterFrageTool()
     
-    # Füge eigene Paradox-Paare hinzu
-    tool.PARADOX_PAARE.update({
+    # Füge eigene Paradox-Paare hinzu (nur für dieses Tool)
+    tool.erweitere_paare({
         ('schöpfer', 'geschöpf'): ParadoxTyp.HIERARCHIE,
         ('lehrer', 'schüler'): ParadoxTyp.REZIPROK,
         ('frage', 'antwort'): ParadoxTyp.IDENTITÄT,
@@ -13,8 +13,17 @@ Stand: 12.Tammus 5785
 """
 
 import re
+import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List
 
+# lib/ in den Suchpfad, für die Rewrite-Engine
+_LIB_DIR = str(Path(__file__).resolve().parents[3] / 'lib')
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
+from rewrite_engine import RewriteEngine, RewriteRule, get_engine
+
 class MeisterTransliteration:
     """WWAK-konforme Transliteration für MEISTER FRAGE Tool"""
     
@@ -94,24 +103,14 @@ class MeisterTransliteration:
         'Tikun': 'Tiqqun',
     }
     
+    def _korrektur_engine(self) -> RewriteEngine:
+        """Alle Korrektur-Tabellen als eine kompilierte Engine (einmal pro Klasse)"""
+        return _korrektur_engine_fuer(type(self))
+    
     def korrigiere_deutsche_begriffe(self, text: str) -> str:
         """Korrigiert Text nach WWAK-Standard"""
-        korrigiert = text
-        
-        # 1. Zer-Elimination
-        for alt, neu in self.ZER_ELIMINATION.items():
-            pattern = re.compile(r'\b' + re.escape(alt) + r'\b', re.IGNORECASE)
-            korrigiert = pattern.sub(neu, korrigiert)
-        
-        # 2. K→Q Transformation
-        for alt, neu in self.WWAK_TRANSFORM.items():
-            pattern = re.compile(r'\b' + re.escape(alt) + r'\b', re.IGNORECASE)
-            korrigiert = pattern.sub(neu, korrigiert)
-        
-        # 3. Dagesh-Korrekturen
-        for alt, neu in self.DAGESH_KORREKTUREN.items():
-            korrigiert = korrigiert.replace(alt, neu)
-        
+        # Ein Durchlauf über alle Tabellen, längster Treffer gewinnt
+        korrigiert, _ = self._korrektur_engine().rewrite(text)
         return korrigiert
     
     def generiere_paradox_begriffe(self) -> Dict[tuple, str]:
@@ -180,6 +179,29 @@ class MeisterTransliteration:
         return {k: v for k, v in fehler.items() if v}
 
 
+@lru_cache(maxsize=None)
+def _korrektur_engine_fuer(klasse: type) -> RewriteEngine:
+    """
+    Korrektur-Engine einer Klasse: Regeln einmal aufbauen, danach nur nachschlagen
+
+    Die Tabellen gelten als fest; Unterklassen mit eigenen Tabellen
+    bekommen eine eigene Engine.
+    """
+    # 1. Zer-Elimination (ganze Wörter)
+    regeln = [
+        RewriteRule(alt, neu, word_boundary=True, ignore_case=True, preserve_case=True)
+        for alt, neu in klasse.ZER_ELIMINATION.items()
+    ]
+    # 2. K→Q Transformation (ganze Wörter)
+    regeln += [
+        RewriteRule(alt, neu, word_boundary=True, ignore_case=True, preserve_case=True)
+        for alt, neu in klasse.WWAK_TRANSFORM.items()
+    ]
+    # 3. Dagesh-Korrekturen (exakte Schreibweise)
+    regeln += [RewriteRule(alt, neu) for alt, neu in klasse.DAGESH_KORREKTUREN.items()]
+    return get_engine(regeln)
+
+
 # Test wenn direkt ausgeführt
 if __name__ == "__main__":
     print("=== TEST: MEISTER Transliteration ===")
@@ -10,11 +10,9 @@ sys.path.insert(0, 'src')
 
 from meister_frage_tool import MeisterFrageTool, ParadoxTyp
 
-# Initialisiere Tool
-tool = MeisterFrageTool()
-
-# Erweitere die Paradox-Paare für Rabash-Begriffe
-tool.PARADOX_PAARE.update({
+# Initialisiere Tool mit einer eigenen Schicht Rabash-Paare
+# (das gemeinsame Basis-Lexikon bleibt unverändert)
+tool = MeisterFrageTool(zusatz_paare={
     ('zwang', 'gesetz'): ParadoxTyp.WANDLUNG,
     ('zwang', 'liebe'): ParadoxTyp.WANDLUNG,
     ('wille zu empfangen', 'wille zu geben'): ParadoxTyp.WANDLUNG,
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MEISTER FRAGE Tool - Batch-Modus
+================================
+
+Verarbeitet viele Texte (z.B. tausend Rabash-Auszüge) in einem Lauf:
+
+    • verarbeite_batch    verteilt die Texte auf einen ProcessPoolExecutor;
+                          die eigenen Lexikon-Schichten gehen einmal pro
+                          Worker mit, übertragen werden sonst nur Texte
+                          und Ergebnis-Records
+    • BatchStatistik      Typ- und Score-Histogramm, fortlaufend gefaltet
+    • schreibe_jsonl      ein JSON-Record pro Text, sobald er fertig ist
+
+Die Eingabe wird nur so weit gelesen, wie Aufträge unterwegs sind; es
+bleibt kein Ergebnis-Objekt bis zum Ende im Speicher. Records kommen in
+Eingabe-Reihenfolge, unabhängig von der Worker-Anzahl.
+
+Aufruf:
+    python src/meister_batch.py texte/ --workers 4 --output fragen.jsonl
+
+Stand: 5. Cheschwan 5787
+"""
+
+import json
+import os
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from meister_frage_tool import MeisterFrage, MeisterFrageTool
+
+# Texte pro Auftrag an einen Worker
+DEFAULT_TASK_SIZE = 16
+
+# Breite der Score-Klassen im Histogramm
+SCORE_KLASSE = 0.1
+
+# Dateien, die in Eingabe-Verzeichnissen gelesen werden
+EINGABE_ENDUNGEN = ('.txt', '.md', '.jsonl')
+
+# Eingabe: Text oder (ID, Text)
+Eingabe = Union[str, Tuple[str, str]]
+
+# Worker-Zustand (einmal pro Prozess)
+_worker_tool: Optional[MeisterFrageTool] = None
+
+
+# Hilfsfunktionen
+
+def _frage_record(frage: MeisterFrage) -> Dict[str, Any]:
+    return {
+        'frage': frage.frage,
+        'typ': frage.typ.value,
+        'score': round(frage.gesamt_score, 4)
+    }
+
+
+def text_record(tool: MeisterFrageTool, nummer: int, text_id: Optional[str],
+                text: str) -> Dict[str, Any]:
+    """Ergebnis von verarbeite_text als JSON-fähiger Record"""
+    # Nur beste Frage und Top 5 werden gebraucht: Heap statt aller Fragen
+    ergebnis = tool.verarbeite_text(text, top_k=5)
+    beste_frage = ergebnis['beste_frage']
+    return {
+        'nr': nummer,
+        'id': text_id,
+        'zeichen': len(text),
+        'paradoxe': [
+            {
+                'element1': p.element1,
+                'element2': p.element2,
+                'beziehung': p.beziehung,
+                'typ': p.typ.value if hasattr(p.typ, 'value') else p.typ
+            }
+            for p in ergebnis['paradoxe']
+        ],
+        'beste_frage': _frage_record(beste_frage) if beste_frage else None,
+        'top_5': [_frage_record(frage) for frage in ergebnis['top_5']],
+        'statistik': ergebnis['statistik']
+    }
+
+
+def _init_worker(klasse: type, schichten: List[Dict[Tuple[str, str], Any]],
+                 paar_fenster: int, max_treffer_pro_paar: Optional[int]) -> None:
+    """Baut das Tool einmal pro Worker-Prozess: Klasse und Lexikon-Schichten des Aufrufers"""
+    global _worker_tool
+    _worker_tool = klasse(paar_fenster=paar_fenster,
+                          max_treffer_pro_paar=max_treffer_pro_paar)
+    for schicht in schichten:
+        _worker_tool.erweitere_paare(schicht)
+
+
+def _verarbeite_auftrag(auftrag: List[Tuple[int, Optional[str], str]]) -> List[Dict[str, Any]]:
+    """Verarbeitet einen Auftrag (Liste von (Nr, ID, Text)) im Worker"""
+    return [text_record(_worker_tool, nummer, text_id, text)
+            for nummer, text_id, text in auftrag]
+
+
+def _auftraege(texte: Iterable[Eingabe],
+               task_size: int) -> Iterator[List[Tuple[int, Optional[str], str]]]:
+    """Schneidet die Eingabe in Aufträge, ohne sie ganz zu lesen"""
+    auftrag = []
+    for nummer, eintrag in enumerate(texte):
+        text_id, text = (None, eintrag) if isinstance(eintrag, str) else eintrag
+        auftrag.append((nummer, text_id, text))
+        if len(auftrag) == task_size:
+            yield auftrag
+            auftrag = []
+    if auftrag:
+        yield auftrag
+
+
+class BatchStatistik:
+    """Typ- und Score-Histogramm über alle Records, fortlaufend gefaltet"""
+
+    def __init__(self):
+        self.texte = 0
+        self.ohne_frage = 0
+        self.total_paradoxe = 0
+        self.total_fragen = 0
+        self.paradox_typen = defaultdict(int)
+        self.frage_typen = defaultdict(int)    # Typ der besten Frage
+        self.scores = defaultdict(int)         # Klasse → Anzahl bester Fragen
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Nimmt einen Record auf"""
+        self.texte += 1
+        self.total_paradoxe += record['statistik']['paradoxe_gefunden']
+        self.total_fragen += record['statistik']['fragen_generiert']
+        for paradox in record['paradoxe']:
+            self.paradox_typen[paradox['typ']] += 1
+
+        beste_frage = record['beste_frage']
+        if beste_frage is None:
+            self.ohne_frage += 1
+            return
+        self.frage_typen[beste_frage['typ']] += 1
+        klasse = min(int(beste_frage['score'] / SCORE_KLASSE), int(1 / SCORE_KLASSE) - 1)
+        self.scores[f"{klasse * SCORE_KLASSE:.1f}"] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'texte': self.texte,
+            'ohne_frage': self.ohne_frage,
+            'total_paradoxe': self.total_paradoxe,
+            'total_fragen': self.total_fragen,
+            'paradox_typen': dict(sorted(self.paradox_typen.items(), key=lambda x: -x[1])),
+            'frage_typen': dict(sorted(self.frage_typen.items(), key=lambda x: -x[1])),
+            'score_histogramm': dict(sorted(self.scores.items()))
+        }
+
+
+def verarbeite_batch(texte: Iterable[Eingabe], workers: Optional[int] = None,
+                     tool: Optional[MeisterFrageTool] = None,
+                     task_size: int = DEFAULT_TASK_SIZE,
+                     statistik: Optional[BatchStatistik] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Verarbeitet viele Texte und liefert einen Record pro Text
+
+    Args:
+        texte: Texte oder (ID, Text)-Paare, auch als Generator
+        workers: Anzahl Worker-Prozesse (None = CPU-Anzahl, 1 = ohne Pool)
+        tool: liefert Klasse, Lexikon und Einstellungen (None = Standard-Tool);
+              Worker bauen type(tool) neu, die Klasse muss also importierbar
+              sein und paar_fenster/max_treffer_pro_paar annehmen
+        task_size: Texte pro Auftrag
+        statistik: wird mit jedem Record gefaltet
+
+    Yields:
+        Records in Eingabe-Reihenfolge (beste Frage, Top 5, Statistik)
+    """
+    if task_size < 1:
+        raise ValueError("task_size muss mindestens 1 sein")
+    tool = tool or MeisterFrageTool()
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1:
+        for auftrag in _auftraege(texte, task_size):
+            for nummer, text_id, text in auftrag:
+                record = text_record(tool, nummer, text_id, text)
+                if statistik is not None:
+                    statistik.add(record)
+                yield record
+        return
+
+    # Die Basis baut jeder Worker selbst, mit geht nur, was der Aufrufer ergänzt hat
+    schichten = [dict(schicht) for schicht in tool.lexikon.schichten]
+    initargs = (type(tool), schichten, tool.paar_fenster, tool.max_treffer_pro_paar)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=initargs) as executor:
+        # Höchstens zwei Aufträge pro Worker unterwegs; der älteste wird
+        # zuerst abgeholt, so bleibt die Eingabe-Reihenfolge erhalten
+        unterwegs = deque()
+        for auftrag in _auftraege(texte, task_size):
+            unterwegs.append(executor.submit(_verarbeite_auftrag, auftrag))
+            if len(unterwegs) < 2 * workers:
+                continue
+            for record in unterwegs.popleft().result():
+                if statistik is not None:
+                    statistik.add(record)
+                yield record
+        while unterwegs:
+            for record in unterwegs.popleft().result():
+                if statistik is not None:
+                    statistik.add(record)
+                yield record
+
+
+def schreibe_jsonl(records: Iterable[Dict[str, Any]], datei: IO[str]) -> int:
+    """Schreibt Records als JSON Lines (eine Zeile pro Text, sofort geflusht)"""
+    anzahl = 0
+    for record in records:
+        datei.write(json.dumps(record, ensure_ascii=False) + '\n')
+        datei.flush()
+        anzahl += 1
+    return anzahl
+
+
+def lese_eingaben(pfade: List[str], absaetze: bool = False) -> Iterator[Tuple[str, str]]:
+    """
+    (ID, Text) aus Dateien und Verzeichnissen (*.txt, *.md, *.jsonl)
+
+    .jsonl-Dateien liefern einen Text pro Zeile (Feld 'text', optional 'id');
+    mit absaetze wird jede Datei an Leerzeilen geteilt.
+    """
+    for pfad in map(Path, pfade):
+        if pfad.is_dir():
+            dateien = sorted(p for p in pfad.rglob('*') if p.suffix in EINGABE_ENDUNGEN)
+        else:
+            dateien = [pfad]
+        for datei in dateien:
+            if datei.suffix == '.jsonl':
+                with open(datei, encoding='utf-8') as f:
+                    for zeile_nr, zeile in enumerate(f, 1):
+                        if zeile.strip():
+                            eintrag = json.loads(zeile)
+                            yield str(eintrag.get('id', f"{datei}:{zeile_nr}")), eintrag['text']
+                continue
+            text = datei.read_text(encoding='utf-8')
+            if not absaetze:
+                yield str(datei), text
+                continue
+            for nummer, absatz in enumerate(t for t in text.split('\n\n') if t.strip()):
+                yield f"{datei}#{nummer}", absatz.strip()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: Texte → JSON Lines + Histogramm"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="MEISTER FRAGE Batch-Modus")
+    parser.add_argument('eingabe', nargs='+', help="Dateien, Verzeichnisse oder .jsonl")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Anzahl Worker-Prozesse (Standard: CPU-Anzahl)")
+    parser.add_argument('--task-size', type=int, default=DEFAULT_TASK_SIZE,
+                        help="Texte pro Worker-Auftrag")
+    parser.add_argument('--output', default=None, help="JSON Lines Datei (Standard: stdout)")
+    parser.add_argument('--absaetze', action='store_true', help="Dateien an Leerzeilen teilen")
+    parser.add_argument('--fenster', type=int, default=MeisterFrageTool.PAAR_FENSTER,
+                        help="Maximaler Abstand bekannter Paar-Begriffe")
+    args = parser.parse_args(argv)
+
+    tool = MeisterFrageTool(paar_fenster=args.fenster)
+    statistik = BatchStatistik()
+    start = time.perf_counter()
+
+    records = verarbeite_batch(lese_eingaben(args.eingabe, args.absaetze), workers=args.workers,
+                               tool=tool, task_size=args.task_size, statistik=statistik)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            schreibe_jsonl(records, f)
+    else:
+        schreibe_jsonl(records, sys.stdout)
+    elapsed = time.perf_counter() - start
+
+    # Zusammenfassung auf stderr, stdout bleibt reines JSON Lines
+    summary = statistik.as_dict()
+    print(f"Texte: {summary['texte']} ({summary['ohne_frage']} ohne Frage) in {elapsed:.2f}s",
+          file=sys.stderr)
+    print(f"  • {summary['total_paradoxe']} Paradoxe, {summary['total_fragen']} Fragen",
+          file=sys.stderr)
+    print("  Frage-Typen (beste Frage):", file=sys.stderr)
+    for typ, anzahl in summary['frage_typen'].items():
+        print(f"    {typ}: {anzahl}", file=sys.stderr)
+    print("  Score-Histogramm:", file=sys.stderr)
+    for klasse, anzahl in summary['score_histogramm'].items():
+        print(f"    {klasse}: {'█' * max(1, anzahl * 40 // max(summary['texte'], 1))} {anzahl}",
+              file=sys.stderr)
+    if args.output:
+        print(f"✓ Ergebnis gespeichert: {args.output}", file=sys.stderr)
+
+    print("\nQ!", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
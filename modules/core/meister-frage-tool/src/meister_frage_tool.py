@@ -11,19 +11,24 @@ WWAK-konform
 Autor: JEREMIA1964 / JBR Wolff
 """
 
-import re
 import yaml
 import json
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Iterator, NamedTuple, Tuple, Optional, Any
 from enum import Enum
+from functools import lru_cache
 from datetime import datetime
 import hashlib
+import heapq
+import threading
+from types import MappingProxyType
 # Nach den anderen Imports, vor class ParadoxTyp:
 try:
     from meister_transliteration import MeisterTransliteration
 except ImportError:
     MeisterTransliteration = None
+from paradox_lexikon import ParadoxLexikon
+from paradox_scanner import get_relation_scanner
 
 class ParadoxTyp(Enum):
     """Kategorien von Paradoxen"""
@@ -54,6 +59,8 @@ class Paradox:
     typ: ParadoxTyp
     kontext: str
     stärke: float = 0.0
+    # Bekannte Paare: alle Treffer (Position 1, Position 2), nächster zuerst
+    fundstellen: List[Tuple[int, int]] = field(default_factory=list)
 
 @dataclass
 class MeisterFrage:
@@ -70,6 +77,38 @@ class MeisterFrage:
             return 0.0
         return sum(self.scores.values()) / len(self.scores)
 
+class ParadoxMerkmale(NamedTuple):
+    """Einmal pro Paradox berechnet, von allen Fragen-Bewertungen geteilt"""
+    el1: str                # wie in der Frage (title())
+    el2: str
+    länge: int              # len(el1) + len(el2)
+    lange_wörter: bool      # ein Wort mit 10+ Zeichen in el1 oder el2
+    erstes_wort1: int       # Länge des ersten Worts von el1
+    letztes_wort2: int      # Länge des letzten Worts von el2
+    kabbala: bool           # qabbalistischer Begriff in el1 oder el2
+    aufwärts: bool          # aufwärts gerichteter Begriff in el1 oder el2
+    stärke: float
+    typ: ParadoxTyp
+
+@lru_cache(maxsize=4096)
+def _element_merkmale(element1: str, element2: str, kabbala_begriffe: Tuple[str, ...],
+                      aufwärts_begriffe: Tuple[str, ...]) -> Tuple:
+    """Text-Merkmale eines Element-Paars (wiederholt sich über Texte hinweg)"""
+    el1, el2 = element1.title(), element2.title()
+    wörter1, wörter2 = el1.split(), el2.split()
+    # Zeilenumbruch als Trenner: kein Begriff reicht über beide Elemente
+    klein = f"{el1.lower()}\n{el2.lower()}"
+    return (
+        el1,
+        el2,
+        len(el1) + len(el2),
+        any(len(w) >= 10 for w in wörter1 + wörter2),
+        len(wörter1[0]) if wörter1 else 0,
+        len(wörter2[-1]) if wörter2 else 0,
+        any(b in klein for b in kabbala_begriffe),
+        any(b in klein for b in aufwärts_begriffe)
+    )
+
 class MeisterFrageTool:
     """Das ultimative Paradox-Frage-Tool"""
     
@@ -105,8 +144,9 @@ class MeisterFrageTool:
         r'ohne\s+(\w+)\s+kein\s+(\w+)': '⇔',
     }
     
-    # Klassische Paradox-Paare
-    PARADOX_PAARE = {
+    # Klassische Paradox-Paare (Basis, unveränderlich; eigene Paare über
+    # zusatz_paare bzw. erweitere_paare als Schicht pro Instanz)
+    PARADOX_PAARE = MappingProxyType({
         # Qabbalistisch
         ('licht', 'dunkelheit'): ParadoxTyp.KLASSISCH,
         ('or', 'choschech'): ParadoxTyp.KLASSISCH,
@@ -138,23 +178,68 @@ class MeisterFrageTool:
         ('ego', 'selbstlosigkeit'): ParadoxTyp.WANDLUNG,
         ('wille', 'hingabe'): ParadoxTyp.KLASSISCH,
         ('kontrolle', 'loslassen'): ParadoxTyp.KLASSISCH,
+    })
+    
+    # Frage-Vorlagen ({el1}/{el2} je genau einmal; die festen Teile enthalten
+    # keinen der Bewertungs-Begriffe, grenzen nur mit Leerzeichen oder
+    # Satzzeichen an die Elemente)
+    FRAGE_VORLAGEN = {
+        'formel': (FrageTyp.FORMEL, "{el1} + {el2} = ?"),
+        'wozu_führt': (FrageTyp.WOZU, "WOZU führt {el1} zu {el2}?"),
+        'wozu_braucht': (FrageTyp.WOZU, "WOZU braucht {el1} das {el2}?"),
+        'wie': (FrageTyp.WIE, "WIE wird {el1} zu {el2}?"),
+        'wenn_dann': (FrageTyp.WENN_DANN, "WENN {el1} → DANN {el2}?"),
+        'ist': (FrageTyp.IST, "IST {el1} wirklich {el2}?"),
+        'zwischen': (FrageTyp.ZWISCHEN, "Was liegt ZWISCHEN {el1} und {el2}?"),
+        'meta': (FrageTyp.META, "Was fragt die Frage '{el1} & {el2}' selbst?"),
     }
     
-    def __init__(self):
+    # Bewertungs-Begriffe (TIEFE bzw. WOZU)
+    KABBALA_BEGRIFFE = ('licht', 'dwekut', 'azilut', 'kabbala',
+                        'sefirot', 'ein sof', 'tiqqun')
+    AUFWÄRTS_BEGRIFFE = ('licht', 'liebe', 'einheit', 'geben')
+    
+    # Nähe-Suche für bekannte Paare
+    PAAR_FENSTER = 100
+    MAX_TREFFER_PRO_PAAR = 1
+    
+    def __init__(self, paar_fenster: int = PAAR_FENSTER,
+                 max_treffer_pro_paar: Optional[int] = MAX_TREFFER_PRO_PAAR,
+                 zusatz_paare: Optional[Dict[Tuple[str, str], Any]] = None):
+        """
+        Args:
+            paar_fenster: maximaler Abstand zweier Paar-Begriffe (Zeichen)
+            max_treffer_pro_paar: Fundstellen pro Paar (None = alle)
+            zusatz_paare: eigene Paradox-Paare, nur für diese Instanz
+        """
+        self.paar_fenster = paar_fenster
+        self.max_treffer_pro_paar = max_treffer_pro_paar
         self.erkannte_paradoxe: List[Paradox] = []
         self.generierte_fragen: List[MeisterFrage] = []
         
-        # Transliteration Integration
-        if MeisterTransliteration:
-            self.transliteration = MeisterTransliteration()
-            # Erweitere Paradox-Paare mit korrekten Transliterationen
-            zusatz_paare = self.transliteration.generiere_paradox_begriffe()
-            self.PARADOX_PAARE.update(zusatz_paare)
-        else:
-            self.transliteration = None
+        # Transliteration Integration (deren Paradox-Paare stecken schon in der Basis)
+        self.transliteration = MeisterTransliteration() if MeisterTransliteration else None
         
-    def verarbeite_text(self, text: str) -> Dict[str, Any]:
-        """Hauptmethode: Text → Paradoxe → Fragen"""
+        # Gemeinsames Basis-Lexikon, eigene Paare als Schicht darüber
+        self.lexikon: ParadoxLexikon = get_basis_lexikon()
+        if zusatz_paare:
+            self.erweitere_paare(zusatz_paare)
+    
+    def erweitere_paare(self, paare: Dict[Tuple[str, str], Any]) -> None:
+        """Fügt Paradox-Paare als Schicht hinzu (andere Instanzen bleiben unberührt)"""
+        self.lexikon = self.lexikon.erweitert(paare)
+        
+    def verarbeite_text(self, text: str, top_k: Optional[int] = None,
+                        alle_fragen: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Hauptmethode: Text → Paradoxe → Fragen
+        
+        Args:
+            text: zu analysierender Text
+            top_k: nur die besten k Fragen behalten (Heap, Fragen werden erst
+                   für die Besten gebaut); None = alle Fragen wie bisher
+            alle_fragen: mit top_k trotzdem alle Fragen liefern (Standard: nein)
+        """
         
         # 0. Prüfe Transliteration wenn verfügbar
         transliteration_fehler = None
@@ -167,13 +252,26 @@ class MeisterFrageTool:
         # 2. Paradoxe erkennen
         paradoxe = self._erkenne_paradoxe(text_norm, text)
         
+        ergebnis = {
+            'text': text,
+            'text_normalisiert': text_norm,
+            'transliteration_fehler': transliteration_fehler,
+            'paradoxe': paradoxe,
+        }
+        if top_k is not None:
+            ergebnis.update(self._beste_fragen(paradoxe, top_k, bool(alle_fragen)))
+            return ergebnis
+        
         # 3. Fragen generieren
         fragen = []
         for paradox in paradoxe:
             fragen.extend(self._generiere_fragen(paradox))
         
-        # 4. Bewerten und sortieren
-        fragen_bewertet = self._bewerte_fragen(fragen)
+        # 4. Bewerten und sortieren (Vorlagen-Fragen über Paradox-Merkmale)
+        if self._bewertung_überschrieben():
+            fragen_bewertet = self._bewerte_fragen(fragen)
+        else:
+            fragen_bewertet = self._bewerte_vorlagen_fragen(fragen)
         fragen_sortiert = sorted(fragen_bewertet, 
                                 key=lambda f: f.gesamt_score, 
                                 reverse=True)
@@ -182,11 +280,7 @@ class MeisterFrageTool:
         beste_frage = fragen_sortiert[0] if fragen_sortiert else None
         top_5 = fragen_sortiert[:5]
         
-        return {
-            'text': text,
-            'text_normalisiert': text_norm,
-            'transliteration_fehler': transliteration_fehler,
-            'paradoxe': paradoxe,
+        ergebnis.update({
             'alle_fragen': fragen_sortiert,
             'beste_frage': beste_frage,
             'top_5': top_5,
@@ -195,8 +289,100 @@ class MeisterFrageTool:
                 'fragen_generiert': len(fragen),
                 'durchschnitt_score': sum(f.gesamt_score for f in fragen) / len(fragen) if fragen else 0
             }
+        })
+        return ergebnis
+    
+    def _beste_fragen(self, paradoxe: List[Paradox], top_k: int,
+                      alle_fragen: bool) -> Dict[str, Any]:
+        """
+        Die besten top_k Fragen über einen begrenzten Heap
+        
+        Kandidaten werden aus Vorlage und Paradox-Merkmalen bewertet, ohne
+        den Fragetext zu bauen; MeisterFrage-Objekte entstehen nur für die
+        Besten. Reihenfolge bei Gleichstand wie bei sorted(): frühere zuerst.
+        
+        Überschreibt eine Unterklasse die Fragen-Erzeugung oder eine der
+        _bewerte_*-Methoden, werden wie ohne top_k echte Fragen erzeugt und
+        über diese Methoden bewertet; nur die Auswahl läuft über den Heap.
+        """
+        if top_k < 1:
+            raise ValueError("top_k muss mindestens 1 sein")
+        
+        if self._bewertung_überschrieben():
+            fragen = [frage for paradox in paradoxe for frage in self._generiere_fragen(paradox)]
+            kandidaten = ((frage.gesamt_score, frage) for frage in self._bewerte_fragen(fragen))
+            als_frage = _selbst
+        else:
+            kandidaten = self._vorlagen_kandidaten(paradoxe)
+            als_frage = _vorlage_als_frage
+        
+        beste = []   # Min-Heap über (Score, -Nr)
+        alle = [] if alle_fragen else None
+        anzahl = 0
+        summe = 0
+        for score, inhalt in kandidaten:
+            summe += score
+            kandidat = (score, -anzahl, inhalt)
+            anzahl += 1
+            
+            if alle is not None:
+                alle.append(kandidat)
+            if len(beste) < top_k:
+                heapq.heappush(beste, kandidat)
+            elif kandidat[:2] > beste[0][:2]:
+                heapq.heapreplace(beste, kandidat)
+        
+        def rang(kandidat) -> Tuple[float, int]:
+            return kandidat[:2]
+        
+        top = [als_frage(k[2]) for k in sorted(beste, key=rang, reverse=True)]
+        return {
+            'alle_fragen': ([als_frage(k[2]) for k in sorted(alle, key=rang, reverse=True)]
+                            if alle is not None else None),
+            'beste_frage': top[0] if top else None,
+            'top_k': top,
+            'top_5': top[:5],
+            'statistik': {
+                'paradoxe_gefunden': len(paradoxe),
+                'fragen_generiert': anzahl,
+                'durchschnitt_score': summe / anzahl if anzahl else 0
+            }
         }
     
+    def _bewertung_überschrieben(self) -> bool:
+        """Hat eine Unterklasse Fragen-Erzeugung, Vorlagen oder Bewertung ersetzt?"""
+        klasse = type(self)
+        if klasse.FRAGE_VORLAGEN is not MeisterFrageTool.FRAGE_VORLAGEN:
+            return True
+        return any(getattr(klasse, name) is not getattr(MeisterFrageTool, name)
+                   for name in _BEWERTUNGS_METHODEN)
+    
+    def _vorlagen_kandidaten(self, paradoxe: List[Paradox]) -> Iterator[Tuple[float, tuple]]:
+        """(Score, (Paradox, Merkmale, Typ, Vorlage, Scores)) ohne Fragetext"""
+        for paradox in paradoxe:
+            merkmale = self._merkmale(paradox)
+            for typ, vorlage in self._frage_kandidaten(paradox):
+                # Fragelänge = feste Teile der Vorlage + Elemente
+                länge = len(vorlage) - len('{el1}{el2}') + merkmale.länge
+                scores = {
+                    'kraft': self._kraft(typ, länge, merkmale),
+                    'tiefe': self._tiefe(typ, merkmale),
+                    'wozu': self._wozu(typ, merkmale)
+                }
+                yield sum(scores.values()) / len(scores), (paradox, merkmale, typ, vorlage, scores)
+
+    def verarbeite_batch(self, texte, workers: Optional[int] = None, **optionen):
+        """
+        Viele Texte → ein JSON-fähiger Record pro Text (siehe meister_batch)
+
+        Args:
+            texte: Texte oder (ID, Text)-Paare, auch als Generator
+            workers: Anzahl Worker-Prozesse (None = CPU-Anzahl, 1 = ohne Pool)
+            **optionen: task_size, statistik
+        """
+        from meister_batch import verarbeite_batch
+        return verarbeite_batch(texte, workers=workers, tool=self, **optionen)
+
     def _normalisiere_text(self, text: str) -> str:
         """Normalisiert Text für Analyse"""
         # Transliteration wenn verfügbar
@@ -234,9 +420,10 @@ class MeisterFrageTool:
         """Erkennt alle Paradoxe im Text"""
         paradoxe = []
         
-        # 1. Muster-basierte Erkennung
-        for muster, beziehung in self.GEGENSATZ_MUSTER.items():
-            matches = re.finditer(muster, text_norm, re.IGNORECASE)
+        # 1. Muster-basierte Erkennung (alle Muster in einem Scanner)
+        relationen = get_relation_scanner(tuple(self.GEGENSATZ_MUSTER))
+        for beziehung, matches in zip(self.GEGENSATZ_MUSTER.values(),
+                                      relationen.finde(text_norm)):
             for match in matches:
                 el1, el2 = match.groups()[:2]
                 
@@ -259,28 +446,29 @@ class MeisterFrageTool:
                 
                 paradoxe.append(paradox)
         
-        # 2. Bekannte Paare suchen
-        for (el1, el2), typ in self.PARADOX_PAARE.items():
-            if el1 in text_norm and el2 in text_norm:
-                # Prüfe Nähe (max 100 Zeichen)
-                pos1 = text_norm.find(el1)
-                pos2 = text_norm.find(el2)
-                
-                if abs(pos1 - pos2) < 100:
-                    start = min(pos1, pos2) - 20
-                    end = max(pos1 + len(el1), pos2 + len(el2)) + 20
-                    kontext = text_orig[max(0, start):min(len(text_orig), end)]
-                    
-                    paradox = Paradox(
-                        element1=el1,
-                        element2=el2,
-                        beziehung='↔',
-                        typ=typ,
-                        kontext=kontext,
-                        stärke=0.9  # Bekannte Paare = hohe Stärke
-                    )
-                    
-                    paradoxe.append(paradox)
+        # 2. Bekannte Paare suchen (alle Vorkommen, ein Durchlauf über alle Begriffe)
+        paare = self.lexikon.paare()
+        treffer_pro_paar = self.lexikon.scanner().finde(text_norm, fenster=self.paar_fenster,
+                                              max_treffer=self.max_treffer_pro_paar)
+        for index, treffer in treffer_pro_paar:
+            (el1, el2), typ = paare[index]
+            # Kontext um den nächsten Treffer
+            pos1, pos2 = treffer[0]
+            start = min(pos1, pos2) - 20
+            end = max(pos1 + len(el1), pos2 + len(el2)) + 20
+            kontext = text_orig[max(0, start):min(len(text_orig), end)]
+            
+            paradox = Paradox(
+                element1=el1,
+                element2=el2,
+                beziehung='↔',
+                typ=typ,
+                kontext=kontext,
+                stärke=0.9,  # Bekannte Paare = hohe Stärke
+                fundstellen=treffer
+            )
+            
+            paradoxe.append(paradox)
         
         # Duplikate entfernen
         seen = set()
@@ -299,8 +487,8 @@ class MeisterFrageTool:
         
         # Prüfe bekannte Paare
         paar = (el1.lower(), el2.lower())
-        if paar in self.PARADOX_PAARE:
-            return self.PARADOX_PAARE[paar]
+        if paar in self.lexikon:
+            return self.lexikon[paar]
         
         # Sonst nach Beziehung
         if beziehung in ['↔', '∨', '≠']:
@@ -322,7 +510,7 @@ class MeisterFrageTool:
         stärke = 0.5  # Basis
         
         # Bekannte Paare
-        if (el1.lower(), el2.lower()) in self.PARADOX_PAARE:
+        if (el1.lower(), el2.lower()) in self.lexikon:
             stärke += 0.4
         
         # Typ-spezifisch
@@ -337,82 +525,59 @@ class MeisterFrageTool:
         
         return min(1.0, stärke)
     
-    def _generiere_fragen(self, paradox: Paradox) -> List[MeisterFrage]:
-        """Generiert alle Frage-Typen für ein Paradox"""
-        fragen = []
-        
-        el1, el2 = paradox.element1.title(), paradox.element2.title()
+    def _frage_kandidaten(self, paradox: Paradox) -> List[Tuple[FrageTyp, str]]:
+        """(Typ, Vorlage) aller Frage-Typen, die zu einem Paradox passen"""
+        vorlagen = self.FRAGE_VORLAGEN
+        kandidaten = []
         
         # 1. FORMEL
         if paradox.beziehung in ['↔', '→', '∧']:
-            frage = MeisterFrage(
-                frage=f"{el1} + {el2} = ?",
-                typ=FrageTyp.FORMEL,
-                paradox=paradox
-            )
-            fragen.append(frage)
+            kandidaten.append(vorlagen['formel'])
         
         # 2. WOZU (immer!)
         if paradox.beziehung == '→':
-            frage = MeisterFrage(
-                frage=f"WOZU führt {el1} zu {el2}?",
-                typ=FrageTyp.WOZU,
-                paradox=paradox
-            )
+            kandidaten.append(vorlagen['wozu_führt'])
         else:
-            frage = MeisterFrage(
-                frage=f"WOZU braucht {el1} das {el2}?",
-                typ=FrageTyp.WOZU,
-                paradox=paradox
-            )
-        fragen.append(frage)
+            kandidaten.append(vorlagen['wozu_braucht'])
         
         # 3. WIE
         if paradox.typ in [ParadoxTyp.WANDLUNG, ParadoxTyp.IDENTITÄT]:
-            frage = MeisterFrage(
-                frage=f"WIE wird {el1} zu {el2}?",
-                typ=FrageTyp.WIE,
-                paradox=paradox
-            )
-            fragen.append(frage)
+            kandidaten.append(vorlagen['wie'])
         
         # 4. WENN-DANN
         if paradox.beziehung in ['→', '⇔']:
-            frage = MeisterFrage(
-                frage=f"WENN {el1} → DANN {el2}?",
-                typ=FrageTyp.WENN_DANN,
-                paradox=paradox
-            )
-            fragen.append(frage)
+            kandidaten.append(vorlagen['wenn_dann'])
         
         # 5. IST
         if paradox.typ == ParadoxTyp.IDENTITÄT or paradox.beziehung == '≡':
-            frage = MeisterFrage(
-                frage=f"IST {el1} wirklich {el2}?",
-                typ=FrageTyp.IST,
-                paradox=paradox
-            )
-            fragen.append(frage)
+            kandidaten.append(vorlagen['ist'])
         
         # 6. ZWISCHEN
         if paradox.typ in [ParadoxTyp.KLASSISCH, ParadoxTyp.HIERARCHIE]:
-            frage = MeisterFrage(
-                frage=f"Was liegt ZWISCHEN {el1} und {el2}?",
-                typ=FrageTyp.ZWISCHEN,
-                paradox=paradox
-            )
-            fragen.append(frage)
+            kandidaten.append(vorlagen['zwischen'])
         
         # 7. META (für starke Paradoxe)
         if paradox.stärke > 0.7:
-            frage = MeisterFrage(
-                frage=f"Was fragt die Frage '{el1} & {el2}' selbst?",
-                typ=FrageTyp.META,
-                paradox=paradox
-            )
-            fragen.append(frage)
+            kandidaten.append(vorlagen['meta'])
         
-        return fragen
+        return kandidaten
+    
+    def _generiere_fragen(self, paradox: Paradox) -> List[MeisterFrage]:
+        """Generiert alle Frage-Typen für ein Paradox"""
+        el1, el2 = paradox.element1.title(), paradox.element2.title()
+        return [
+            MeisterFrage(frage=vorlage.format(el1=el1, el2=el2), typ=typ, paradox=paradox)
+            for typ, vorlage in self._frage_kandidaten(paradox)
+        ]
+    
+    def _merkmale(self, paradox: Paradox) -> ParadoxMerkmale:
+        """Merkmale eines Paradoxes für die Bewertung aller seiner Fragen"""
+        return ParadoxMerkmale(
+            *_element_merkmale(paradox.element1, paradox.element2,
+                               self.KABBALA_BEGRIFFE, self.AUFWÄRTS_BEGRIFFE),
+            stärke=paradox.stärke,
+            typ=paradox.typ
+        )
     
     def _bewerte_fragen(self, fragen: List[MeisterFrage]) -> List[MeisterFrage]:
         """Bewertet alle Fragen nach 3D-System"""
@@ -435,6 +600,25 @@ class MeisterFrageTool:
         
         return fragen
     
+    def _bewerte_vorlagen_fragen(self, fragen: List[MeisterFrage]) -> List[MeisterFrage]:
+        """
+        Wie _bewerte_fragen, nur für Fragen aus _generiere_fragen (FRAGE_VORLAGEN)
+        
+        Die Merkmale werden einmal pro Paradox berechnet statt dreimal pro
+        Frage aus dem Fragetext; für Vorlagen-Fragen gleiche Scores.
+        """
+        merkmale_cache: Dict[int, ParadoxMerkmale] = {}
+        for frage in fragen:
+            merkmale = merkmale_cache.get(id(frage.paradox))
+            if merkmale is None:
+                merkmale = merkmale_cache[id(frage.paradox)] = self._merkmale(frage.paradox)
+            frage.scores = {
+                'kraft': self._kraft(frage.typ, len(frage.frage), merkmale),
+                'tiefe': self._tiefe(frage.typ, merkmale),
+                'wozu': self._wozu(frage.typ, merkmale)
+            }
+        return fragen
+    
     def _bewerte_kraft(self, frage: MeisterFrage) -> float:
         """Bewertet Einfachheit/Klarheit"""
         score = 0.5
@@ -469,9 +653,8 @@ class MeisterFrageTool:
             score += 0.2
         
         # Qabbalistische Begriffe
-        kabbala_begriffe = ['licht', 'dwekut', 'azilut', 'kabbala', 
-                           'sefirot', 'ein sof', 'tiqqun']
-        if any(b in frage.frage.lower() for b in kabbala_begriffe):
+        text = frage.frage.lower()
+        if any(b in text for b in self.KABBALA_BEGRIFFE):
             score += 0.2
         
         return min(1.0, score)
@@ -489,8 +672,70 @@ class MeisterFrageTool:
             score += 0.2
         
         # Aufwärts-gerichtet
-        aufwärts_begriffe = ['licht', 'liebe', 'einheit', 'geben']
-        if any(b in frage.frage.lower() for b in aufwärts_begriffe):
+        text = frage.frage.lower()
+        if any(b in text for b in self.AUFWÄRTS_BEGRIFFE):
+            score += 0.2
+        
+        return min(1.0, score)
+    
+    # Bewertung über Paradox-Merkmale: nur für Fragen aus den FRAGE_VORLAGEN
+    # (Satzzeichen und Begriffe der Vorlagen sind eingerechnet)
+    def _kraft(self, typ: FrageTyp, länge: int, merkmale: ParadoxMerkmale) -> float:
+        score = 0.5
+        
+        # Kurze Fragen = kraftvoll
+        if länge < 20:
+            score += 0.3
+        elif länge < 30:
+            score += 0.2
+        
+        # FORMEL-Typ = maximal klar
+        if typ == FrageTyp.FORMEL:
+            score += 0.3
+        
+        # Einfache Wörter (Satzzeichen der Vorlage hängen am letzten Wort
+        # von el2, bei META auch am ersten Wort von el1)
+        einfach = not merkmale.lange_wörter
+        if typ != FrageTyp.FORMEL:
+            einfach = einfach and merkmale.letztes_wort2 + 1 < 10
+        if typ == FrageTyp.META:
+            einfach = einfach and merkmale.erstes_wort1 + 1 < 10
+        if einfach:
+            score += 0.2
+        
+        return min(1.0, score)
+    
+    def _tiefe(self, typ: FrageTyp, merkmale: ParadoxMerkmale) -> float:
+        score = 0.5
+        
+        # Paradox-Stärke
+        score += merkmale.stärke * 0.3
+        
+        # Typ-spezifisch
+        if typ in [FrageTyp.META, FrageTyp.IST]:
+            score += 0.3
+        elif typ == FrageTyp.ZWISCHEN:
+            score += 0.2
+        
+        # Qabbalistische Begriffe
+        if merkmale.kabbala:
+            score += 0.2
+        
+        return min(1.0, score)
+    
+    def _wozu(self, typ: FrageTyp, merkmale: ParadoxMerkmale) -> float:
+        score = 0.5
+        
+        # WOZU-Typ = maximal
+        if typ == FrageTyp.WOZU:
+            score = 0.9
+        
+        # Wandlungs-Paradoxe
+        if merkmale.typ == ParadoxTyp.WANDLUNG:
+            score += 0.2
+        
+        # Aufwärts-gerichtet
+        if merkmale.aufwärts:
             score += 0.2
         
         return min(1.0, score)
@@ -643,6 +888,44 @@ class MeisterFrageTool:
         return json_str
 
 
+_basis_lexikon: Optional[ParadoxLexikon] = None
+_basis_lock = threading.Lock()
+
+
+# Ersetzt eine Unterklasse eine davon, werden echte Fragen über
+# _bewerte_fragen bewertet (statt über Vorlage und Paradox-Merkmale)
+_BEWERTUNGS_METHODEN = ('_frage_kandidaten', '_generiere_fragen', '_bewerte_fragen',
+                        '_bewerte_kraft', '_bewerte_tiefe', '_bewerte_wozu')
+
+
+def _selbst(frage: MeisterFrage) -> MeisterFrage:
+    return frage
+
+
+def _vorlage_als_frage(inhalt: tuple) -> MeisterFrage:
+    """(Paradox, Merkmale, Typ, Vorlage, Scores) → MeisterFrage"""
+    paradox, merkmale, typ, vorlage, scores = inhalt
+    return MeisterFrage(
+        frage=vorlage.format(el1=merkmale.el1, el2=merkmale.el2),
+        typ=typ,
+        paradox=paradox,
+        scores=scores
+    )
+
+
+def get_basis_lexikon() -> ParadoxLexikon:
+    """Gemeinsames Basis-Lexikon (Klassiker + Transliteration), einmal pro Prozess"""
+    global _basis_lexikon
+    if _basis_lexikon is None:
+        with _basis_lock:
+            if _basis_lexikon is None:
+                paare = dict(MeisterFrageTool.PARADOX_PAARE)
+                if MeisterTransliteration:
+                    paare.update(MeisterTransliteration().generiere_paradox_begriffe())
+                _basis_lexikon = ParadoxLexikon(paare)
+    return _basis_lexikon
+
+
 # CLI wenn direkt ausgeführt
 if __name__ == "__main__":
     import sys
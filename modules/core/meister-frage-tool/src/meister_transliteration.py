@@ -9,8 +9,17 @@ Stand: 12. Tammus 5785
 """
 
 import re
+import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Tuple, List
 
+# lib/ in den Suchpfad, für die Rewrite-Engine
+_LIB_DIR = str(Path(__file__).resolve().parents[4] / 'lib')
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
+from rewrite_engine import RewriteEngine, RewriteRule, get_engine
+
 class MeisterTransliteration:
     """Erweiterte Transliteration für das MEISTER FRAGE Tool"""
     
@@ -168,6 +177,18 @@ class MeisterTransliteration:
         'zerstreut': 'verteilt',
     }
     
+    # Dagesh-Korrekturen
+    DAGESH_KORREKTUREN = {
+        'masach': 'massach',
+        'Masach': 'Massach',
+        'chesed': 'chessed',
+        'Chesed': 'Chessed',
+        'jesod': 'jessod',
+        'Jesod': 'Jessod',
+        'tikun': 'tiqqun',
+        'Tikun': 'Tiqqun',
+    }
+    
     def transliteriere_hebräisch(self, text: str) -> str:
         """Transliteriert hebräischen Text nach DIN 31636 + WWAK"""
         result = []
@@ -203,36 +224,14 @@ class MeisterTransliteration:
         
         return ''.join(result)
     
+    def _korrektur_engine(self) -> RewriteEngine:
+        """Alle Korrektur-Tabellen als eine kompilierte Engine (einmal pro Klasse)"""
+        return _korrektur_engine_fuer(type(self))
+    
     def korrigiere_deutsche_begriffe(self, text: str) -> str:
         """Korrigiert deutsche Begriffe nach WWAK-Standard"""
-        korrigiert = text
-        
-        # 1. Zer-Elimination
-        for alt, neu in self.ZER_ELIMINATION.items():
-            # Case-insensitive Ersetzung
-            pattern = re.compile(re.escape(alt), re.IGNORECASE)
-            korrigiert = pattern.sub(neu, korrigiert)
-        
-        # 2. K→Q Transformation
-        for alt, neu in self.WWAK_TRANSFORM.items():
-            pattern = re.compile(r'\b' + re.escape(alt) + r'\b', re.IGNORECASE)
-            korrigiert = pattern.sub(neu, korrigiert)
-        
-        # 3. Dagesh-Korrekturen
-        dagesh_fehler = {
-            'masach': 'massach',
-            'Masach': 'Massach',
-            'chesed': 'chessed',
-            'Chesed': 'Chessed',
-            'jesod': 'jessod',
-            'Jesod': 'Jessod',
-            'tikun': 'tiqqun',
-            'Tikun': 'Tiqqun',
-        }
-        
-        for alt, neu in dagesh_fehler.items():
-            korrigiert = korrigiert.replace(alt, neu)
-        
+        # Ein Durchlauf über alle Tabellen, längster Treffer gewinnt
+        korrigiert, _ = self._korrektur_engine().rewrite(text)
         return korrigiert
     
     def prüfe_text_korrektheit(self, text: str) -> Dict[str, List[str]]:
@@ -336,6 +335,29 @@ class MeisterFrageTool:
     return patch_code
 
 
+@lru_cache(maxsize=None)
+def _korrektur_engine_fuer(klasse: type) -> RewriteEngine:
+    """
+    Korrektur-Engine einer Klasse: Regeln einmal aufbauen, danach nur nachschlagen
+
+    Die Tabellen gelten als fest; Unterklassen mit eigenen Tabellen
+    bekommen eine eigene Engine.
+    """
+    # 1. Zer-Elimination (auch innerhalb von Wörtern)
+    regeln = [
+        RewriteRule(alt, neu, ignore_case=True, preserve_case=True)
+        for alt, neu in klasse.ZER_ELIMINATION.items()
+    ]
+    # 2. K→Q Transformation (ganze Wörter)
+    regeln += [
+        RewriteRule(alt, neu, word_boundary=True, ignore_case=True, preserve_case=True)
+        for alt, neu in klasse.WWAK_TRANSFORM.items()
+    ]
+    # 3. Dagesh-Korrekturen (exakte Schreibweise)
+    regeln += [RewriteRule(alt, neu) for alt, neu in klasse.DAGESH_KORREKTUREN.items()]
+    return get_engine(regeln)
+
+
 # Standalone-Test
 if __name__ == "__main__":
     print("=== MEISTER Transliteration Test ===")
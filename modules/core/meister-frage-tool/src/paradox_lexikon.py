@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MEISTER FRAGE Tool - Paradox-Lexikon
+====================================
+
+Unveränderliches Paradox-Lexikon mit Schichten:
+
+    • ParadoxLexikon   (Begriff 1, Begriff 2) → ParadoxTyp als Mapping;
+                       eine Basis plus beliebig viele Zusatz-Schichten,
+                       keine davon wird nach dem Aufbau verändert
+    • erweitert()      neues Lexikon mit einer weiteren Schicht, die
+                       Basis wird geteilt, nicht kopiert
+
+Die Basis (Klassiker + Transliterations-Paare) wird einmal pro Prozess
+aufgebaut und indiziert (get_basis_lexikon in meister_frage_tool); jedes
+Tool hängt nur seine eigenen Schichten an. Dadurch ist der Aufbau eines
+Tools O(1) und kein Tool ändert das Lexikon eines anderen (Worker-Pool,
+Web-Server). Der Paar-Scanner wird nach den Paaren geteilt: gleiche
+Schichten in verschiedenen Tools heißt ein kompilierter Scanner.
+
+Reihenfolge und Werte wie bei dict.update: ein Paar aus einer Schicht
+ersetzt den Typ eines vorhandenen Paars an dessen Position, neue Paare
+kommen hinten dazu.
+
+Stand: 5. Cheschwan 5787
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Iterator, List, Optional, Tuple
+
+from paradox_scanner import PairScanner, get_pair_scanner
+
+Paar = Tuple[str, str]
+
+
+class ParadoxLexikon(Mapping):
+    """Paradox-Paare als unveränderliches Mapping aus Basis und Schichten"""
+
+    def __init__(self, basis: Mapping, schichten: Tuple[Mapping, ...] = ()):
+        """
+        Args:
+            basis: Paar → Typ (wird kopiert)
+            schichten: Zusatz-Paare, spätere überschreiben frühere
+        """
+        self._basis = MappingProxyType(dict(basis))
+        self.schichten: Tuple[Mapping, ...] = tuple(
+            MappingProxyType(dict(schicht)) for schicht in schichten)
+        self._paare: Optional[List[Tuple[Paar, Any]]] = None
+        self._scanner: Optional[PairScanner] = None
+
+    @property
+    def basis(self) -> Mapping:
+        return self._basis
+
+    def erweitert(self, paare: Mapping) -> 'ParadoxLexikon':
+        """Neues Lexikon mit einer weiteren Schicht (dieses bleibt unverändert)"""
+        lexikon = ParadoxLexikon.__new__(ParadoxLexikon)
+        lexikon._basis = self._basis
+        lexikon.schichten = self.schichten + (MappingProxyType(dict(paare)),)
+        lexikon._paare = None
+        lexikon._scanner = None
+        return lexikon
+
+    def __getitem__(self, paar: Paar) -> Any:
+        for schicht in reversed(self.schichten):
+            if paar in schicht:
+                return schicht[paar]
+        return self._basis[paar]
+
+    def __contains__(self, paar: object) -> bool:
+        return paar in self._basis or any(paar in schicht for schicht in self.schichten)
+
+    def __iter__(self) -> Iterator[Paar]:
+        return (paar for paar, _ in self.paare())
+
+    def __len__(self) -> int:
+        return len(self.paare())
+
+    def __repr__(self) -> str:
+        return f"ParadoxLexikon({len(self._basis)} Basis-Paare, {len(self.schichten)} Schichten)"
+
+    def paare(self) -> List[Tuple[Paar, Any]]:
+        """(Paar, Typ) in dict.update-Reihenfolge, beim ersten Zugriff gemerkt"""
+        if self._paare is None:
+            if not self.schichten:
+                paare = list(self._basis.items())
+            else:
+                zusammen = dict(self._basis)
+                for schicht in self.schichten:
+                    zusammen.update(schicht)
+                paare = list(zusammen.items())
+            self._paare = paare
+        return self._paare
+
+    def scanner(self) -> PairScanner:
+        """
+        Paar-Scanner für dieses Lexikon
+
+        Prozessweit nach den Paaren geteilt (get_pair_scanner): Tools mit
+        denselben Zusatz-Paaren kompilieren den Präfixbaum nur einmal.
+        """
+        if self._scanner is None:
+            self._scanner = get_pair_scanner(tuple(paar for paar, _ in self.paare()))
+        return self._scanner
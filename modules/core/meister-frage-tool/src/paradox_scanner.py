@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MEISTER FRAGE Tool - Paradox-Scanner
+====================================
+
+Ein Durchlauf für die Paradox-Erkennung statt eines Durchlaufs pro Muster
+und zweier Suchen pro Paradox-Paar:
+
+    • RelationScanner  alle GEGENSATZ_MUSTER in einem kompilierten Scanner:
+                       ein regulärer Ausdruck mit einer benannten Gruppe pro
+                       Schlüsselwort (ist, und, wird, aus, …) findet die
+                       Ankerstellen, das jeweilige Muster wird nur dort per
+                       match() bestätigt
+                       (Schlüsselwörter ebenfalls über trie_pattern)
+    • PairScanner      alle Begriffe der PARADOX_PAARE als Präfixbaum in
+                       einem regulären Ausdruck (rewrite_engine.trie_pattern),
+                       liefert alle Fundstellen jedes Begriffs
+    • naechste_paare   Nähe-Suche über alle Vorkommen beider Begriffe
+                       (Sorted-Merge, O(n+m) pro Paar), damit auch ganze
+                       Kapitel statt Ein-Satz-Ausschnitten taugen
+
+Die Relationstreffer sind dieselben wie mit re.finditer pro Muster:
+pro Muster links nach rechts ohne Überlappung, Muster untereinander
+unabhängig.
+
+Muster, die nicht die Form "(\\w+)\\s+wort\\s+…" oder "wort\\s+(\\w+)…"
+haben, laufen weiter einzeln über re.finditer.
+
+Stand: 5. Cheschwan 5787
+"""
+
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Präfixbäume aus lib/
+_LIB_DIR = str(Path(__file__).resolve().parents[4] / 'lib')
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
+from rewrite_engine import trie_pattern
+
+# "(\w+)\s+ist\s+…" → Anker in der Mitte, "aus\s+(\w+)…" → Anker vorn
+MITTE_FORM = re.compile(r'^\(\\w\+\)\\s\+(\w+)\\s\+')
+VORN_FORM = re.compile(r'^(\w+)\\s\+')
+
+
+def _ist_wortzeichen(char: str) -> bool:
+    """Semantik von \\w"""
+    return char.isalnum() or char == '_'
+
+
+class RelationScanner:
+    """Alle Relationsmuster in einem Durchlauf"""
+
+    def __init__(self, muster: Sequence[str], flags: int = re.IGNORECASE):
+        """
+        Args:
+            muster: reguläre Ausdrücke mit zwei Gruppen (Reihenfolge = Ausgabe)
+            flags: wie bisher bei re.finditer
+        """
+        self.muster = [re.compile(m, flags) for m in muster]
+        # Schlüsselwort → [(Muster-Index, Anker in der Mitte?)]
+        self._anker: Dict[str, List[Tuple[int, bool]]] = {}
+        self._einzeln: List[int] = []
+
+        for index, quelle in enumerate(muster):
+            form = MITTE_FORM.match(quelle)
+            if form:
+                self._anker.setdefault(form.group(1), []).append((index, True))
+                continue
+            form = VORN_FORM.match(quelle)
+            if form:
+                self._anker.setdefault(form.group(1), []).append((index, False))
+            else:
+                self._einzeln.append(index)
+
+        # Eine benannte Gruppe pro Schlüsselwort; davor ein Präfixbaum aller
+        # Schlüsselwörter als Vorprüfung (eine Alternation mit 20 Zweigen
+        # probiert sonst an jeder Textstelle jeden Zweig). Der Leerraum vor
+        # Mitte-Ankern wird in finde() geprüft.
+        self._gruppen: Dict[str, List[Tuple[int, bool]]] = {}
+        alternativen = []
+        for nummer, (wort, ziele) in enumerate(self._anker.items()):
+            name = f"k{nummer}"
+            self._gruppen[name] = ziele
+            alternativen.append(f"(?P<{name}>{re.escape(wort)})(?=\\s)")
+        self._scanner = None
+        if alternativen:
+            vorpruefung = f"(?={trie_pattern(self._anker)}\\s)"
+            self._scanner = re.compile(f"{vorpruefung}(?:{'|'.join(alternativen)})", flags)
+
+    def _anker_treffer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(Position, Gruppenname) aller Ankerstellen, auch überlappende"""
+        if self._scanner is None:
+            return
+        search = self._scanner.search
+        pos = 0
+        while True:
+            treffer = search(text, pos)
+            if treffer is None:
+                return
+            yield treffer.start(), treffer.lastgroup
+            pos = treffer.start() + 1
+
+    def finde(self, text: str) -> List[List[re.Match]]:
+        """
+        Treffer pro Muster (wie list(re.finditer(muster, text)) für jedes Muster)
+        """
+        ergebnis: List[List[re.Match]] = [[] for _ in self.muster]
+        ende = [0] * len(self.muster)
+
+        for start, gruppe in self._anker_treffer(text):
+            for index, mitte in self._gruppen[gruppe]:
+                if mitte:
+                    # Leerraum und dann ein Wort direkt vor dem Anker
+                    wortende = start
+                    while wortende and text[wortende - 1].isspace():
+                        wortende -= 1
+                    if wortende == start:
+                        continue
+                    anfang = wortende
+                    while anfang and _ist_wortzeichen(text[anfang - 1]):
+                        anfang -= 1
+                    # finditer sucht erst hinter dem letzten Treffer weiter
+                    anfang = max(anfang, ende[index])
+                    if anfang >= wortende:
+                        continue
+                else:
+                    anfang = start
+                    if anfang < ende[index]:
+                        continue
+
+                match = self.muster[index].match(text, anfang)
+                if match:
+                    ergebnis[index].append(match)
+                    ende[index] = match.end()
+
+        for index in self._einzeln:
+            ergebnis[index] = list(self.muster[index].finditer(text))
+        return ergebnis
+
+
+def naechste_paare(positionen1: Sequence[int], positionen2: Sequence[int],
+                   fenster: int = 100, max_treffer: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Nächste Partner zweier sortierter Positionslisten (Sorted-Merge, O(n+m))
+
+    Jede Fundstelle wird mit der nächstgelegenen Fundstelle der anderen
+    Liste gepaart; Paare mit Abstand < fenster zählen.
+
+    Returns:
+        (Position 1, Position 2), nach Abstand, bei Gleichstand nach Position
+    """
+    paare = set()
+    for eigene, andere, umgedreht in ((positionen1, positionen2, False),
+                                      (positionen2, positionen1, True)):
+        if not andere:
+            continue
+        j = 0
+        letzte = len(andere) - 1
+        for pos in eigene:
+            # Beide Listen sind sortiert: der Zeiger läuft nur vorwärts
+            while j < letzte and andere[j + 1] <= pos:
+                j += 1
+            partner = andere[j]
+            if j < letzte and andere[j + 1] - pos < abs(pos - partner):
+                partner = andere[j + 1]
+            if abs(pos - partner) < fenster:
+                paare.add((partner, pos) if umgedreht else (pos, partner))
+
+    ergebnis = sorted(paare, key=lambda paar: (abs(paar[0] - paar[1]), min(paar)))
+    return ergebnis if max_treffer is None else ergebnis[:max_treffer]
+
+
+class PairScanner:
+    """Alle Fundstellen aller Paar-Begriffe in einem Durchlauf"""
+
+    def __init__(self, paare: Sequence[Tuple[str, str]]):
+        self.paare = list(paare)
+        begriffe = {begriff for paar in self.paare for begriff in paar}
+        self._leer = '' in begriffe
+        begriffe.discard('')
+
+        # Präfixbaum für die Auflösung: alle Begriffe, die an einer Stelle beginnen
+        self._baum: Dict = {}
+        for begriff in begriffe:
+            knoten = self._baum
+            for char in begriff:
+                knoten = knoten.setdefault(char, {})
+            knoten[None] = begriff
+        self._regex = re.compile(trie_pattern(sorted(begriffe))) if begriffe else None
+
+    def fundstellen(self, text: str) -> Dict[str, List[int]]:
+        """Begriff → alle Positionen (aufsteigend, auch überlappend), nur gefundene"""
+        positionen: Dict[str, List[int]] = {}
+        if self._leer:
+            # Wie text.find(''): jede Stelle
+            positionen[''] = list(range(len(text) + 1))
+        if self._regex is None:
+            return positionen
+        search = self._regex.search
+        pos = 0
+        while True:
+            treffer = search(text, pos)
+            if treffer is None:
+                break
+            start = treffer.start()
+            knoten = self._baum
+            for char in text[start:treffer.end()]:
+                knoten = knoten[char]
+                begriff = knoten.get(None)
+                if begriff is not None:
+                    positionen.setdefault(begriff, []).append(start)
+            pos = start + 1
+        return positionen
+
+    def finde(self, text: str, fenster: int = 100,
+              max_treffer: Optional[int] = 1) -> List[Tuple[int, List[Tuple[int, int]]]]:
+        """
+        Paare mit Fundstellen näher als fenster (alle Vorkommen, nicht nur die ersten)
+
+        Args:
+            fenster: maximaler Abstand der Anfangspositionen (exklusiv)
+            max_treffer: Treffer pro Paar (None = alle)
+
+        Returns:
+            (Paar-Index, [(Position 1, Position 2), …] nächste zuerst)
+            in Reihenfolge der Paare
+        """
+        positionen = self.fundstellen(text)
+        ergebnis = []
+        for index, (el1, el2) in enumerate(self.paare):
+            positionen1 = positionen.get(el1)
+            positionen2 = positionen.get(el2)
+            if not positionen1 or not positionen2:
+                continue
+            treffer = naechste_paare(positionen1, positionen2, fenster, max_treffer)
+            if treffer:
+                ergebnis.append((index, treffer))
+        return ergebnis
+
+
+@lru_cache(maxsize=16)
+def get_relation_scanner(muster: Tuple[str, ...]) -> RelationScanner:
+    """Kompilierter Scanner pro Muster-Tabelle (geänderte Tabellen → neuer Scanner)"""
+    return RelationScanner(muster)
+
+
+@lru_cache(maxsize=16)
+def get_pair_scanner(paare: Tuple[Tuple[str, str], ...]) -> PairScanner:
+    """Kompilierter Scanner pro Paar-Tabelle, von allen Lexika mit denselben Paaren geteilt"""
+    return PairScanner(paare)
@@ -45,6 +45,27 @@ if os.path.exists('src/meister_frage_tool.py'):
         print("   ✓ Import und Basis-Test erfolgreich")
     except Exception as e:
         print(f"   ✗ Fehler beim Import: {e}")
+    else:
+        # Test 5: Eigene Fragen einer Unterklasse werden nach ihrem Text bewertet
+        from meister_frage_tool import FrageTyp, MeisterFrage
+
+        class EigeneFragen(MeisterFrageTool):
+            def _generiere_fragen(self, paradox):
+                fragen = super()._generiere_fragen(paradox)
+                fragen.append(MeisterFrage(
+                    frage=f"Welches Licht verbirgt sich in {paradox.element1}?",
+                    typ=FrageTyp.WIE, paradox=paradox))
+                return fragen
+
+        eigen = EigeneFragen()
+        text = "Das Ego wird zu Selbstlosigkeit."
+        for ergebnis in (eigen.verarbeite_text(text), eigen.verarbeite_text(text, top_k=3)):
+            beste = ergebnis['beste_frage']
+            if (beste.frage == "Welches Licht verbirgt sich in ego?"
+                    and round(beste.gesamt_score, 4) == 0.8667):
+                print("5. ✓ Eigene Frage bewertet und vorn:", beste.frage)
+            else:
+                print(f"5. ✗ Eigene Frage falsch bewertet: {beste.frage} {beste.scores}")
 else:
     print("4. ✗ Hauptmodul fehlt!")
     print("   Bitte kopieren Sie meister_frage_tool.py nach src/")
@@ -16,8 +16,24 @@ def test_imports():
     
     modules_to_test = [
         'hns10_spiral_system',
-        'manuscript_processor', 
-        'yaml_ez_chajim_formatter'
+        'manuscript_processor',
+        'yaml_ez_chajim_formatter',
+        'corpus_pack',
+        'corpus_analysis',
+        'analysis_cache',
+        'rewrite_engine',
+        'gematria_engine',
+        'gematria_index',
+        'gematria_spans',
+        'trigram_index',
+        'translation_store',
+        'batch_packer',
+        'batch_writer',
+        'chunk_records',
+        'hns10_calendar',
+        'hns10_numerals',
+        'work_scheduler',
+        'benchmark_suite'
     ]
     
     for module in modules_to_test: